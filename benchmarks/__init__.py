@@ -0,0 +1,7 @@
+"""Benchmarks de desempenho do índice e das estratégias de busca.
+
+Execute a partir da raiz do repositório, por exemplo:
+`python -m benchmarks.fuzzy_backend`. O conjunto principal, com resultados
+em JSON para comparação entre versões, é executado por
+`python -m benchmarks.suite -o resultados.json`.
+"""
@@ -0,0 +1,65 @@
+"""Compara buscas por siglas de conferências com e sem a estratégia de siglas.
+
+Uso: python -m benchmarks.acronym_search [-q QUANTIDADE] [--backend sql|memory]
+
+As buscas são siglas sorteadas da fonte de conferências, acompanhadas de
+ano ou edição (como "SBES 2023", "ICSE'23" ou "15th SBES"). Para cada
+conjunto de estratégias são medidos o tempo médio por busca e a fração de
+buscas cujo primeiro resultado é a conferência sorteada.
+"""
+from argparse import ArgumentParser
+import random
+import time
+
+from qual_qualis.data.model import DataSource
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.model import VenueType
+from qual_qualis.index.search import SearchBackend, SearchStrategy, SearchStrategyKey
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--queries", type=int, default=200)
+    parser.add_argument("--backend", type=SearchBackend, default=SearchBackend.MEMORY)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = DataService()
+    index = Index(service)
+    df = service.get(DataSource.CONFERENCES)
+    rng = random.Random(args.seed)
+    rows = df.sample(n=args.queries, random_state=args.seed)
+    templates = ["{} {}", "{}'{}", "{}{}", "{}th {}"]
+    queries = []
+    for acronym, name in zip(rows["acronym"], rows["name"]):
+        year = rng.randint(2000, 2024)
+        template = rng.choice(templates)
+        query = (
+            template.format(rng.randint(1, 40), acronym)
+            if template.startswith("{}th")
+            else template.format(acronym, year % 100 if "'" in template else year)
+        )
+        queries.append((query, index.hash("-".join(index.tokenize(name)))))
+    keys = {
+        "sem siglas": [SearchStrategyKey.ISSN, SearchStrategyKey.EXACT, SearchStrategyKey.FUZZY],
+        "com siglas": SearchStrategyKey.defaults(),
+    }
+    for label, strategy_keys in keys.items():
+        strategies = [SearchStrategy.create(k, index, args.backend) for k in strategy_keys]
+        hits = 0
+        start = time.perf_counter()
+        for query, expected in queries:
+            venues = SearchStrategy.apply_many(
+                strategies, name=query, venue_type=VenueType.CONFERENCES, n_results=5
+            )
+            hits += bool(venues) and venues[0].hash == expected
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label}: {elapsed / len(queries) * 1e3:7.3f} ms/busca, "
+            f"primeiro resultado correto em {hits}/{len(queries)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Mede o tempo de inicialização e a memória das buscas conforme a
+quantidade de áreas de avaliação consultadas, com índices fragmentados
+por área.
+
+Uso: python -m benchmarks.area_shards [-n ÁREAS] [-k CONSULTADAS ...] [--backend sql|memory]
+
+Uma planilha sintética, no formato da Plataforma Sucupira, replica os
+periódicos embutidos em `n` áreas de avaliação, com estratos sorteados, e é
+importada por `DataService.import_journals` em um diretório temporário.
+Os índices de todas as áreas são construídos uma vez e, para cada
+quantidade `k` de áreas consultadas, um processo novo abre os índices
+de `k` áreas por `IndexShards` e realiza uma busca em cada uma. São medidos
+o tempo até a primeira busca, o aumento da memória residente do processo
+e a quantidade de índices abertos, que deve ser `k`.
+"""
+from argparse import ArgumentParser
+import multiprocessing as mp
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from qual_qualis.data.model import DataSource
+from qual_qualis.data.service import DataService
+from qual_qualis.index.search import SearchBackend, SearchStrategyKey
+from qual_qualis.index.shards import AreaSearch, IndexShards
+from qual_qualis.profiling import Profiler
+
+
+def write_sheet(fp: str, n_areas: int, seed: int):
+    """Grava uma planilha com os periódicos embutidos em `n_areas` áreas."""
+    journals = DataService().get(DataSource.JOURNALS)
+    rng = random.Random(seed)
+    strata = ["A1", "A2", "A3", "A4", "B1", "B2", "B3", "B4", "C"]
+    frames = [
+        pd.DataFrame({
+            "ISSN": journals["issn"],
+            "Título": journals["name"],
+            "Área de Avaliação": f"Área {i:02d}",
+            "Estrato": [rng.choice(strata) for _ in range(len(journals))],
+        })
+        for i in range(n_areas)
+    ]
+    pd.concat(frames).to_csv(fp, sep=";", index=False)
+
+
+def resident_memory() -> int:
+    """Retorna a memória residente atual do processo, em bytes, ou o pico
+    de memória fora do Linux."""
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return Profiler.peak_memory() or 0
+
+
+def open_areas(index_dir: str, data_dir: str, areas: list[str], backend: SearchBackend, out):
+    baseline = resident_memory()
+    start = time.perf_counter()
+    shards = IndexShards(index_dir, data_dir, backend)
+    results = AreaSearch(shards, areas, SearchStrategyKey.defaults()).search(
+        name="journal of software engineering", n_results=5
+    )
+    elapsed = time.perf_counter() - start
+    answered = len({v.area for v in results})
+    out.put((elapsed, resident_memory() - baseline, len(shards.loaded()), answered))
+
+
+def measure(index_dir: str, data_dir: str, areas: list[str], backend: SearchBackend):
+    ctx = mp.get_context("spawn")
+    out = ctx.Queue()
+    process = ctx.Process(target=open_areas, args=(index_dir, data_dir, areas, backend, out))
+    process.start()
+    result = out.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--areas", type=int, default=20)
+    parser.add_argument("-k", "--queried", type=int, nargs="+", default=[1, 4, 20])
+    parser.add_argument("--backend", type=SearchBackend, default=SearchBackend.MEMORY)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    ok = True
+    with tempfile.TemporaryDirectory() as directory:
+        data_dir = os.path.join(directory, "data")
+        index_dir = os.path.join(directory, "index")
+        sheet = os.path.join(directory, "sucupira.csv")
+        write_sheet(sheet, args.areas, args.seed)
+        counts = DataService.import_journals(sheet, data_dir)
+        areas = sorted(counts)
+        print(
+            f"{sum(counts.values())} periódicos em {len(areas)} áreas, "
+            f"mecanismo {args.backend.value}"
+        )
+        start = time.perf_counter()
+        IndexShards(index_dir, data_dir, args.backend).strategies(areas[0], [])
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        shards = IndexShards(index_dir, data_dir, args.backend)
+        for area in areas[1:]:
+            shards.index(area)
+        print(
+            f"construção: {first * 1e3:.0f} ms para uma área, "
+            f"{(time.perf_counter() - start) * 1e3:.0f} ms para as demais"
+        )
+        for k in args.queried:
+            k = min(k, len(areas))
+            elapsed, memory, loaded, answered = measure(
+                index_dir, data_dir, areas[:k], args.backend
+            )
+            ok &= loaded == k and answered == k
+            print(
+                f"{k:3d} áreas: primeira busca após {elapsed * 1e3:6.0f} ms, "
+                f"memória +{memory / 2**20:6.1f} MiB, {loaded} índices abertos"
+            )
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
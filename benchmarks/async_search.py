@@ -0,0 +1,158 @@
+"""Mede a responsividade do laço de eventos e a vazão das buscas pela
+interface assíncrona do índice (`AsyncIndex`).
+
+Uso: python -m benchmarks.async_search [-q QUANTIDADE] [-w THREADS ...] [--backend sql|memory]
+
+O índice é construído em um diretório temporário pela inicialização em
+segundo plano, comparada à construção síncrona, que bloqueia o laço de
+eventos durante toda a sua duração. Em seguida, para cada quantidade de
+threads, as buscas (nomes sorteados das fontes embutidas, com erros de
+digitação em uma fração deles) são submetidas todas de uma vez por
+`asearch` e em lote por `asearch_many`. É medido o maior atraso de uma
+tarefa que acorda a cada milissegundo, além da vazão e da latência das
+buscas. Por fim, uma busca em lote é cancelada e é medido o tempo até que
+uma nova busca seja atendida. O processo termina com erro se algum
+resultado diferir do obtido por `SearchStrategy.apply_many`.
+"""
+from argparse import ArgumentParser
+import asyncio
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.common import add_typos, sample_venues
+from qual_qualis.data.service import DataService
+from qual_qualis.index.aio import AsyncIndex
+from qual_qualis.index.index import Index
+from qual_qualis.index.search import SearchBackend, SearchStrategy, SearchStrategyKey
+
+
+class LagMonitor:
+    """Tarefa que acorda a cada milissegundo e registra o maior atraso."""
+
+    def __init__(self):
+        self.max_lag = 0.0
+        self.__task: asyncio.Task | None = None
+
+    async def __aenter__(self):
+        self.__task = asyncio.ensure_future(self.__run())
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *_):
+        self.__task.cancel()
+
+    async def __run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            self.max_lag = max(self.max_lag, time.perf_counter() - start - 0.001)
+
+
+async def timed(coro) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = await coro
+    return time.perf_counter() - start, result
+
+
+async def bench_warm_up(backend: SearchBackend):
+    with tempfile.TemporaryDirectory() as directory:
+        async with LagMonitor() as monitor:
+            start = time.perf_counter()
+            index = AsyncIndex(backend=backend, directory=directory)
+            index.start()
+            await index.wait_ready()
+            elapsed = time.perf_counter() - start
+        await index.aclose()
+        print(
+            f"inicialização em segundo plano {elapsed * 1e3:7.0f} ms, "
+            f"maior atraso do laço {monitor.max_lag * 1e3:6.1f} ms"
+        )
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        index = Index(DataService(), directory)
+        for key in SearchStrategyKey.defaults():
+            SearchStrategy.create(key, index, backend)
+        elapsed = time.perf_counter() - start
+        print(
+            f"inicialização síncrona        {elapsed * 1e3:7.0f} ms, "
+            "laço bloqueado durante toda ela"
+        )
+
+
+async def bench_search(
+    workers: int, backend: SearchBackend, queries: list[dict], expected: list[list]
+) -> bool:
+    async with AsyncIndex(backend=backend, max_workers=workers) as index:
+        async with LagMonitor() as monitor:
+            timings = await asyncio.gather(*(timed(index.asearch(**q)) for q in queries))
+        latencies = np.array([t for t, _ in timings])
+        elapsed_many, batch = await timed(index.asearch_many(queries))
+        single = [r for _, r in timings]
+        total = latencies.max()
+        same = single == expected and batch == expected
+        print(
+            f"{workers:2d} threads: asearch {len(queries) / total:6.0f} buscas/s "
+            f"(p50 {np.percentile(latencies, 50) * 1e3:6.0f} ms, "
+            f"p99 {np.percentile(latencies, 99) * 1e3:6.0f} ms), maior atraso do laço "
+            f"{monitor.max_lag * 1e3:5.1f} ms; asearch_many "
+            f"{len(queries) / elapsed_many:6.0f} buscas/s"
+            f"{'' if same else '  RESULTADOS DIFERENTES'}"
+        )
+
+        task = asyncio.ensure_future(index.asearch_many(queries * 10))
+        await asyncio.sleep(0.1)
+        start = time.perf_counter()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        cancelled = time.perf_counter() - start
+        await index.asearch(**queries[0])
+        served = time.perf_counter() - start
+        print(
+            f"{'':12s}cancelamento {cancelled * 1e3:6.1f} ms, nova busca atendida após "
+            f"{served * 1e3:6.0f} ms"
+        )
+    return same
+
+
+async def run(args):
+    service = DataService()
+    rng = random.Random(args.seed)
+    names = sample_venues(service, args.queries, args.seed)["name"]
+    queries = [
+        dict(name=add_typos(n, 1, rng) if rng.random() < args.typo_fraction else n, n_results=5)
+        for n in names
+    ]
+    print(f"{len(queries)} buscas, mecanismo {args.backend.value}")
+    await bench_warm_up(args.backend)
+    index = Index(service)
+    strategies = [
+        SearchStrategy.create(k, index, args.backend) for k in SearchStrategyKey.defaults()
+    ]
+    expected = [SearchStrategy.apply_many(strategies, **q) for q in queries]
+    ok = True
+    for workers in args.workers:
+        ok &= await bench_search(workers, args.backend, queries, expected)
+    return ok
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--queries", type=int, default=500)
+    parser.add_argument("-w", "--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("-f", "--typo-fraction", type=float, default=0.3)
+    parser.add_argument("--backend", type=SearchBackend, default=SearchBackend.SQL)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if not asyncio.run(run(args)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Compara buscas individuais com buscas em lote (`search_many`) sobre uma
+bibliografia sintética.
+
+Uso: python -m benchmarks.batch_search [-n ENTRADAS] [--backend sql|memory] [--seed SEMENTE]
+
+Um arquivo BibTeX com `n` entradas é gerado a partir das fontes de dados
+embutidas. Para cada estratégia, e para todas aplicadas em sequência, são
+medidos o tempo das buscas uma a uma (`search` e `apply_many`) e em lote
+(`search_many` e `apply_batch`), além do tempo total da anotação do arquivo
+por `BibHandler`. O processo termina com erro se algum resultado diferir
+entre os dois modos.
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+import bibtexparser as bib
+
+from benchmarks.bib_stream import write_library
+from qual_qualis.cli.file_handler.file_handler import FileHandler
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.search import SearchBackend, SearchStrategy, SearchStrategyKey
+
+
+def read_queries(fp: Path) -> list[dict]:
+    """Lê os parâmetros de busca de cada entrada de um arquivo BibTeX."""
+    queries = []
+    for entry in bib.parse_file(str(fp)).entries:
+        fields = entry.fields_dict
+        name = fields.get("journal", fields.get("booktitle"))
+        issn = fields.get("issn")
+        queries.append(
+            dict(
+                name=name.value if name is not None else None,
+                issn=issn.value if issn is not None else None,
+                n_results=5,
+            )
+        )
+    return queries
+
+
+def compare(label: str, single, batch, n: int) -> bool:
+    start = time.perf_counter()
+    expected = single()
+    one_by_one = time.perf_counter() - start
+    start = time.perf_counter()
+    found = batch()
+    batched = time.perf_counter() - start
+    same = expected == found
+    print(
+        f"{label:12s} uma a uma {n / one_by_one:9.0f} buscas/s, "
+        f"em lote {n / batched:9.0f} buscas/s ({one_by_one / batched:5.1f}x)"
+        f"{'' if same else '  RESULTADOS DIFERENTES'}"
+    )
+    return same
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--entries", type=int, default=10000)
+    parser.add_argument("--backend", type=SearchBackend, default=SearchBackend.MEMORY)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    index = Index(DataService())
+    keys = list(SearchStrategyKey)
+    strategies = [SearchStrategy.create(k, index, args.backend) for k in keys]
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        input_fp = Path(tmp, "input.bib")
+        write_library(input_fp, args.entries, args.seed)
+        queries = read_queries(input_fp)
+        n = len(queries)
+        print(f"{n} entradas, mecanismo {args.backend.value}")
+        for key, st in zip(keys, strategies):
+            ok &= compare(
+                key.value,
+                lambda st=st: [st.search(**q) for q in queries],
+                lambda st=st: st.search_many(queries),
+                n,
+            )
+        ok &= compare(
+            "todas",
+            lambda: [SearchStrategy.apply_many(strategies, **q) for q in queries],
+            lambda: SearchStrategy.apply_batch(strategies, queries),
+            n,
+        )
+        start = time.perf_counter()
+        handler = FileHandler.create(input_fp)
+        handler.search(strategies)
+        handler.write(Path(tmp, "output.bib"))
+        elapsed = time.perf_counter() - start
+        print(f"anotação do arquivo: {elapsed:.2f} s ({n / elapsed:.0f} entradas/s)")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
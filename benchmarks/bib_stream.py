@@ -0,0 +1,104 @@
+"""Compara o pico de memória da anotação de arquivos BibTeX com e sem `--stream`.
+
+Uso: python -m benchmarks.bib_stream [-n ENTRADAS] [-b LOTE] [--seed SEMENTE]
+
+Um arquivo sintético com `n` entradas é gerado a partir das fontes de dados
+embutidas e anotado em um subprocesso para cada modo, de forma que o pico de
+memória residente (`ru_maxrss`) de cada modo seja medido isoladamente. As
+buscas usam o mecanismo em memória, cujo custo fixo é igual nos dois modos.
+"""
+from argparse import ArgumentParser
+import os
+from pathlib import Path
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from qual_qualis.data.service import DataService
+
+
+def write_library(fp: Path, n: int, seed: int):
+    from benchmarks.common import sample_venues
+
+    venues = sample_venues(DataService(), n, seed)
+    with open(fp, "w", encoding="utf-8") as f:
+        for i, v in enumerate(venues.itertuples()):
+            field = "journal" if v.source == "journals" else "booktitle"
+            issn = f"\tissn = {{{v.issn}}},\n" if isinstance(v.issn, str) else ""
+            f.write(
+                f"@article{{key{i},\n\ttitle = {{Title {i}}},\n"
+                f"\t{field} = {{{v.name}}},\n{issn}}}\n\n"
+            )
+
+
+def run(mode: str, input_fp: Path, output_fp: Path, batch_size: int):
+    from qual_qualis.cli import prepare_strategies
+    from qual_qualis.cli.file_handler.file_handler import FileHandler
+    from qual_qualis.index.search import SearchBackend, SearchStrategyKey
+
+    strategies = prepare_strategies(SearchStrategyKey.defaults(), backend=SearchBackend.MEMORY)
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "stream":
+        count = FileHandler.handler_class(input_fp).stream(
+            input_fp, output_fp, strategies, batch_size=batch_size
+        )
+    else:
+        handler = FileHandler.create(input_fp)
+        count = len(handler.search(strategies))
+        handler.write(output_fp)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{count} {elapsed} {before} {peak}")
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--entries", type=int, default=10000)
+    parser.add_argument("-b", "--batch-size", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--run", choices=["stream", "full"])
+    parser.add_argument("--input", type=Path)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    if args.run is not None:
+        run(args.run, args.input, args.output, args.batch_size)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_fp = Path(tmp, "input.bib")
+        write_library(input_fp, args.entries, args.seed)
+        size = os.path.getsize(input_fp) / 2**20
+        print(f"arquivo de entrada: {args.entries} entradas, {size:.1f} MiB")
+        outputs = {}
+        for mode in ["full", "stream"]:
+            output_fp = Path(tmp, f"{mode}.bib")
+            out = subprocess.run(
+                [
+                    sys.executable, "-m", "benchmarks.bib_stream",
+                    "--run", mode,
+                    "--input", str(input_fp),
+                    "--output", str(output_fp),
+                    "--batch-size", str(args.batch_size),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.split()
+            count, elapsed, before, peak = int(out[0]), float(out[1]), *map(int, out[2:])
+            print(
+                f"{mode:6s}: pico {peak / 1024:.1f} MiB "
+                f"(+{(peak - before) / 1024:.1f} MiB durante a anotação), "
+                f"{count / elapsed:.0f} entradas/s"
+            )
+            outputs[mode] = output_fp.read_bytes()
+        if outputs["full"] != outputs["stream"]:
+            print("as saídas dos dois modos diferem", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
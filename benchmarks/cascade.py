@@ -0,0 +1,86 @@
+"""Compara a aplicação das estratégias de busca padrão com a aplicação em
+cascata, que para na primeira correspondência confiável.
+
+Uso: python -m benchmarks.cascade [-q QUANTIDADE] [-t ERROS] [-f FRAÇÃO] [-m MARGEM]
+
+As buscas são nomes de vias de publicação sorteados das fontes embutidas,
+dos quais uma fração `f` recebe `t` erros de digitação, e o ISSN quando
+houver. Para cada modo são medidos o tempo médio por busca e a fração de
+buscas que chegam à busca aproximada. O processo termina com erro se o
+primeiro resultado diferir entre os dois modos.
+"""
+from argparse import ArgumentParser
+import random
+import sys
+import time
+
+from benchmarks.common import add_typos, sample_venues
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.model import VenueType
+from qual_qualis.index.search import (
+    CascadeSearch,
+    SearchBackend,
+    SearchStrategy,
+    SearchStrategyKey,
+)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--queries", type=int, default=1000)
+    parser.add_argument("-t", "--typos", type=int, default=1)
+    parser.add_argument("-f", "--fraction", type=float, default=0.3)
+    parser.add_argument("-m", "--margin", type=float, default=0.2)
+    parser.add_argument("--backend", type=SearchBackend, default=SearchBackend.MEMORY)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = DataService()
+    index = Index(service)
+    strategies = [SearchStrategy.create(k, index, args.backend) for k in SearchStrategyKey.defaults()]
+    fuzzy = strategies[SearchStrategyKey.defaults().index(SearchStrategyKey.FUZZY)]
+    fuzzy_search = fuzzy.search
+    fuzzy_calls = 0
+
+    def counted_search(**kwargs):
+        nonlocal fuzzy_calls
+        fuzzy_calls += 1
+        return fuzzy_search(**kwargs)
+
+    fuzzy.search = counted_search
+    rng = random.Random(args.seed)
+    venues = sample_venues(service, args.queries, args.seed)
+    queries = [
+        dict(
+            name=add_typos(name, args.typos, rng) if rng.random() < args.fraction else name,
+            issn=issn if isinstance(issn, str) else None,
+            venue_type=VenueType[source.upper()],
+            n_results=5,
+        )
+        for name, issn, source in zip(venues["name"], venues["issn"], venues["source"])
+    ]
+    modes = {
+        "todas": strategies,
+        "cascata": [CascadeSearch(strategies, args.margin)],
+    }
+    results = {}
+    for label, mode in modes.items():
+        fuzzy_calls = 0
+        start = time.perf_counter()
+        results[label] = [SearchStrategy.apply_many(mode, **q) for q in queries]
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:8s} {elapsed / len(queries) * 1e3:7.3f} ms/busca, "
+            f"busca aproximada em {fuzzy_calls / len(queries):.1%} das buscas"
+        )
+    same = sum(
+        a[:1] == b[:1] for a, b in zip(results["todas"], results["cascata"])
+    )
+    print(f"primeiro resultado idêntico: {same}/{len(queries)}")
+    if same != len(queries):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
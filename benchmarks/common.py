@@ -0,0 +1,54 @@
+"""Utilitários compartilhados pelos benchmarks."""
+import random
+import string
+
+import pandas as pd
+
+from qual_qualis.data.service import DataService
+
+
+def sample_venues(service: DataService, k: int, seed: int = 0) -> pd.DataFrame:
+    """Sorteia vias de publicação das fontes de dados embutidas.
+
+    Parâmetros
+    ----------
+    service : DataService
+        Serviço de acesso às fontes de dados.
+    k : int
+        Quantidade de vias de publicação. Se maior que o total disponível,
+        as vias são sorteadas com repetição.
+    seed : int, opcional
+        Semente do gerador de números aleatórios.
+
+    Retorna
+    -------
+    pandas.DataFrame
+        DataFrame com as colunas `name`, `issn` e `source`.
+    """
+    df = pd.concat(
+        [service.get(src).assign(source=src.value) for src in service.sources()],
+        ignore_index=True,
+    )
+    if "issn" not in df.columns:
+        df = df.assign(issn=None)
+    return df.sample(n=k, replace=k > len(df), random_state=seed)[
+        ["name", "issn", "source"]
+    ].reset_index(drop=True)
+
+
+def add_typos(text: str, n: int, rng: random.Random) -> str:
+    """Insere `n` erros de digitação (inserção, remoção ou substituição
+    de um caractere) em posições aleatórias de um texto."""
+    chars = list(text)
+    for _ in range(n):
+        if not chars:
+            break
+        i = rng.randrange(len(chars))
+        match rng.choice("ids"):
+            case "i":
+                chars.insert(i, rng.choice(string.ascii_lowercase))
+            case "d":
+                del chars[i]
+            case "s":
+                chars[i] = rng.choice(string.ascii_lowercase)
+    return "".join(chars)
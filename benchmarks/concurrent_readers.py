@@ -0,0 +1,89 @@
+"""Mede a vazão de consultas de vários processos simultâneos enquanto o
+índice é reconstruído repetidamente.
+
+Uso: python -m benchmarks.concurrent_readers [-p PROCESSOS ...] [-t SEGUNDOS]
+
+O índice é construído em um diretório temporário. Para cada quantidade de
+processos leitores, um processo escritor o reconstrói continuamente, como
+após uma atualização das fontes de dados, enquanto os leitores reabrem o
+índice a cada rodada de consultas exatas e por ISSN. O processo termina com
+erro se alguma consulta falhar.
+"""
+from argparse import ArgumentParser
+import multiprocessing as mp
+import sys
+import tempfile
+import time
+
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.lock import FileLock
+from qual_qualis.index.search import SearchBackend, SearchStrategy, SearchStrategyKey
+
+
+def read(directory: str, names: list[str], issns: list[str], seconds: float, out):
+    queries, errors = 0, 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        try:
+            index = Index(DataService(), directory)
+            exact = SearchStrategy.create(SearchStrategyKey.EXACT, index, SearchBackend.SQL)
+            issn = SearchStrategy.create(SearchStrategyKey.ISSN, index, SearchBackend.SQL)
+            for name, code in zip(names, issns):
+                exact.search(name=name)
+                issn.search(issn=code)
+                queries += 2
+        except Exception:  # pylint: disable=broad-except
+            errors += 1
+    out.put((queries, errors))
+
+
+def write(directory: str, stop):
+    index = Index(DataService(), directory)
+    while not stop.is_set():
+        with FileLock(index.artifact_path("index.lock")):
+            index._store_index()  # pylint: disable=protected-access
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-p", "--processes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("-t", "--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    from benchmarks.common import sample_venues  # pylint: disable=import-outside-toplevel
+
+    venues = sample_venues(DataService(), 100)
+    names = venues["name"].tolist()
+    issns = [i if isinstance(i, str) else "" for i in venues["issn"]]
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        Index(DataService(), directory)
+        for n in args.processes:
+            out, stop = mp.Queue(), mp.Event()
+            writer = mp.Process(target=write, args=(directory, stop))
+            readers = [
+                mp.Process(target=read, args=(directory, names, issns, args.seconds, out))
+                for _ in range(n)
+            ]
+            writer.start()
+            for p in readers:
+                p.start()
+            results = [out.get() for _ in readers]
+            for p in readers:
+                p.join()
+            stop.set()
+            writer.join()
+            queries = sum(q for q, _ in results)
+            errors = sum(e for _, e in results)
+            failed |= errors > 0
+            print(
+                f"{n} leitores: {queries / args.seconds:.0f} consultas/s, "
+                f"{errors} rodadas com erro"
+            )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
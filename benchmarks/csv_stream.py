@@ -0,0 +1,112 @@
+"""Compara a anotação de arquivos CSV com e sem `--stream`.
+
+Uso: python -m benchmarks.csv_stream [-n LINHAS] [-b LOTE] [--seed SEMENTE]
+
+Um arquivo sintético com `n` linhas é gerado a partir das fontes de dados
+embutidas, com vias de publicação repetidas, e anotado em um subprocesso
+para cada modo. São medidos o pico de memória residente (`ru_maxrss`), o
+tempo até os primeiros resultados chegarem ao arquivo de saída e a vazão.
+"""
+from argparse import ArgumentParser
+import os
+from pathlib import Path
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from qual_qualis.data.service import DataService
+
+
+def write_table(fp: Path, n: int, seed: int):
+    from benchmarks.common import sample_venues
+
+    venues = sample_venues(DataService(), min(n, 5000), seed)
+    rows = venues.sample(n=n, replace=True, random_state=seed).reset_index(drop=True)
+    rows.insert(0, "key", [f"key{i}" for i in range(n)])
+    rows[["key", "name", "issn"]].to_csv(fp, index=False)
+
+
+def run(mode: str, input_fp: Path, output_fp: Path, batch_size: int):
+    from qual_qualis.cli import prepare_strategies
+    from qual_qualis.cli.file_handler.file_handler import FileHandler
+    from qual_qualis.index.cache import QueryCache
+    from qual_qualis.index.search import SearchBackend, SearchStrategyKey
+
+    strategies = prepare_strategies(SearchStrategyKey.defaults(), backend=SearchBackend.MEMORY)
+    cache = QueryCache(strategies[0].index)
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "stream":
+        count = FileHandler.handler_class(input_fp).stream(
+            input_fp, output_fp, strategies, cache=cache, batch_size=batch_size
+        )
+    else:
+        handler = FileHandler.create(input_fp)
+        count = len(handler.search(strategies, cache=cache))
+        handler.write(output_fp)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{count} {elapsed} {before} {peak}")
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--rows", type=int, default=200000)
+    parser.add_argument("-b", "--batch-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--run", choices=["stream", "full"])
+    parser.add_argument("--input", type=Path)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    if args.run is not None:
+        run(args.run, args.input, args.output, args.batch_size)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_fp = Path(tmp, "input.csv")
+        write_table(input_fp, args.rows, args.seed)
+        size = os.path.getsize(input_fp) / 2**20
+        print(f"arquivo de entrada: {args.rows} linhas, {size:.1f} MiB")
+        outputs = {}
+        for mode in ["full", "stream"]:
+            output_fp = Path(tmp, f"{mode}.csv")
+            start = time.perf_counter()
+            proc = subprocess.Popen(
+                [
+                    sys.executable, "-m", "benchmarks.csv_stream",
+                    "--run", mode,
+                    "--input", str(input_fp),
+                    "--output", str(output_fp),
+                    "--batch-size", str(args.batch_size),
+                ],
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            first = None
+            while proc.poll() is None:
+                if first is None and output_fp.exists() and output_fp.stat().st_size > 0:
+                    first = time.perf_counter() - start
+                time.sleep(0.01)
+            if proc.returncode != 0:
+                sys.exit(proc.returncode)
+            if first is None:
+                first = time.perf_counter() - start
+            out = proc.stdout.read().split()
+            count, elapsed, before, peak = int(out[0]), float(out[1]), *map(int, out[2:])
+            print(
+                f"{mode:6s}: pico {peak / 1024:.1f} MiB "
+                f"(+{(peak - before) / 1024:.1f} MiB durante a anotação), "
+                f"primeiros resultados em {first:.2f} s, "
+                f"{count / elapsed:.0f} linhas/s"
+            )
+            outputs[mode] = output_fp.read_bytes()
+        if outputs["full"] != outputs["stream"]:
+            print("as saídas dos dois modos diferem", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compara os mecanismos de pontuação da busca aproximada.
+
+Uso: python -m benchmarks.fuzzy_backend [-q QUANTIDADE] [-n RESULTADOS]
+"""
+from argparse import ArgumentParser
+import time
+
+from benchmarks.common import sample_venues
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.search import SearchBackend, FuzzySearch
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--queries", type=int, default=100)
+    parser.add_argument("-n", "--n-results", type=int, default=5)
+    args = parser.parse_args()
+
+    service = DataService()
+    index = Index(service)
+    queries = sample_venues(service, args.queries)["name"].tolist()
+    results = {}
+    for backend in SearchBackend:
+        start = time.perf_counter()
+        strategy = FuzzySearch(index, backend)
+        setup = time.perf_counter() - start
+        start = time.perf_counter()
+        results[backend] = [
+            [v.hash for v in strategy.search(q, n_results=args.n_results)]
+            for q in queries
+        ]
+        elapsed = time.perf_counter() - start
+        print(
+            f"{backend.value:6s}  inicialização {setup * 1e3:8.1f} ms  "
+            f"busca {elapsed / len(queries) * 1e3:7.3f} ms/consulta"
+        )
+    same = sum(a == b for a, b in zip(*results.values()))
+    print(f"rankings idênticos: {same}/{len(queries)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Mede o custo e a revocação da busca aproximada conforme a distância
+de edição máxima permitida entre tokens.
+
+Uso: python -m benchmarks.fuzzy_distance [-q QUANTIDADE] [-t ERROS] [-d DISTÂNCIA]
+"""
+from argparse import ArgumentParser
+import os
+import random
+import time
+
+from benchmarks.common import add_typos, sample_venues
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.search import SearchBackend, FuzzySearch
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--queries", type=int, default=500)
+    parser.add_argument("-t", "--typos", type=int, default=2)
+    parser.add_argument("-d", "--max-distance", type=int, default=3)
+    parser.add_argument("-n", "--n-results", type=int, default=5)
+    args = parser.parse_args()
+
+    service = DataService()
+    index = Index(service)
+    rng = random.Random(0)
+    names = sample_venues(service, args.queries)["name"].tolist()
+    queries = [(add_typos(name, args.typos, rng), index.tokenize(name)) for name in names]
+
+    fp = index.artifact_path("tokens.pickle")
+    if os.path.exists(fp):
+        os.remove(fp)
+    for label in ("construção", "cache"):
+        start = time.perf_counter()
+        FuzzySearch(index, SearchBackend.SQL)
+        print(f"BK-tree ({label}): {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    print(f"{args.typos} erro(s) de digitação por consulta, {len(queries)} consultas")
+    for d in range(args.max_distance + 1):
+        strategy = FuzzySearch(index, SearchBackend.MEMORY, max_distance=d)
+        hits = 0
+        start = time.perf_counter()
+        for query, tokens in queries:
+            venues = strategy.search(query, n_results=args.n_results)
+            hits += any(index.tokenize(v.name) == tokens for v in venues)
+        elapsed = time.perf_counter() - start
+        print(
+            f"distância {d}: {elapsed / len(queries) * 1e3:7.3f} ms/consulta  "
+            f"revocação@{args.n_results} {hits / len(queries):6.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Compara a pontuação exaustiva e a poda MaxScore da busca aproximada
+em memória.
+
+Uso: python -m benchmarks.fuzzy_topk [-q QUANTIDADE] [-n RESULTADOS] [-t ERROS] [-s ESCALA]
+
+As buscas são nomes de vias de publicação sorteados das fontes embutidas,
+com `t` erros de digitação, restritas ou não ao tipo da via. Com `-s`, a
+matriz TF-IDF é replicada `s` vezes, com pesos levemente perturbados,
+simulando um índice maior. O processo termina com erro se algum resultado
+diferir entre os dois modos.
+"""
+from argparse import ArgumentParser
+import random
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.common import add_typos, sample_venues
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.model import VenueType
+from qual_qualis.index.search import FuzzySearch, SearchBackend
+from qual_qualis.index.tfidf import TfIdfMatrix
+
+
+def replicate(matrix: TfIdfMatrix, scale: int, seed: int):
+    """Replica as colunas da matriz `scale` vezes, no lugar."""
+    rng = np.random.default_rng(seed)
+    n = len(matrix.venues)
+    lengths = np.diff(matrix.indptr)
+    rows = np.repeat(np.arange(len(lengths)), lengths * scale)
+    copies = np.concatenate([np.repeat(np.arange(scale), l) for l in lengths])
+    base = np.concatenate(
+        [np.tile(np.arange(s, e), scale) for s, e in zip(matrix.indptr[:-1], matrix.indptr[1:])]
+    )
+    matrix.indices = (matrix.indices[base] + copies * n).astype(np.int32)
+    matrix.data = matrix.data[base] * (1 + 0.01 * rng.random(len(base)))
+    matrix.indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=len(lengths)))])
+    matrix.maxes = np.maximum.reduceat(matrix.data, matrix.indptr[:-1])
+    matrix.venues = matrix.venues * scale
+    matrix.types = np.tile(matrix.types, scale)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--queries", type=int, default=1000)
+    parser.add_argument("-n", "--n-results", type=int, default=5)
+    parser.add_argument("-t", "--typos", type=int, default=1)
+    parser.add_argument("-s", "--scale", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = DataService()
+    strategy = FuzzySearch(Index(service), SearchBackend.MEMORY)
+    if args.scale > 1:
+        replicate(strategy.matrix, args.scale, args.seed)
+    rng = random.Random(args.seed)
+    venues = sample_venues(service, args.queries, args.seed)
+    queries = [
+        (
+            strategy.expand(strategy.index.tokenize(add_typos(name, args.typos, rng))),
+            rng.choice([None, VenueType[source.upper()]]),
+        )
+        for name, source in zip(venues["name"], venues["source"])
+    ]
+    queries = [(m, t) for m, t in queries if m]
+    print(f"{len(strategy.matrix.venues)} vias de publicação, {len(queries)} buscas")
+    results = {}
+    for label, prune in [("exaustiva", False), ("MaxScore", True), ("automática", None)]:
+        start = time.perf_counter()
+        results[label] = [
+            strategy.matrix.top_k(m, args.n_results, t, prune=prune) for m, t in queries
+        ]
+        elapsed = time.perf_counter() - start
+        print(f"{label:10s}  {elapsed / len(queries) * 1e3:7.3f} ms/consulta")
+    same = sum(
+        a == b == c
+        for a, b, c in zip(results["exaustiva"], results["MaxScore"], results["automática"])
+    )
+    print(f"resultados idênticos: {same}/{len(queries)}")
+    if same != len(queries):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
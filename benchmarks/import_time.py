@@ -0,0 +1,66 @@
+"""Mede o tempo de importação da CLI com `-X importtime` e verifica que
+dependências pesadas não são carregadas em caminhos que não as usam.
+
+Uso: python -m benchmarks.import_time [--budget MILISSEGUNDOS]
+
+O processo termina com erro se algum cenário exceder o limite de tempo
+ou importar um módulo proibido.
+"""
+from argparse import ArgumentParser
+import subprocess
+import sys
+
+HEAVY_MODULES = {"pandas", "numpy", "bibtexparser", "Levenshtein", "pybktree", "pydantic"}
+
+SCENARIOS: list[tuple[str, list[str], set[str]]] = [
+    ("versão", ["-v"], HEAVY_MODULES),
+    ("busca issn/exact", ["search", "2316-9451", "-s", "issn", "-s", "exact"], HEAVY_MODULES),
+    ("busca fuzzy", ["search", "software engineering", "-s", "fuzzy"], HEAVY_MODULES - {"Levenshtein", "pybktree"}),
+]
+
+
+def import_times(args: list[str]) -> tuple[float, set[str]]:
+    """Executa a CLI em um novo processo e retorna o tempo total de
+    importação, em milissegundos, e os módulos importados."""
+    code = (
+        "import sys\n"
+        f"sys.argv = ['qual-qualis', *{args!r}]\n"
+        "from qual_qualis.cli import main\n"
+        "main()\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    total, modules = 0, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.add(name.strip())
+        if len(name) - len(name.lstrip()) == 1:
+            total += int(cumulative)
+    return total / 1e3, modules
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=500.0)
+    args = parser.parse_args()
+
+    failed = False
+    for label, argv, forbidden in SCENARIOS:
+        total, modules = import_times(argv)
+        loaded = {m for m in modules if m.split(".")[0] in forbidden}
+        roots = sorted({m.split(".")[0] for m in loaded})
+        print(f"{label:18s} {total:8.1f} ms  proibidos: {', '.join(roots) or '-'}")
+        failed |= total > args.budget or bool(loaded)
+    if failed:
+        print(f"regressão: limite de {args.budget:.0f} ms ou módulo proibido", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Mede o tempo de construção do índice a partir das fontes de dados.
+
+Uso: python -m benchmarks.index_build [-r REPETIÇÕES] [--budget SEGUNDOS]
+
+O índice instalado é reconstruído no lugar, sob a trava do índice, como
+em `Index`, para não concorrer com outros processos. Com `--budget`, o processo
+termina com erro se a mediana exceder o limite, sinalizando uma regressão.
+"""
+from argparse import ArgumentParser
+import statistics
+import sys
+import time
+
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.lock import FileLock
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=None)
+    args = parser.parse_args()
+
+    index = Index(DataService())
+    times = []
+    for _ in range(args.repeat):
+        with FileLock(index.artifact_path("index.lock")):
+            start = time.perf_counter()
+            index._store_index()  # pylint: disable=protected-access
+            times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    print(
+        f"construção do índice: mediana {median * 1e3:.1f} ms, "
+        f"mínimo {min(times) * 1e3:.1f} ms ({args.repeat} repetições)"
+    )
+    if args.budget is not None and median > args.budget:
+        print(f"acima do limite de {args.budget * 1e3:.1f} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""Compara o esquema compacto do índice, com chaves inteiras, ao esquema
+anterior, com chaves MD5 e tokens repetidos na tabela de frequências.
+
+Uso: python -m benchmarks.index_schema [-q QUANTIDADE] [-r REPETIÇÕES] [--seed SEMENTE]
+
+O índice é construído em um diretório temporário, e uma cópia no esquema
+anterior é derivada dele por SQL. São medidos o tamanho dos arquivos, as
+páginas de cada tabela e índice (`dbstat`), as páginas dos objetos lidos pela
+junção da busca aproximada, a memória mapeada tocada pelas buscas (`Rss` em
+`/proc/self/smaps`, quando disponível), a latência da junção e a da busca
+exata pelo hash do nome, sem tipo de via de publicação. As buscas são
+nomes sorteados das fontes embutidas, com erros de digitação em uma fração
+deles. O processo termina com erro se algum resultado diferir entre os dois
+esquemas.
+"""
+from argparse import ArgumentParser
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.common import add_typos, sample_venues
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.search import FuzzySearch, SearchBackend
+
+LEGACY_SCHEMA = """
+CREATE TABLE venue (
+    `type` INT NOT NULL,
+    `hash` BLOB NOT NULL,
+    `name` TEXT NOT NULL,
+    `qualis` TEXT NOT NULL,
+    `extra` TEXT,
+    `issn` TEXT,
+    `acronym` TEXT
+);
+CREATE TABLE inv_doc_frequency (
+    `token` TEXT NOT NULL,
+    `idf` REAL NOT NULL
+);
+CREATE TABLE term_frequency (
+    `token` TEXT NOT NULL,
+    `venue_hash` INT NOT NULL,
+    `venue_type` INT NOT NULL,
+    `tf` REAL NOT NULL
+);
+INSERT INTO venue
+    SELECT type, hash, name, qualis, extra, issn, acronym FROM compact.venue ORDER BY id;
+INSERT INTO inv_doc_frequency
+    SELECT token, idf FROM compact.inv_doc_frequency ORDER BY id;
+INSERT INTO term_frequency
+    SELECT idf.token, v.hash, v.type, tf.tf
+      FROM compact.term_frequency AS tf
+        JOIN compact.inv_doc_frequency AS idf ON idf.id = tf.token_id
+        JOIN compact.venue AS v ON v.id = tf.venue_id
+      ORDER BY tf.venue_id, tf.token_id;
+CREATE UNIQUE INDEX venue_key ON venue (`type`, `hash`);
+CREATE INDEX venue_issn
+    ON venue (`issn`, `type`, `hash`, `name`, `qualis`, `extra`)
+    WHERE `issn` IS NOT NULL;
+CREATE INDEX venue_acronym
+    ON venue (`acronym`, `type`, `hash`, `name`, `qualis`, `extra`)
+    WHERE `acronym` IS NOT NULL;
+CREATE UNIQUE INDEX inv_doc_frequency_key ON inv_doc_frequency (`token`);
+CREATE UNIQUE INDEX term_frequency_key
+    ON term_frequency (`token`, `venue_hash`, `venue_type`);
+"""
+
+LEGACY_JOIN = (
+    "  FROM q JOIN term_frequency AS tf ON q.token = tf.token\n"
+    "    JOIN inv_doc_frequency AS idf ON tf.token = idf.token\n"
+    "    JOIN venue AS v ON v.type = tf.venue_type AND v.hash = tf.venue_hash\n"
+    "  GROUP BY v.type, v.hash\n"
+)
+
+COMPACT_JOIN = (
+    "  FROM q JOIN inv_doc_frequency AS idf ON q.token = idf.token\n"
+    "    JOIN term_frequency AS tf ON tf.token_id = idf.id\n"
+    "    JOIN venue AS v ON v.id = tf.venue_id\n"
+    "  GROUP BY v.id\n"
+)
+
+JOIN_OBJECTS = {
+    "anterior": ["venue", "venue_key", "inv_doc_frequency", "inv_doc_frequency_key",
+                 "term_frequency", "term_frequency_key"],
+    "compacto": ["venue", "inv_doc_frequency", "inv_doc_frequency_key", "term_frequency"],
+}
+
+
+def join_query(join: str, n_tokens: int, n_results: int) -> str:
+    return (
+        f"WITH q (token, weight) AS (VALUES {', '.join(['(?, ?)'] * n_tokens)})\n"
+        "SELECT v.type, v.hash, SUM(tf.tf * idf.idf * q.weight) AS score\n"
+        f"{join}"
+        "  ORDER BY score DESC, v.type, v.hash\n"
+        f"  LIMIT {n_results}"
+    )
+
+
+def page_usage(fp: str) -> dict[str, int]:
+    """Retorna a quantidade de páginas de cada tabela e índice."""
+    with sqlite3.connect(fp) as db:
+        return dict(db.execute("SELECT name, COUNT(*) FROM dbstat GROUP BY name"))
+
+
+def mapped_rss(fp: str) -> int | None:
+    """Retorna a memória residente, em bytes, dos mapeamentos do arquivo
+    neste processo, ou None fora do Linux."""
+    try:
+        with open("/proc/self/smaps", encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+    total, current = 0, False
+    for line in lines:
+        fields = line.split()
+        if "-" in fields[0] and len(fields) >= 5:
+            current = fields[-1] == fp
+        elif current and fields[0] == "Rss:":
+            total += int(fields[1]) * 1024
+    return total
+
+
+EXACT_QUERY = "SELECT type, hash, name, qualis, extra FROM venue WHERE hash = ?"
+
+
+def run_exact(fp: str, hashes: list[bytes], repeat: int):
+    """Executa as buscas exatas em uma conexão nova, retornando os
+    resultados e o menor tempo de cada busca."""
+    db = sqlite3.connect(f"file:{fp}?mode=ro&immutable=1", uri=True)
+    times = np.full(len(hashes), np.inf)
+    results = []
+    for r in range(repeat):
+        for i, name_hash in enumerate(hashes):
+            start = time.perf_counter()
+            rows = db.execute(EXACT_QUERY, (name_hash,)).fetchall()
+            times[i] = min(times[i], time.perf_counter() - start)
+            if r == 0:
+                results.append(rows)
+    db.close()
+    return results, times
+
+
+def run(fp: str, join: str, queries: list[dict[str, float]], repeat: int):
+    """Executa as buscas em uma conexão nova, com o banco mapeado em memória,
+    retornando os resultados, o menor tempo de cada busca e a memória
+    mapeada tocada."""
+    db = sqlite3.connect(f"file:{fp}?mode=ro&immutable=1", uri=True)
+    db.execute(f"PRAGMA mmap_size = {os.path.getsize(fp)}")
+    times = np.full(len(queries), np.inf)
+    results = []
+    for r in range(repeat):
+        for i, matches in enumerate(queries):
+            query = join_query(join, len(matches), 5)
+            params = [x for m in matches.items() for x in m]
+            start = time.perf_counter()
+            rows = db.execute(query, params).fetchall()
+            times[i] = min(times[i], time.perf_counter() - start)
+            if r == 0:
+                results.append(rows)
+    rss = mapped_rss(os.path.realpath(fp))
+    db.close()
+    return results, times, rss
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--queries", type=int, default=100)
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    parser.add_argument("-f", "--typo-fraction", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = DataService()
+    with tempfile.TemporaryDirectory() as directory:
+        index = Index(service, directory)
+        compact_fp = os.path.join(directory, "index.db")
+        legacy_fp = os.path.join(directory, "legacy.db")
+        with sqlite3.connect(legacy_fp) as db:
+            db.execute("ATTACH DATABASE ? AS compact", (compact_fp,))
+            db.executescript(LEGACY_SCHEMA)
+        with sqlite3.connect(legacy_fp) as db:
+            db.execute("VACUUM")
+
+        fuzzy = FuzzySearch(index, SearchBackend.SQL)
+        rng = random.Random(args.seed)
+        names = sample_venues(service, args.queries, args.seed)["name"]
+        queries = [
+            fuzzy.expand(index.tokenize(
+                add_typos(name, 1, rng) if rng.random() < args.typo_fraction else name
+            ))
+            for name in names
+        ]
+        queries = [q for q in queries if q]
+        hashes = [index.hash("-".join(index.tokenize(name))) for name in names]
+
+        schemas = {"anterior": (legacy_fp, LEGACY_JOIN), "compacto": (compact_fp, COMPACT_JOIN)}
+        results, exact = {}, {}
+        for label, (fp, join) in schemas.items():
+            pages = page_usage(fp)
+            page_size = os.path.getsize(fp) // sum(pages.values())
+            working_set = sum(pages.get(name, 0) for name in JOIN_OBJECTS[label])
+            results[label], times, rss = run(fp, join, queries, args.repeat)
+            print(
+                f"{label:8s} arquivo {os.path.getsize(fp) / 2**10:6.0f} KiB, "
+                f"objetos da junção {working_set * page_size / 2**10:6.0f} KiB"
+                + (f", mapeado pelas buscas {rss / 2**10:6.0f} KiB" if rss is not None else "")
+            )
+            print(
+                f"{'':8s} junção p50 {np.percentile(times, 50) * 1e6:7.0f} µs, "
+                f"p99 {np.percentile(times, 99) * 1e6:7.0f} µs, "
+                f"média {times.mean() * 1e6:7.0f} µs ({len(queries)} buscas)"
+            )
+            exact[label], times = run_exact(fp, hashes, args.repeat)
+            print(
+                f"{'':8s} exata  p50 {np.percentile(times, 50) * 1e6:7.0f} µs, "
+                f"p99 {np.percentile(times, 99) * 1e6:7.0f} µs, "
+                f"média {times.mean() * 1e6:7.0f} µs ({len(hashes)} buscas)"
+            )
+            print(
+                f"{'':8s} " + ", ".join(
+                    f"{name} {count * page_size / 2**10:.0f} KiB"
+                    for name, count in sorted(pages.items(), key=lambda p: -p[1])
+                )
+            )
+    same = sum(
+        [r[:2] for r in a] == [r[:2] for r in b]
+        for a, b in zip(results["anterior"], results["compacto"])
+    )
+    same_exact = exact["anterior"] == exact["compacto"]
+    print(
+        f"resultados idênticos: {same}/{len(queries)}, "
+        f"busca exata {'idêntica' if same_exact else 'DIFERENTE'}"
+    )
+    if same != len(queries) or not same_exact:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
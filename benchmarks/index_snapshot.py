@@ -0,0 +1,96 @@
+"""Mede a inicialização, o consumo de memória e a latência das buscas com o
+retrato do índice em memória, comparados às consultas SQL.
+
+Uso: python -m benchmarks.index_snapshot [-q QUANTIDADE] [-r REPETIÇÕES] [--seed SEMENTE]
+
+São medidos o tempo de carga do retrato gravado e de sua recriação a partir
+do banco de dados, o tamanho do arquivo, dos arrays e dos objetos Python
+criados na carga, e o tempo de inicialização das estratégias com cada
+mecanismo. As buscas são nomes e ISSNs de vias de publicação sorteadas das
+fontes embutidas. O processo termina com erro se algum resultado diferir
+entre os dois mecanismos.
+"""
+from argparse import ArgumentParser
+import os
+import sys
+import time
+import tracemalloc
+
+from benchmarks.common import sample_venues
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.search import SearchBackend, SearchStrategy, SearchStrategyKey
+from qual_qualis.index.snapshot import IndexSnapshot
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--queries", type=int, default=2000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = DataService()
+    index = Index(service)
+    fp = index.artifact_path(IndexSnapshot.file_name)
+    if not os.path.exists(fp):
+        index.snapshot()
+    load = best_of(lambda: IndexSnapshot.load(fp), args.repeat)
+    rebuild = best_of(lambda: IndexSnapshot.from_index(index), args.repeat)
+    tracemalloc.start()
+    snapshot = IndexSnapshot.load(fp)
+    objects, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"retrato: carga {load * 1e3:.1f} ms, recriação a partir do banco "
+        f"{rebuild * 1e3:.1f} ms"
+    )
+    print(
+        f"memória: arquivo {os.path.getsize(fp) / 2**10:.0f} KiB, arrays "
+        f"{snapshot.nbytes / 2**10:.0f} KiB, objetos Python {objects / 2**10:.0f} KiB "
+        f"({len(snapshot.venues)} vias, {len(snapshot.tokens)} tokens, "
+        f"{len(snapshot.data)} pesos)"
+    )
+
+    keys = [SearchStrategyKey.ISSN, SearchStrategyKey.EXACT, SearchStrategyKey.ACRONYM]
+    venues = sample_venues(service, args.queries, args.seed)
+    queries = [
+        dict(name=name, issn=issn if isinstance(issn, str) else None)
+        for name, issn in zip(venues["name"], venues["issn"])
+    ]
+    strategies = {}
+    for backend in SearchBackend:
+        def create(backend=backend):
+            fresh = Index(service)
+            return [SearchStrategy.create(k, fresh, backend) for k in keys]
+
+        elapsed = best_of(create, args.repeat)
+        strategies[backend] = create()
+        print(f"inicialização das estratégias ({backend.value}): {elapsed * 1e3:.1f} ms")
+    failed = False
+    for i, key in enumerate(keys):
+        results = {}
+        for backend in SearchBackend:
+            st = strategies[backend][i]
+            start = time.perf_counter()
+            results[backend] = [st.search(**q) for q in queries]
+            elapsed = time.perf_counter() - start
+            print(f"{key.value:8s} {backend.value:6s} {elapsed / len(queries) * 1e6:7.1f} µs/busca")
+        if results[SearchBackend.SQL] != results[SearchBackend.MEMORY]:
+            print(f"{key.value}: resultados diferentes", file=sys.stderr)
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
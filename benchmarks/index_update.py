@@ -0,0 +1,121 @@
+"""Mede o tempo da atualização incremental do índice após uma mudança
+nas fontes de dados.
+
+Uso: python -m benchmarks.index_update [-f FRAÇÃO] [--seed SEMENTE]
+
+Uma fração `f` das vias de publicação das fontes embutidas tem sua
+classificação alterada, outra é removida e outra é adicionada com nomes
+sintéticos, simulando uma atualização periódica do Qualis. O índice
+instalado é atualizado no lugar, comparado com uma reconstrução completa
+a partir dos mesmos dados e, ao final, reconstruído a partir das fontes
+originais, tudo sob a trava do índice, como em `Index`, para não concorrer
+com outros processos. O processo termina com erro se os dois índices
+diferirem.
+"""
+from argparse import ArgumentParser
+import sqlite3
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from qual_qualis.data.model import DataSource
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.lock import FileLock
+
+
+class PerturbedDataService(DataService):
+    """Fontes de dados embutidas com uma fração das vias alterada."""
+
+    def __init__(
+        self,
+        fraction: float,
+        seed: int,
+        area: str = DataService.default_area,
+        directory: str | None = None,
+    ):
+        super().__init__(area, directory)
+        self.fraction = fraction
+        self.seed = seed
+
+    def get(self, source: DataSource) -> pd.DataFrame:
+        df = super().get(source).reset_index(drop=True)
+        rng = np.random.default_rng(self.seed)
+        k = int(len(df) * self.fraction)
+        picked = rng.choice(len(df), size=3 * k, replace=False)
+        changed, removed, added = picked[:k], picked[k : 2 * k], picked[2 * k :]
+        df.loc[changed, "qualis"] = np.where(df.loc[changed, "qualis"] == "C", "B4", "C")
+        new = df.loc[added].assign(name=[f"{n} Update {i}" for i, n in enumerate(df.loc[added, "name"])])
+        return pd.concat([df.drop(index=removed), new], ignore_index=True)
+
+
+def dump(db_path: str) -> dict[str, dict]:
+    """Lê as tabelas do índice como dicionários indexados pelas suas chaves."""
+    db = sqlite3.connect(db_path)
+    tables = {
+        "venue": {
+            (t, h): (n, q, e, i, a)
+            for t, h, n, q, e, i, a in db.execute(
+                "SELECT type, hash, name, qualis, extra, issn, acronym FROM venue"
+            )
+        },
+        "inv_doc_frequency": dict(db.execute("SELECT token, idf FROM inv_doc_frequency")),
+        "term_frequency": {
+            (t, h, vt): tf
+            for t, h, vt, tf in db.execute(
+                "SELECT idf.token, v.hash, v.type, tf.tf FROM term_frequency AS tf "
+                "JOIN inv_doc_frequency AS idf ON idf.id = tf.token_id "
+                "JOIN venue AS v ON v.id = tf.venue_id"
+            )
+        },
+    }
+    db.close()
+    return tables
+
+
+def same(a: dict[str, dict], b: dict[str, dict]) -> bool:
+    """Compara dois índices, com tolerância para erros de arredondamento."""
+    if a["venue"] != b["venue"]:
+        return False
+    for table in ["inv_doc_frequency", "term_frequency"]:
+        if a[table].keys() != b[table].keys():
+            return False
+        if any(abs(a[table][k] - b[table][k]) > 1e-9 for k in a[table]):
+            return False
+    return True
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-f", "--fraction", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    index = Index(DataService())
+    with FileLock(index.artifact_path("index.lock")):
+        index.service = PerturbedDataService(args.fraction, args.seed)
+        try:
+            start = time.perf_counter()
+            index._update_index()  # pylint: disable=protected-access
+            incremental = time.perf_counter() - start
+            updated = dump(index._db_path())  # pylint: disable=protected-access
+            start = time.perf_counter()
+            index._store_index()  # pylint: disable=protected-access
+            full = time.perf_counter() - start
+            rebuilt = dump(index._db_path())  # pylint: disable=protected-access
+        finally:
+            index.service = DataService()
+            index._store_index()  # pylint: disable=protected-access
+    print(
+        f"atualização de {args.fraction:.1%} das vias em cada categoria: "
+        f"incremental {incremental * 1e3:.1f} ms, reconstrução {full * 1e3:.1f} ms"
+    )
+    if not same(updated, rebuilt):
+        print("o índice atualizado difere da reconstrução", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
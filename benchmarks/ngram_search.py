@@ -0,0 +1,83 @@
+"""Mede a vazão e a revocação da busca por n-gramas de caracteres com nomes
+abreviados, comparadas às da busca aproximada por termos.
+
+Uso: python -m benchmarks.ngram_search [-q QUANTIDADE] [-f FRAÇÃO] [--seed SEMENTE]
+
+As buscas são nomes de vias de publicação sorteados das fontes embutidas,
+dos quais uma fração `f` é abreviada como em referências bibliográficas:
+palavras como "of" e "on" são removidas e as demais, truncadas (como em
+"Int. Conf. Softw. Eng."). Para cada estratégia são medidas a vazão das
+buscas uma a uma (`search`) e em lote (`search_many`) e a fração de buscas
+cuja via de publicação esperada é o primeiro resultado ou está entre os
+cinco primeiros. O processo termina com erro se os resultados diferirem
+entre os dois modos.
+"""
+from argparse import ArgumentParser
+import random
+import sys
+import time
+
+from benchmarks.common import sample_venues
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.search import SearchBackend, SearchStrategy, SearchStrategyKey
+
+STOP_WORDS = {"of", "on", "the", "and", "for", "in", "de", "da", "do", "e"}
+
+
+def abbreviate(name: str, rng: random.Random) -> str:
+    """Abrevia um nome, truncando cada palavra longa em 3 a 5 letras."""
+    words = []
+    for word in name.split():
+        if word.lower() in STOP_WORDS:
+            continue
+        cut = rng.randint(3, 5)
+        words.append(f"{word[:cut]}." if len(word) > cut + 1 else word)
+    return " ".join(words)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--queries", type=int, default=10000)
+    parser.add_argument("-f", "--fraction", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = DataService()
+    index = Index(service)
+    rng = random.Random(args.seed)
+    venues = sample_venues(service, args.queries, args.seed)
+    names = list(venues["name"])
+    queries = [
+        dict(name=abbreviate(name, rng) if rng.random() < args.fraction else name, n_results=5)
+        for name in names
+    ]
+    expected = [index.hash("-".join(tokens)) for tokens in index.tokenize_many(names)]
+    print(f"{len(queries)} buscas, {args.fraction:.0%} abreviadas, ex.: {queries[0]['name']!r}")
+    ok = True
+    for key in [SearchStrategyKey.FUZZY, SearchStrategyKey.NGRAM]:
+        start = time.perf_counter()
+        strategy = SearchStrategy.create(key, index, SearchBackend.MEMORY)
+        init = time.perf_counter() - start
+        start = time.perf_counter()
+        single = [strategy.search(**q) for q in queries]
+        one_by_one = time.perf_counter() - start
+        start = time.perf_counter()
+        batch = strategy.search_many(queries)
+        batched = time.perf_counter() - start
+        top1 = sum(bool(r) and r[0].hash == h for r, h in zip(batch, expected))
+        top5 = sum(any(v.hash == h for v in r) for r, h in zip(batch, expected))
+        same = single == batch
+        ok &= same
+        print(
+            f"{key.value:6s} inicialização {init * 1e3:6.0f} ms, uma a uma "
+            f"{len(queries) / one_by_one:7.0f} buscas/s, em lote {len(queries) / batched:7.0f} "
+            f"buscas/s; primeiro resultado {top1 / len(queries):6.1%}, entre os cinco "
+            f"{top5 / len(queries):6.1%}{'' if same else '  RESULTADOS DIFERENTES'}"
+        )
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
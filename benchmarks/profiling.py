@@ -0,0 +1,76 @@
+"""Mede o custo da instrumentação de `qual_qualis.profiling`, com a
+medição ativada e desativada.
+
+Uso: python -m benchmarks.profiling [-q QUANTIDADE] [-r REPETIÇÕES] [--backend sql|memory]
+
+As buscas são nomes e ISSNs sorteados das fontes embutidas, aplicadas uma
+a uma (`apply_many`) e em lote (`apply_batch`) com as estratégias padrão.
+Para cada modo é medido o menor tempo entre as repetições, alternadas, sem
+perfilador e com perfilador. O custo com a medição desativada é estimado
+pela quantidade de pontos de medição executados, registrada pelo
+perfilador, multiplicada pelo custo de uma verificação de
+`profiling.active`.
+"""
+from argparse import ArgumentParser
+import timeit
+
+from benchmarks.common import sample_venues
+from qual_qualis import profiling
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.search import SearchBackend, SearchStrategy, SearchStrategyKey
+
+
+def best_of(fn, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--queries", type=int, default=2000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--backend", type=SearchBackend, default=SearchBackend.MEMORY)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = DataService()
+    index = Index(service)
+    strategies = [SearchStrategy.create(k, index, args.backend) for k in SearchStrategyKey.defaults()]
+    venues = sample_venues(service, args.queries, args.seed)
+    queries = [
+        dict(name=name, issn=issn if isinstance(issn, str) else None, n_results=5)
+        for name, issn in zip(venues["name"], venues["issn"])
+    ]
+    modes = {
+        "uma a uma": lambda: [SearchStrategy.apply_many(strategies, **q) for q in queries],
+        "em lote": lambda: SearchStrategy.apply_batch(strategies, queries),
+    }
+    check = min(
+        timeit.repeat(
+            "profiler = profiling.active\nif profiler is None: pass",
+            globals={"profiling": profiling},
+            number=100000,
+            repeat=5,
+        )
+    ) / 100000
+    print(f"{len(queries)} buscas, mecanismo {args.backend.value}")
+    print(f"verificação de `profiling.active`: {check * 1e9:.0f} ns")
+    for label, run in modes.items():
+        run()
+        disabled = enabled = float("inf")
+        profiler = profiling.Profiler()
+        for _ in range(args.repeat):
+            disabled = min(disabled, best_of(run, 1))
+            with profiling.profile(profiler):
+                enabled = min(enabled, best_of(run, 1))
+        checks = sum(s.calls for s in profiler.stages.values()) / args.repeat
+        print(
+            f"{label:10s} desativada {disabled * 1e3:8.1f} ms, ativada {enabled * 1e3:8.1f} ms "
+            f"({enabled / disabled - 1:+.1%}); {checks:.0f} pontos de medição, custo "
+            f"estimado desativada {checks * check * 1e3:.3f} ms "
+            f"({checks * check / disabled:.3%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
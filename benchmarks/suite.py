@@ -0,0 +1,258 @@
+"""Executa o conjunto de benchmarks de latência e vazão, emitindo os
+resultados em JSON para comparação entre versões.
+
+Uso: python -m benchmarks.suite [-o RESULTADOS.json] [--compare BASE.json]
+     [--tolerance FRAÇÃO] [-q BUSCAS] [-n ENTRADAS] [-r REPETIÇÕES]
+     [-b sql|memory ...] [--seed SEMENTE]
+
+São medidos, em um índice construído em um diretório temporário:
+
+- o tempo de construção do índice (`Index._store_index`);
+- a inicialização de `FuzzySearch` a frio (sem a BK-tree e o retrato do
+  índice gravados) e a quente, para cada mecanismo;
+- a latência por busca (p50, p99 e média) de cada estratégia e mecanismo,
+  com o menor tempo de cada busca entre as repetições;
+- a vazão da anotação de arquivos .csv e .bib por `CsvHandler` e
+  `BibHandler`, com todas as estratégias e o mecanismo em memória.
+
+As buscas são nomes e ISSNs sorteados das fontes embutidas, dos quais uma
+fração recebe erros de digitação. A busca aproximada com SQL, muito mais
+lenta, usa apenas as primeiras `--slow-queries` buscas.
+
+Cada resultado tem um nome, um valor, uma unidade e o sentido de melhora.
+Com `--compare`, os resultados são comparados aos de uma execução anterior,
+e o processo termina com erro se algum piorar além da tolerância.
+"""
+from __future__ import annotations
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.common import add_typos, sample_venues
+from qual_qualis import __version__
+from qual_qualis.cli.file_handler.file_handler import FileHandler
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.lock import FileLock
+from qual_qualis.index.model import VenueType
+from qual_qualis.index.search import (
+    FuzzySearch,
+    SearchBackend,
+    SearchStrategy,
+    SearchStrategyKey,
+)
+from qual_qualis.index.snapshot import IndexSnapshot
+
+
+class Results:
+    """Resultados de uma execução do conjunto de benchmarks."""
+
+    def __init__(self):
+        self.items: list[dict] = []
+
+    def add(self, name: str, value: float, unit: str, lower_is_better: bool = True, **extra):
+        self.items.append(
+            dict(name=name, value=value, unit=unit, lower_is_better=lower_is_better, **extra)
+        )
+        print(f"{name:40s} {value:12.3f} {unit}", file=sys.stderr)
+
+
+def synthetic_queries(service: DataService, k: int, fraction: float, seed: int) -> list[dict]:
+    """Sorteia buscas das fontes embutidas, com um erro de digitação em
+    uma fração `fraction` dos nomes."""
+    rng = random.Random(seed)
+    venues = sample_venues(service, k, seed)
+    return [
+        dict(
+            name=add_typos(name, 1, rng) if rng.random() < fraction else name,
+            issn=issn if isinstance(issn, str) else None,
+            venue_type=VenueType[source.upper()],
+            n_results=5,
+        )
+        for name, issn, source in zip(venues["name"], venues["issn"], venues["source"])
+    ]
+
+
+def write_csv(fp: Path, queries: list[dict]):
+    with open(fp, "w", encoding="utf-8") as f:
+        f.write("key,name,issn\n")
+        for i, q in enumerate(queries):
+            name = q["name"].replace('"', '""')
+            f.write(f'key{i},"{name}",{q["issn"] or ""}\n')
+
+
+def write_bib(fp: Path, queries: list[dict]):
+    with open(fp, "w", encoding="utf-8") as f:
+        for i, q in enumerate(queries):
+            field = "journal" if q["venue_type"] == VenueType.JOURNALS else "booktitle"
+            issn = f"\tissn = {{{q['issn']}}},\n" if q["issn"] else ""
+            f.write(f"@article{{key{i},\n\t{field} = {{{q['name']}}},\n{issn}}}\n\n")
+
+
+def bench_index_build(index: Index, repeat: int, results: Results):
+    times = []
+    for _ in range(repeat):
+        with FileLock(index.artifact_path("index.lock")):
+            start = time.perf_counter()
+            index._store_index()  # pylint: disable=protected-access
+            times.append(time.perf_counter() - start)
+    results.add("index_build", statistics.median(times) * 1e3, "ms", min=min(times) * 1e3)
+
+
+def bench_fuzzy_init(
+    service: DataService, directory: str, backends: list[SearchBackend], repeat: int, results: Results
+):
+    for backend in backends:
+        for mode in ["cold", "warm"]:
+            times = []
+            for _ in range(repeat):
+                if mode == "cold":
+                    for name in ["tokens.pickle", IndexSnapshot.file_name]:
+                        fp = os.path.join(directory, name)
+                        if os.path.exists(fp):
+                            os.remove(fp)
+                start = time.perf_counter()
+                FuzzySearch(Index(service, directory), backend)
+                times.append(time.perf_counter() - start)
+            results.add(f"fuzzy_init.{backend.value}.{mode}", min(times) * 1e3, "ms")
+
+
+def bench_latency(
+    index: Index,
+    queries: list[dict],
+    backends: list[SearchBackend],
+    slow_queries: int,
+    repeat: int,
+    results: Results,
+):
+    for backend in backends:
+        for key in SearchStrategyKey:
+            strategy = SearchStrategy.create(key, index, backend)
+            subset = (
+                queries[:slow_queries]
+                if key == SearchStrategyKey.FUZZY and backend == SearchBackend.SQL
+                else queries
+            )
+            times = np.full(len(subset), np.inf)
+            for _ in range(repeat):
+                for i, q in enumerate(subset):
+                    start = time.perf_counter()
+                    strategy.search(**q)
+                    times[i] = min(times[i], time.perf_counter() - start)
+            name = f"latency.{key.value}.{backend.value}"
+            results.add(
+                f"{name}.p50", float(np.percentile(times, 50)) * 1e6, "us", queries=len(subset)
+            )
+            results.add(f"{name}.p99", float(np.percentile(times, 99)) * 1e6, "us")
+            results.add(f"{name}.mean", float(times.mean()) * 1e6, "us")
+
+
+def bench_handlers(index: Index, queries: list[dict], directory: str, repeat: int, results: Results):
+    strategies = [SearchStrategy.create(k, index, SearchBackend.MEMORY) for k in SearchStrategyKey.defaults()]
+    for ext, write in [("csv", write_csv), ("bib", write_bib)]:
+        input_fp = Path(directory, f"input.{ext}")
+        output_fp = Path(directory, f"output.{ext}")
+        write(input_fp, queries)
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            handler = FileHandler.create(input_fp)
+            handler.search(strategies)
+            handler.write(output_fp)
+            times.append(time.perf_counter() - start)
+        results.add(
+            f"batch.{ext}.memory",
+            len(queries) / min(times),
+            "entries/s",
+            lower_is_better=False,
+            entries=len(queries),
+        )
+
+
+def compare(current: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """Compara os resultados aos de uma execução anterior, retornando
+    os nomes dos que pioraram além da tolerância relativa."""
+    previous = {r["name"]: r for r in baseline}
+    regressions = []
+    print(f"\n{'resultado':40s} {'base':>12s} {'atual':>12s} {'variação':>9s}", file=sys.stderr)
+    for r in current:
+        old = previous.get(r["name"])
+        if old is None or not old["value"]:
+            continue
+        change = r["value"] / old["value"] - 1
+        worse = change > tolerance if r["lower_is_better"] else change < -tolerance
+        if worse:
+            regressions.append(r["name"])
+        print(
+            f"{r['name']:40s} {old['value']:12.3f} {r['value']:12.3f} {change:+8.1%}"
+            f"{'  REGRESSÃO' if worse else ''}",
+            file=sys.stderr,
+        )
+    return regressions
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("-q", "--queries", type=int, default=500)
+    parser.add_argument("--slow-queries", type=int, default=20)
+    parser.add_argument("-n", "--entries", type=int, default=2000)
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    parser.add_argument("-f", "--typo-fraction", type=float, default=0.3)
+    parser.add_argument(
+        "-b", "--backend", type=SearchBackend, nargs="+", default=list(SearchBackend)
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = DataService()
+    results = Results()
+    with tempfile.TemporaryDirectory() as directory:
+        index = Index(service, directory)
+        bench_index_build(index, args.repeat, results)
+        index = Index(service, directory)
+        bench_fuzzy_init(service, directory, args.backend, args.repeat, results)
+        queries = synthetic_queries(service, args.queries, args.typo_fraction, args.seed)
+        bench_latency(index, queries, args.backend, args.slow_queries, args.repeat, results)
+        entries = synthetic_queries(service, args.entries, args.typo_fraction, args.seed + 1)
+        bench_handlers(index, entries, directory, args.repeat, results)
+
+    report = {
+        "version": __version__,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "parameters": {
+            **{k: v for k, v in vars(args).items() if k not in {"output", "compare"}},
+            "backend": [b.value for b in args.backend],
+        },
+        "results": results.items,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results.items, baseline["results"], args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regressões: {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
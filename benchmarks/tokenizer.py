@@ -0,0 +1,90 @@
+"""Mede a vazão do tokenizador e verifica sua equivalência com a
+implementação de referência.
+
+Uso: python -m benchmarks.tokenizer [-r REPETIÇÕES] [-k ALEATÓRIOS] [--seed SEMENTE]
+
+A saída de `Index.tokenize` é comparada com a implementação original
+(`unicodedata.normalize` e `re.sub` por token) para todos os nomes das
+fontes de dados embutidas e para `k` textos aleatórios com caracteres
+Unicode diversos. O processo termina com erro se alguma saída diferir.
+"""
+from argparse import ArgumentParser
+import random
+import re
+import sys
+import time
+import unicodedata
+
+from qual_qualis.data.model import DataSource
+from qual_qualis.data.service import DataService
+from qual_qualis.index import index as index_module
+from qual_qualis.index.index import Index
+
+
+def reference_tokenize(text: str) -> list[str]:
+    """Implementação original de `Index.tokenize`."""
+    tokens = re.findall(r"[\w'’]+", text, re.UNICODE | re.MULTILINE | re.DOTALL)
+    tokens = (unicodedata.normalize("NFKD", token.lower()) for token in tokens)
+    tokens = (re.sub(r"[^a-z0-9]", "", token) for token in tokens)
+    return list(tokens)
+
+
+def random_texts(k: int, seed: int) -> list[str]:
+    """Gera textos com letras acentuadas, ligaduras, dígitos de outros
+    sistemas, símbolos e pontuação."""
+    rng = random.Random(seed)
+    ranges = [(0x20, 0x7E), (0xA0, 0x24F), (0x370, 0x3FF), (0x400, 0x4FF),
+              (0x1E00, 0x1EFF), (0x2000, 0x218F), (0x2460, 0x24FF), (0xFB00, 0xFB06),
+              (0xFF01, 0xFF5E), (0x4E00, 0x4E40)]
+    texts = []
+    for _ in range(k):
+        chars = []
+        for _ in range(rng.randint(0, 40)):
+            lo, hi = rng.choice(ranges)
+            chars.append(chr(rng.randint(lo, hi)))
+        texts.append("".join(chars))
+    return texts
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-k", "--random", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = DataService()
+    names = [n for src in DataSource for n in service.get(src)["name"].tolist()]
+    texts = names + random_texts(args.random, args.seed)
+    index = Index.__new__(Index)
+    mismatches = [t for t in texts if index.tokenize(t) != reference_tokenize(t)]
+    print(f"equivalência: {len(texts) - len(mismatches)}/{len(texts)} textos")
+
+    def measure(fn) -> float:
+        best = float("inf")
+        for _ in range(args.repeat):
+            index_module._tokenize.cache_clear()  # pylint: disable=protected-access
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        return len(names) / best
+
+    reference = measure(lambda: [reference_tokenize(n) for n in names])
+    cold = measure(lambda: index.tokenize_many(names))
+    index.tokenize_many(names)
+    start = time.perf_counter()
+    index.tokenize_many(names)
+    warm = len(names) / (time.perf_counter() - start)
+    print(
+        f"{len(names)} nomes: referência {reference:.0f} nomes/s, "
+        f"tabela de tradução {cold:.0f} nomes/s ({cold / reference:.1f}x), "
+        f"com cache {warm:.0f} nomes/s ({warm / reference:.1f}x)"
+    )
+    if mismatches:
+        for text in mismatches[:10]:
+            print(f"diverge: {text!r}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
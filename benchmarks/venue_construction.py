@@ -0,0 +1,40 @@
+"""Compara o custo de construção de resultados de busca a partir das
+linhas do índice: modelo pydantic `Venue` e `VenueRecord`.
+
+Uso: python -m benchmarks.venue_construction [-r REPETIÇÕES]
+"""
+from argparse import ArgumentParser
+import time
+
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.model import Venue, VenueRecord
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    index = Index(DataService())
+    fields = ["type", "hash", "name", "qualis", "extra"]
+    rows = index.db.execute(f"SELECT {', '.join(fields)} FROM venue").fetchall()
+    records = [VenueRecord.from_row(row) for row in rows]
+    cases = {
+        "Venue(**dict(zip(...)))": lambda: [Venue(**dict(zip(fields, r))) for r in rows],
+        "VenueRecord.from_row": lambda: [VenueRecord.from_row(r) for r in rows],
+        "VenueRecord.to_model": lambda: [r.to_model() for r in records],
+    }
+    for label, fn in cases.items():
+        best = min(_timeit(fn) for _ in range(args.repeat))
+        print(f"{label:24s} {best / len(rows) * 1e9:8.0f} ns/resultado")
+
+
+def _timeit(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
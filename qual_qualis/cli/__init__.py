@@ -3,19 +3,40 @@
 from pathlib import Path
 from typing import Annotated, Optional
 from typer import Argument, Exit, Option, Typer
+import json
 import sys
+import time
 
-from qual_qualis import __version__
+from qual_qualis import __version__, profiling
 from qual_qualis.cli.file_handler import FileHandler
-from qual_qualis.data.service import DataService, DataSource
+from qual_qualis.data.model import DataSource
+from qual_qualis.data.service import DataService
+from qual_qualis.index.cache import QueryCache
 from qual_qualis.index.index import Index
-from qual_qualis.index.model import Venue, VenueType
-from qual_qualis.index.search import SearchStrategy, SearchStrategyKey
+from qual_qualis.index.model import VenueRecord, VenueType
+from qual_qualis.index.search import (
+    CascadeSearch,
+    SearchBackend,
+    SearchStrategy,
+    SearchStrategyKey,
+)
 
 
 cli = Typer(name="qual-qualis")
 
 
+@cli.callback(invoke_without_command=True)
+def root(
+    version: Annotated[
+        bool, Option("-v", "--version", help="Mostra a versão da ferramenta.")
+    ] = False,
+):
+    """Busca automatizada de classificação Qualis."""
+    if version:
+        print(__version__)
+        raise Exit()
+
+
 @cli.command()
 def search(
     query: Annotated[
@@ -54,60 +75,415 @@ def search(
     ] = None,
     strategies: Annotated[
         list[SearchStrategyKey],
-        Option("-s", "--strategy", help="Estratégias de busca a ser usadas."),
+        Option(
+            "-s",
+            "--strategy",
+            help="Estratégias de busca a ser usadas. Por padrão, todas exceto `ngram`.",
+        ),
     ] = [],
     n_results: Annotated[
         int, Option("-n", help="Quantidade de resultados a ser exibidos.")
     ] = 5,
-    version: Annotated[
-        bool, Option("-v", "--version", help="Mostra a versão da ferramenta.")
+    jobs: Annotated[
+        int,
+        Option(
+            "-j",
+            "--jobs",
+            min=1,
+            help=(
+                "Quantidade de processos que resolvem as buscas de arquivos de "
+                "entrada, limitada à quantidade de CPUs. Cada processo carrega o "
+                "índice ao iniciar, o que só compensa em arquivos grandes."
+            ),
+        ),
+    ] = 1,
+    cache_size: Annotated[
+        int,
+        Option(
+            min=0,
+            help="Quantidade máxima de buscas mantidas em cache (0 desativa o cache).",
+        ),
+    ] = 4096,
+    persist_cache: Annotated[
+        bool,
+        Option(help="Salva o cache de buscas em disco, junto ao índice."),
     ] = False,
+    server: Annotated[
+        Optional[str],
+        Option(
+            envvar="QUAL_QUALIS_SERVER",
+            help=(
+                "Endereço de um servidor de consultas (`qual-qualis serve`). "
+                "Se estiver acessível, as buscas são delegadas a ele."
+            ),
+        ),
+    ] = None,
+    backend: Annotated[
+        Optional[SearchBackend],
+        Option(
+            show_default=False,
+            help=(
+                "Mecanismo de busca: consultas SQL ao índice ou estruturas "
+                "carregadas em memória. Por padrão, sql. Não se aplica a buscas "
+                "delegadas a um servidor, que usa o mecanismo com que foi iniciado."
+            ),
+        ),
+    ] = None,
+    max_distance: Annotated[
+        Optional[int],
+        Option(
+            show_default=False,
+            help=(
+                "Distância de edição máxima entre termos na busca aproximada. "
+                "Por padrão, 2. Não se aplica a buscas delegadas a um servidor."
+            ),
+        ),
+    ] = None,
+    cascade: Annotated[
+        bool,
+        Option(
+            help=(
+                "Aplica as estratégias em sequência, parando na primeira que "
+                "obtiver uma correspondência confiável."
+            ),
+        ),
+    ] = False,
+    fuzzy_margin: Annotated[
+        float,
+        Option(
+            min=0.0,
+            max=1.0,
+            help=(
+                "Diferença relativa mínima entre as duas maiores pontuações para "
+                "que um resultado da busca aproximada seja confiável com --cascade."
+            ),
+        ),
+    ] = 0.2,
+    index_dir: Annotated[
+        Optional[Path],
+        Option(
+            envvar="QUAL_QUALIS_INDEX_DIR",
+            file_okay=False,
+            help=(
+                "Diretório onde o índice é armazenado. "
+                "Se omitido, é usado o diretório do pacote."
+            ),
+        ),
+    ] = None,
+    data_dir: Annotated[
+        Optional[Path],
+        Option(
+            envvar="QUAL_QUALIS_DATA_DIR",
+            file_okay=False,
+            help=(
+                "Diretório dos dados das áreas de avaliação (veja `qual-qualis areas`). "
+                "Se omitido, é usado o diretório do pacote."
+            ),
+        ),
+    ] = None,
+    areas: Annotated[
+        list[str],
+        Option(
+            "-a",
+            "--area",
+            help=(
+                "Áreas de avaliação consultadas (veja `qual-qualis areas`). Apenas "
+                "os índices das áreas informadas são abertos. Por padrão, "
+                f"{DataService.default_area}."
+            ),
+        ),
+    ] = [],
+    stream: Annotated[
+        bool,
+        Option(
+            help=(
+                "Processa o arquivo de entrada em lotes, escrevendo os resultados "
+                "à medida que são obtidos. Requer arquivo de saída."
+            ),
+        ),
+    ] = False,
+    profile: Annotated[
+        bool,
+        Option(
+            "--profile",
+            "--stats",
+            help=(
+                "Mede a duração de cada etapa da execução, como a verificação do "
+                "índice, a tokenização, as consultas SQL e cada estratégia de busca, "
+                "e exibe um resumo ao final."
+            ),
+        ),
+    ] = False,
+    profile_output: Annotated[
+        Optional[Path],
+        Option(
+            dir_okay=False,
+            help="Arquivo JSON onde as medições são salvas. Implica --profile.",
+        ),
+    ] = None,
 ):
     """Busca de classificação Qualis."""
-    if version:
-        return print(__version__)
-
     venue_type = VenueType[venue.name] if venue is not None else None
-    strategies = strategies if strategies else list(SearchStrategyKey)
+    keys = strategies if strategies else SearchStrategyKey.defaults()
 
+    if query is None and input_file is None:
+        sys.stderr.write(
+            "Por favor especifique uma string de busca ou arquivo de entrada.\n"
+        )
+        raise Exit(code=1)
+    if stream and (input_file is None or output_file is None):
+        sys.stderr.write(
+            "A opção --stream requer um arquivo de entrada e um arquivo de saída.\n"
+        )
+        raise Exit(code=1)
+    profiler = profiling.enable() if profile or profile_output else None
+    strategies = prepare_strategies(
+        keys,
+        server,
+        backend,
+        max_distance,
+        index_dir,
+        areas,
+        fuzzy_margin if cascade else None,
+        data_dir,
+    )
+    cache = prepare_cache(strategies, cache_size, persist_cache)
     match (query, input_file):
-        case (None, None):
-            sys.stderr.write(
-                "Por favor especifique uma string de busca ou arquivo de entrada.\n"
-            )
-            raise Exit(code=1)
         case (query, None):
-            simple_search(strategies, query, venue_type, n_results)
+            simple_search(strategies, query, venue_type, n_results, cache)
+        case (None, input_file) if stream:
+            file_stream(strategies, input_file, output_file, n_results, jobs, cache)
         case (None, input_file):
-            file_search(strategies, input_file, output_file, n_results)
+            file_search(strategies, input_file, output_file, n_results, jobs, cache)
         case (query, input_file):
             file_single_search(strategies, input_file, query, n_results)
+    if cache is not None:
+        cache.save()
+    if profiler is not None:
+        profiling.disable()
+        show_profile(profiler, profile_output)
+
+
+@cli.command()
+def serve(
+    host: Annotated[str, Option(help="Endereço de escuta do servidor.")] = "127.0.0.1",
+    port: Annotated[int, Option("-p", "--port", help="Porta do servidor.")] = 8314,
+    backend: Annotated[
+        SearchBackend,
+        Option(
+            help=(
+                "Mecanismo de busca: consultas SQL ao índice ou estruturas "
+                "carregadas em memória."
+            ),
+        ),
+    ] = SearchBackend.MEMORY,
+    max_distance: Annotated[
+        int,
+        Option(help="Distância de edição máxima entre termos na busca aproximada."),
+    ] = 2,
+    index_dir: Annotated[
+        Optional[Path],
+        Option(
+            envvar="QUAL_QUALIS_INDEX_DIR",
+            file_okay=False,
+            help=(
+                "Diretório onde o índice é armazenado. "
+                "Se omitido, é usado o diretório do pacote."
+            ),
+        ),
+    ] = None,
+    data_dir: Annotated[
+        Optional[Path],
+        Option(
+            envvar="QUAL_QUALIS_DATA_DIR",
+            file_okay=False,
+            help=(
+                "Diretório dos dados das áreas de avaliação (veja `qual-qualis areas`). "
+                "Se omitido, é usado o diretório do pacote."
+            ),
+        ),
+    ] = None,
+    areas: Annotated[
+        list[str],
+        Option(
+            "-a",
+            "--area",
+            help=(
+                "Áreas de avaliação carregadas na inicialização. As demais são "
+                "carregadas na primeira consulta que as usa. Por padrão, "
+                f"{DataService.default_area}."
+            ),
+        ),
+    ] = [],
+):
+    """Inicia um servidor de consultas que mantém o índice em memória."""
+    # pylint: disable=import-outside-toplevel
+    from qual_qualis.index.shards import IndexShards
+    from qual_qualis.server import QueryServer
+
+    keys = list(SearchStrategyKey)
+    shards = IndexShards(
+        str(index_dir) if index_dir else None,
+        str(data_dir) if data_dir else None,
+        backend=backend,
+        max_distance=max_distance,
+    )
+    for area in dict.fromkeys(areas or [DataService.default_area]):
+        try:
+            shards.strategies(area, keys)
+        except ValueError as e:
+            sys.stderr.write(f"{e}. Veja `qual-qualis areas`.\n")
+            raise Exit(code=1)
+    with QueryServer((host, port), shards, keys) as server:
+        sys.stderr.write(f"Servidor escutando em http://{host}:{port}\n")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
 
 
-def prepare_strategies(keys: list[SearchStrategyKey]) -> list[SearchStrategy]:
-    """Inicializa e retorna as estratégias de busca."""
-    data_service = DataService()
-    index = Index(data_service)
-    return [SearchStrategy.create(key, index) for key in keys]
+@cli.command("areas")
+def list_areas(
+    import_file: Annotated[
+        Optional[Path],
+        Option(
+            "--import",
+            exists=True,
+            dir_okay=False,
+            help=(
+                "Planilha CSV com a classificação de periódicos de todas as áreas, "
+                "como a exportada pela Plataforma Sucupira, com as colunas ISSN, "
+                "Título, Área de Avaliação e Estrato."
+            ),
+        ),
+    ] = None,
+    data_dir: Annotated[
+        Optional[Path],
+        Option(
+            envvar="QUAL_QUALIS_DATA_DIR",
+            file_okay=False,
+            help=(
+                "Diretório dos dados das áreas de avaliação (veja `qual-qualis areas`). "
+                "Se omitido, é usado o diretório do pacote."
+            ),
+        ),
+    ] = None,
+):
+    """Lista as áreas de avaliação disponíveis, opcionalmente importando
+    a classificação de periódicos de todas as áreas."""
+    directory = str(data_dir) if data_dir else None
+    if import_file is not None:
+        try:
+            counts = DataService.import_journals(str(import_file), directory)
+        except ValueError as e:
+            sys.stderr.write(f"{e}\n")
+            raise Exit(code=1)
+        except OSError as e:
+            sys.stderr.write(
+                f"Não foi possível gravar os dados: {e}. "
+                "Informe outro diretório com --data-dir.\n"
+            )
+            raise Exit(code=1)
+        sys.stderr.write(
+            f"{sum(counts.values())} periódicos importados em {len(counts)} áreas "
+            f"para {DataService.data_directory(directory)}\n"
+        )
+    for area in DataService.areas(directory):
+        sources = ", ".join(src.value for src in DataService(area, directory).sources())
+        print(f"{area} ({sources})")
+
 
+def prepare_strategies(
+    keys: list[SearchStrategyKey],
+    server: str | None = None,
+    backend: SearchBackend | None = None,
+    max_distance: int | None = None,
+    index_dir: Path | None = None,
+    areas: list[str] | None = None,
+    margin: float | None = None,
+    data_dir: Path | None = None,
+) -> list[SearchStrategy]:
+    """Inicializa e retorna as estratégias de busca. Se o endereço de um
+    servidor de consultas acessível for informado, as estratégias delegam
+    as buscas a ele. Com mais de uma área de avaliação, as buscas são
+    aplicadas ao índice de cada área (`AreaSearch`). Se `margin` for
+    informada, as estratégias são aplicadas em cascata. O mecanismo de
+    busca e a distância de edição máxima, por padrão SQL e 2, não podem ser
+    informados para buscas delegadas ao servidor."""
+    areas = list(dict.fromkeys(areas or []))
+    if server:
+        # pylint: disable=import-outside-toplevel
+        from qual_qualis.server import Client, RemoteSearch
 
-def show_results(venues: list[Venue], indent_level: int = 0):
+        client = Client(server)
+        if client.is_available():
+            if backend is not None or max_distance is not None:
+                sys.stderr.write(
+                    "As opções --backend e --max-distance não se aplicam a buscas "
+                    "delegadas ao servidor; informe-as em `qual-qualis serve`.\n"
+                )
+                raise Exit(code=1)
+            return [RemoteSearch(client, keys, areas, margin)]
+    backend = backend if backend is not None else SearchBackend.SQL
+    max_distance = max_distance if max_distance is not None else 2
+    data_directory = str(data_dir) if data_dir else None
+    available = DataService.areas(data_directory)
+    unknown = [area for area in areas if area not in available]
+    if unknown:
+        sys.stderr.write(
+            f"Área de avaliação não encontrada: {', '.join(unknown)}. "
+            "Veja `qual-qualis areas`.\n"
+        )
+        raise Exit(code=1)
+    directory = str(index_dir) if index_dir else None
+    if len(areas) > 1:
+        # pylint: disable=import-outside-toplevel
+        from qual_qualis.index.shards import AreaSearch, IndexShards
+
+        shards = IndexShards(directory, data_directory, backend, max_distance)
+        return [AreaSearch(shards, areas, keys, margin)]
+    data_service = DataService(*areas, directory=data_directory)
+    index = Index(data_service, directory)
+    strategies = [
+        SearchStrategy.create(key, index, backend, max_distance) for key in keys
+    ]
+    return [CascadeSearch(strategies, margin)] if margin is not None else strategies
+
+
+def prepare_cache(
+    strategies: list[SearchStrategy], max_size: int, persist: bool
+) -> QueryCache | None:
+    """Inicializa o cache de buscas para o índice usado pelas estratégias.
+    Não há cache para buscas delegadas a um servidor."""
+    index = next((st.index for st in strategies if st.index is not None), None)
+    if index is None or max_size <= 0:
+        return None
+    return QueryCache(index, max_size, persist)
+
+
+def show_results(venues: list[VenueRecord], indent_level: int = 0):
     """Exibe resultados de busca."""
     indent = " " * indent_level
     for venue in venues:
-        print(f"{indent}- {venue.qualis.name:2s} | {venue.name} | {venue.extra}")
+        area = f"{venue.area} | " if venue.area is not None else ""
+        print(f"{indent}- {venue.qualis.name:2s} | {area}{venue.name} | {venue.extra}")
 
 
 def simple_search(
-    strategies: list[SearchStrategyKey],
+    strategies: list[SearchStrategy],
     query: str,
     venue_type: VenueType | None,
     n_results: int,
+    cache: QueryCache | None = None,
 ):
     """Realiza busca individual."""
-    strategies = prepare_strategies(strategies)
     venues = SearchStrategy.apply_many(
-        strategies, issn=query, name=query, venue_type=venue_type, n_results=n_results
+        strategies,
+        cache=cache,
+        issn=query,
+        name=query,
+        venue_type=venue_type,
+        n_results=n_results,
     )
     if not venues:
         Exit(code=1)
@@ -115,14 +491,19 @@ def simple_search(
 
 
 def file_search(
-    strategies: list[SearchStrategyKey],
+    strategies: list[SearchStrategy],
     input_file: Path,
     output_file: Path | None,
     n_results: int,
+    jobs: int = 1,
+    cache: QueryCache | None = None,
 ):
-    strategies = prepare_strategies(strategies)
     file_handler = FileHandler.create(input_file)
-    results = file_handler.search(strategies, n_results=n_results)
+    start = time.perf_counter()
+    results = file_handler.search(
+        strategies, n_results=n_results, jobs=jobs, cache=cache
+    )
+    show_throughput(len(results), time.perf_counter() - start, cache)
     if output_file:
         file_handler.write(output_file)
     else:
@@ -131,10 +512,41 @@ def file_search(
             show_results(venues, indent_level=2)
 
 
+def file_stream(
+    strategies: list[SearchStrategy],
+    input_file: Path,
+    output_file: Path,
+    n_results: int,
+    jobs: int = 1,
+    cache: QueryCache | None = None,
+):
+    handler_class = FileHandler.handler_class(input_file)
+    start = time.perf_counter()
+    count = handler_class.stream(
+        input_file, output_file, strategies, n_results=n_results, jobs=jobs, cache=cache
+    )
+    show_throughput(count, time.perf_counter() - start, cache)
+
+
+def show_throughput(count: int, elapsed: float, cache: QueryCache | None = None):
+    sys.stderr.write(
+        f"{count} entradas em {elapsed:.2f} s "
+        f"({count / elapsed if elapsed else 0:.1f} entradas/s)\n"
+    )
+    if cache is not None:
+        sys.stderr.write(f"Cache: {cache.hits} acertos, {cache.misses} falhas\n")
+
+
+def show_profile(profiler: profiling.Profiler, output_file: Path | None = None):
+    """Exibe o resumo das medições e, se informado, as salva em JSON."""
+    sys.stderr.write(profiler.summary() + "\n")
+    if output_file is not None:
+        output_file.write_text(json.dumps(profiler.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+
 def file_single_search(
-    strategies: list[SearchStrategyKey], input_file: Path, key: str, n_results: int
+    strategies: list[SearchStrategy], input_file: Path, key: str, n_results: int
 ):
-    strategies = prepare_strategies(strategies)
     file_handler = FileHandler.create(input_file)
     venues = file_handler.search_one(strategies, key, n_results=n_results)
     if not venues:
@@ -1,4 +1,19 @@
-"""Módulo para lidar com diferentes arquivos de entrada."""
+"""Módulo para lidar com diferentes arquivos de entrada.
+
+As subclasses de FileHandler são importadas sob demanda, evitando carregar
+as dependências de formatos de arquivo que não estão em uso.
+"""
+from importlib import import_module
+
 from .file_handler import FileHandler
-from .bib_handler import BibHandler
-from .csv_handler import CsvHandler
+
+_lazy_handlers = {
+    "BibHandler": ".bib_handler",
+    "CsvHandler": ".csv_handler",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_handlers:
+        return getattr(import_module(_lazy_handlers[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,21 @@
 """Responsável por ler dados em BibTeX."""
 
 from pathlib import Path
+import re
+from typing import Iterator
 
 import bibtexparser as bib
 import bibtexparser.model as bibm
+from bibtexparser.middlewares import (
+    RemoveEnclosingMiddleware,
+    ResolveStringReferencesMiddleware,
+)
 
+from qual_qualis import profiling
 from qual_qualis.cli.file_handler.file_handler import FileHandler
-from qual_qualis.index.model import Venue
+from qual_qualis.index.cache import QueryCache
+from qual_qualis.index.model import VenueRecord
+from qual_qualis.index.parallel import SearchPool
 from qual_qualis.index.search import SearchStrategy
 
 
@@ -14,13 +23,16 @@ class BibHandler(FileHandler):
     """Responsável por ler dados em BibTeX."""
 
     library: bib.Library = None
+    block_start = re.compile(r"^[ \t]*@[\w]*[ \t]*[{(]")
+    block_separator = "\n\n"
 
     @classmethod
     def extension(cls) -> set[str]:
         return {"bib"}
 
     def read(self, fp: Path):
-        self.library = bib.parse_file(str(fp))
+        with profiling.stage("bib.parse"):
+            self.library = bib.parse_file(str(fp))
 
     @staticmethod
     def __read_entry(entry: bibm.Entry) -> tuple[str | None, str | None]:
@@ -47,48 +59,140 @@ class BibHandler(FileHandler):
         issn = issn.value if issn is not None else None
         return name, issn
 
+    @classmethod
+    def __search_entries(
+        cls,
+        entries: list[bibm.Entry],
+        strategies: list[SearchStrategy],
+        n_results: int,
+        pool: SearchPool | None,
+        cache: QueryCache | None,
+    ) -> list[list[VenueRecord]]:
+        """Realiza em lote a busca da via de publicação de cada entrada."""
+        queries = []
+        for entry in entries:
+            name, issn = cls.__read_entry(entry)
+            queries.append(dict(name=name, issn=issn, n_results=n_results))
+        results = cls._search_many(strategies, queries, pool, cache)
+        return [cls._top(venues, n_results) for venues in results]
+
+    @staticmethod
+    def __annotate(entry: bibm.Entry, venues: list[VenueRecord]) -> bibm.Entry:
+        """Adiciona o campo `qualis` a uma entrada com os resultados da busca."""
+        value = "\n".join(
+            f"{v.qualis.name:2s} | {v.name} | {v.extra}" if v.area is None
+            else f"{v.qualis.name:2s} | {v.area} | {v.name} | {v.extra}"
+            for v in venues
+        )
+        value = f"\n{value}\n" if len(venues) > 1 else value
+        entry.set_field(bibm.Field(key="qualis", value=value))
+        return entry
+
     def search(
-        self, strategies: list[SearchStrategy], n_results: int = 5
-    ) -> dict[str, list[Venue]]:
-        def process_block(block: bibm.Block) -> tuple[str, list[Venue]] | None:
-            if not isinstance(block, bibm.Entry):
-                return None
-            name, issn = self.__read_entry(block)
-            venues = SearchStrategy.apply_many(
-                strategies, name=name, issn=issn, n_results=n_results
-            )
-            return block.key, venues[:n_results]
-
-        def process_result(block: bibm.Entry, venues: list[Venue]) -> bibm.Block:
-            value = "\n".join(
-                f"{v.qualis.name:2s} | {v.name} | {v.extra}" for v in venues
-            )
-            value = f"\n{value}\n" if len(venues) > 1 else value
-            block.set_field(bibm.Field(key="qualis", value=value))
-            return block
-
-        results = {
-            t[0]: t[1] for t in map(process_block, self.library.blocks) if t is not None
-        }
+        self,
+        strategies: list[SearchStrategy],
+        n_results: int = 5,
+        jobs: int = 1,
+        cache: QueryCache | None = None,
+    ) -> dict[str, list[VenueRecord]]:
+        entries = [block for block in self.library.blocks if isinstance(block, bibm.Entry)]
+        with self._pool(strategies, jobs) as pool:
+            venues = self.__search_entries(entries, strategies, n_results, pool, cache)
+        results = dict(zip((entry.key for entry in entries), venues))
         self.library = bib.Library(
-            process_result(block, results[block.key]) if isinstance(block, bibm.Entry) else block
-            for block in self.library.blocks
+            [
+                self.__annotate(block, results[block.key])
+                if isinstance(block, bibm.Entry)
+                else block
+                for block in self.library.blocks
+            ]
         )
         return results
 
+    @classmethod
+    def __read_chunks(cls, fp: Path, batch_size: int) -> Iterator[str]:
+        """Lê um arquivo BibTeX em trechos de até `batch_size` blocos.
+
+        Os trechos são separados apenas em linhas que iniciam um bloco
+        (`@tipo{` ou `@tipo(`), que o bibtexparser sempre trata como
+        início de um novo bloco, de forma que a análise de cada trecho
+        resulta nos mesmos blocos da análise do arquivo inteiro.
+        """
+        lines: list[str] = []
+        blocks = 0
+        with open(fp, encoding="utf-8") as f:
+            for line in f:
+                if cls.block_start.match(line):
+                    if blocks == batch_size:
+                        yield "".join(lines)
+                        lines, blocks = [], 0
+                    blocks += 1
+                lines.append(line)
+        if lines:
+            yield "".join(lines)
+
+    @classmethod
+    def stream(
+        cls,
+        input_fp: Path,
+        output_fp: Path,
+        strategies: list[SearchStrategy],
+        n_results: int = 5,
+        jobs: int = 1,
+        cache: QueryCache | None = None,
+        batch_size: int = 256,
+    ) -> int:
+        """Realiza buscas para cada entrada de um arquivo BibTeX, lendo e
+        escrevendo o arquivo em lotes de `batch_size` blocos, de forma que
+        apenas um lote é mantido em memória por vez.
+
+        Referências a `@string` são resolvidas apenas se a definição
+        aparecer antes da entrada no arquivo.
+        """
+        strings: dict[str, bibm.String] = {}
+        resolve = ResolveStringReferencesMiddleware(True)
+        remove_enclosing = RemoveEnclosingMiddleware(True)
+        count = 0
+        first = True
+        with (
+            open(output_fp, "w", encoding="utf-8") as out,
+            cls._pool(strategies, jobs) as pool,
+        ):
+            for chunk in cls.__read_chunks(input_fp, batch_size):
+                with profiling.stage("bib.parse"):
+                    library = bib.parse_string(chunk, parse_stack=[])
+                strings.update(
+                    (s.key, bibm.String(s.key, s.value)) for s in library.strings
+                )
+                resolve.transform(bib.Library([*strings.values(), *library.entries]))
+                library = remove_enclosing.transform(library)
+                entries = library.entries
+                results = cls.__search_entries(entries, strategies, n_results, pool, cache)
+                for entry, venues in zip(entries, results):
+                    cls.__annotate(entry, venues)
+                with profiling.stage("bib.write", len(entries)):
+                    text = bib.write_string(library)
+                if text:
+                    out.write(text if first else cls.block_separator + text)
+                    first = False
+                count += len(entries)
+        return count
+
     def write(self, fp: Path):
-        bib.write_file(str(fp), self.library)
+        with profiling.stage("bib.write", len(self.library.entries)):
+            bib.write_file(str(fp), self.library)
 
     def search_one(
         self, strategies: list[SearchStrategy], key: str, n_results: int = 5
-    ) -> list[Venue]:
+    ) -> list[VenueRecord]:
         entry = self.library.entries_dict.get(key)
         if not entry:
             return []
         name, issn = self.__read_entry(entry)
-        return SearchStrategy.apply_many(
-            strategies, name=name, issn=issn, n_results=n_results
-        )[:n_results]
+        return self._top(
+            SearchStrategy.apply_many(strategies, name=name, issn=issn, n_results=n_results),
+            n_results,
+        )
 
 
 FileHandler.add_handler(BibHandler)
@@ -6,8 +6,11 @@ import sys
 from typer import Exit
 import pandas as pd
 
+from qual_qualis import profiling
 from qual_qualis.cli.file_handler.file_handler import FileHandler
-from qual_qualis.index.model import Venue
+from qual_qualis.index.cache import QueryCache
+from qual_qualis.index.model import VenueRecord
+from qual_qualis.index.parallel import SearchPool
 from qual_qualis.index.search import SearchStrategy
 
 
@@ -21,49 +24,134 @@ class CsvHandler(FileHandler):
         return {"csv"}
 
     def read(self, fp: Path):
-        self.df = pd.read_csv(fp, header=0)
-        if not "key" in self.df.columns or not self.param_columns():
+        with profiling.stage("csv.read"):
+            self.df = pd.read_csv(fp, header=0, dtype=str, keep_default_na=False)
+        self.__check_columns(self.df)
+
+    @classmethod
+    def __check_columns(cls, df: pd.DataFrame):
+        """Verifica se um DataFrame contém as colunas necessárias para a busca."""
+        if not "key" in df.columns or not cls.__param_columns(df):
             sys.stderr.write(
                 f"O arquivo .csv de entrada deve conter a coluna `key` "
                 "e alguma coluna de busca válida (`name`, `issn`).\n"
             )
             raise Exit(code=1)
 
-    def param_columns(self) -> set[str]:
-        return set(self.df.columns) & {"name", "issn"}
+    @staticmethod
+    def __param_columns(df: pd.DataFrame) -> list[str]:
+        return [c for c in ["name", "issn"] if c in df.columns]
 
-    def search(
-        self, strategies: list[SearchStrategy], n_results: int = 5
-    ) -> dict[str, list[Venue]]:
-        keys = self.param_columns()
-
-        def search(s: pd.Series):
-            venues = SearchStrategy.apply_many(strategies, **{k: s[k] for k in keys})
-            return venues[:n_results]
+    def param_columns(self) -> set[str]:
+        return set(self.__param_columns(self.df))
 
-        def format(venues: list[Venue]) -> str:
-            return " / ".join(f"{v.qualis.name} ({v.name} {v.extra})" for v in venues)
+    @classmethod
+    def __search_frame(
+        cls,
+        df: pd.DataFrame,
+        strategies: list[SearchStrategy],
+        n_results: int,
+        pool: SearchPool | None,
+        cache: QueryCache | None,
+    ) -> list[list[VenueRecord]]:
+        """Realiza a busca para cada linha de um DataFrame. Linhas com os
+        mesmos parâmetros de busca são resolvidas uma única vez.
+
+        Parâmetros
+        ----------
+        df : pandas.DataFrame
+            Linhas do arquivo de entrada.
+        strategies : list[SearchStrategy]
+            Lista de estratégias de busca a ser usadas.
+        n_results: int
+            Quantidade de resultados.
+        pool: SearchPool, opcional
+            Conjunto de processos que resolve as buscas.
+        cache: QueryCache, opcional
+            Cache de resultados de busca.
+
+        Retorna
+        -------
+        list[list[VenueRecord]]
+            Resultados de cada linha, na mesma ordem do DataFrame.
+        """
+        columns = cls.__param_columns(df)
+        rows = list(zip(*(df[c].where(df[c] != "", None) for c in columns)))
+        queries = list(dict.fromkeys(rows))
+        venues = cls._search_many(
+            strategies, [dict(zip(columns, query)) for query in queries], pool, cache
+        )
+        results = {query: cls._top(v, n_results) for query, v in zip(queries, venues)}
+        return [results[row] for row in rows]
+
+    @staticmethod
+    def __format(venues: list[VenueRecord]) -> str:
+        return " / ".join(
+            f"{v.qualis.name} ({v.name} {v.extra})" if v.area is None
+            else f"{v.qualis.name} [{v.area}] ({v.name} {v.extra})"
+            for v in venues
+        )
 
-        results = [
-            (key, venues)
-            for key, venues in zip(self.df["key"], self.df.apply(search, axis=1))
-        ]
-        self.df = self.df.assign(qualis=[format(venues) for _, venues in results])
-        return {key: venues for key, venues in results}
+    def search(
+        self,
+        strategies: list[SearchStrategy],
+        n_results: int = 5,
+        jobs: int = 1,
+        cache: QueryCache | None = None,
+    ) -> dict[str, list[VenueRecord]]:
+        with self._pool(strategies, jobs) as pool:
+            results = self.__search_frame(self.df, strategies, n_results, pool, cache)
+        self.df = self.df.assign(qualis=[self.__format(venues) for venues in results])
+        return dict(zip(self.df["key"], results))
 
     def write(self, fp: Path):
-        self.df.to_csv(fp)
+        with profiling.stage("csv.write", len(self.df)):
+            self.df.to_csv(fp, index=False)
+
+    @classmethod
+    def stream(
+        cls,
+        input_fp: Path,
+        output_fp: Path,
+        strategies: list[SearchStrategy],
+        n_results: int = 5,
+        jobs: int = 1,
+        cache: QueryCache | None = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """Realiza buscas para cada linha de um arquivo CSV, lendo e
+        escrevendo o arquivo em lotes de `batch_size` linhas, de forma que
+        apenas um lote é mantido em memória por vez."""
+        count = 0
+        reader = pd.read_csv(
+            input_fp, header=0, dtype=str, keep_default_na=False, chunksize=batch_size
+        )
+        with (
+            reader,
+            open(output_fp, "w", encoding="utf-8", newline="") as out,
+            cls._pool(strategies, jobs) as pool,
+        ):
+            for i, df in enumerate(reader):
+                if i == 0:
+                    cls.__check_columns(df)
+                results = cls.__search_frame(df, strategies, n_results, pool, cache)
+                df = df.assign(qualis=[cls.__format(venues) for venues in results])
+                with profiling.stage("csv.write", len(df)):
+                    df.to_csv(out, index=False, header=i == 0)
+                out.flush()
+                count += len(df)
+        return count
 
     def search_one(
         self, strategies: list[SearchStrategy], key: str, n_results: int = 5
-    ) -> list[Venue]:
+    ) -> list[VenueRecord]:
         keys = self.param_columns()
         entries = self.df[self.df["key"] == key]
         if len(entries) == 0:
             return []
         entry = entries.iloc[0]
         return SearchStrategy.apply_many(
-            strategies, **{k: entry[k] for k in keys}, n_results=n_results
+            strategies, **{k: entry[k] or None for k in keys}, n_results=n_results
         )
 
 
@@ -1,12 +1,18 @@
 """Classe abstrata para lidar com diferentes tipos de arquivo de entrada."""
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from importlib import import_module
 from pathlib import Path
 import re
 import os
+from typing import TYPE_CHECKING, Any, ContextManager
 
-from qual_qualis.index.search import SearchStrategy
-from qual_qualis.index.model import Venue
+if TYPE_CHECKING:
+    from qual_qualis.index.search import SearchStrategy
+    from qual_qualis.index.cache import QueryCache
+    from qual_qualis.index.model import VenueRecord
+    from qual_qualis.index.parallel import SearchPool
 
 
 class FileHandler(ABC):
@@ -14,6 +20,10 @@ class FileHandler(ABC):
     """Classe abstrata para lidar com diferentes tipos de arquivo de entrada."""
 
     __supported_extensions: dict[str, type[FileHandler]] = {}
+    __handler_modules: dict[str, str] = {
+        "bib": "qual_qualis.cli.file_handler.bib_handler",
+        "csv": "qual_qualis.cli.file_handler.csv_handler",
+    }
 
     @classmethod
     def add_handler(cls, handler: type[FileHandler]):
@@ -27,6 +37,29 @@ class FileHandler(ABC):
         for ext in handler.extension():
             cls.__supported_extensions[ext] = handler
 
+    @classmethod
+    def handler_class(cls, fp: Path) -> type[FileHandler]:
+        """Retorna a subclasse de FileHandler que compreende a extensão
+        de um caminho de arquivo. O módulo que implementa o tipo de
+        arquivo é importado apenas quando necessário.
+
+        Parâmetros
+        ----------
+        fp : str
+            Caminho de arquivo.
+
+        Retorna
+        -------
+        type[FileHandler]
+            Subclasse de FileHandler.
+        """
+        name = os.path.basename(fp)
+        m = re.search(r"\.(.+)$", name)
+        ext = m.group(1) if m is not None else None
+        if ext not in cls.__supported_extensions and ext in cls.__handler_modules:
+            import_module(cls.__handler_modules[ext])
+        return cls.__supported_extensions[ext]
+
     @classmethod
     def create(cls, fp: Path) -> FileHandler:
         """Cria uma instância de FileHandler de acordo com
@@ -43,14 +76,121 @@ class FileHandler(ABC):
         FileHandler
             Instância de FileHandler.
         """
-        name = os.path.basename(fp)
-        m = re.search(r"\.(.+)$", name)
-        ext = m.group(1) if m is not None else None
-        return cls.__supported_extensions[ext](fp)
+        return cls.handler_class(fp)(fp)
+
+    @classmethod
+    def stream(
+        cls,
+        input_fp: Path,
+        output_fp: Path,
+        strategies: list[SearchStrategy],
+        n_results: int = 5,
+        jobs: int = 1,
+        cache: QueryCache | None = None,
+    ) -> int:
+        """Realiza buscas para cada entrada de um arquivo, escrevendo
+        os resultados em outro arquivo à medida que são obtidos.
+
+        A implementação padrão lê o arquivo inteiro antes das buscas;
+        subclasses podem processá-lo incrementalmente, mantendo o uso
+        de memória limitado.
+
+        Parâmetros
+        ----------
+        input_fp : Path
+            Caminho do arquivo de entrada.
+        output_fp : Path
+            Caminho do arquivo de saída.
+        strategies : list[SearchStrategy]
+            Lista de estratégias de busca a ser usadas.
+        n_results: int, opcional
+            Quantidade de resultados.
+        jobs: int, opcional
+            Quantidade de processos que resolvem as buscas (veja `SearchPool`).
+        cache: QueryCache, opcional
+            Cache de resultados de busca.
+
+        Retorna
+        -------
+        int
+            Quantidade de entradas processadas.
+        """
+        handler = cls(input_fp)
+        results = handler.search(strategies, n_results=n_results, jobs=jobs, cache=cache)
+        handler.write(output_fp)
+        return len(results)
 
     def __init__(self, fp: str):
         self.read(fp)
 
+    @staticmethod
+    def _pool(strategies: list[SearchStrategy], jobs: int = 1) -> ContextManager[SearchPool | None]:
+        """Cria o conjunto de processos que resolve as buscas, encerrado ao
+        final do bloco `with`. A quantidade de processos é limitada à de
+        CPUs; com um único processo, as buscas são resolvidas neste.
+
+        Parâmetros
+        ----------
+        strategies : list[SearchStrategy]
+            Lista de estratégias de busca a ser usadas.
+        jobs : int, opcional
+            Quantidade de processos.
+        """
+        jobs = min(jobs, os.cpu_count() or 1)
+        if jobs <= 1:
+            return nullcontext()
+        # pylint: disable=import-outside-toplevel
+        from qual_qualis.index.parallel import SearchPool
+
+        return SearchPool(strategies, jobs)
+
+    @staticmethod
+    def _top(venues: list[VenueRecord], n_results: int) -> list[VenueRecord]:
+        """Mantém os `n_results` primeiros resultados de cada área de
+        avaliação (`VenueRecord.area`), na ordem original. Resultados de uma
+        única área, sem `area`, são apenas truncados."""
+        if not venues or venues[0].area is None:
+            return venues[:n_results]
+        counts: dict[str | None, int] = {}
+        top = []
+        for v in venues:
+            counts[v.area] = counts.get(v.area, 0) + 1
+            if counts[v.area] <= n_results:
+                top.append(v)
+        return top
+
+    @classmethod
+    def _search_many(
+        cls,
+        strategies: list[SearchStrategy],
+        queries: list[dict[str, Any]],
+        pool: SearchPool | None = None,
+        cache: QueryCache | None = None,
+    ) -> list[list[VenueRecord]]:
+        """Realiza várias buscas em lote por `SearchStrategy.apply_batch`,
+        resolvidas pelo conjunto de processos, se informado.
+
+        Parâmetros
+        ----------
+        strategies : list[SearchStrategy]
+            Lista de estratégias de busca a ser usadas.
+        queries : list[dict[str, Any]]
+            Argumentos de cada busca.
+        pool : SearchPool, opcional
+            Conjunto de processos criado por `_pool`.
+        cache : QueryCache, opcional
+            Cache de resultados de busca.
+
+        Retorna
+        -------
+        list[list[VenueRecord]]
+            Resultados de cada busca, na mesma ordem.
+        """
+        # pylint: disable=import-outside-toplevel
+        from qual_qualis.index.search import SearchStrategy
+
+        return SearchStrategy.apply_batch(strategies, queries, cache, pool)
+
     @classmethod
     @abstractmethod
     def extension(cls) -> set[str]:
@@ -67,7 +207,13 @@ class FileHandler(ABC):
         """
 
     @abstractmethod
-    def search(self, strategies: list[SearchStrategy], n_results: int = 5) -> dict[str, list[Venue]]:
+    def search(
+        self,
+        strategies: list[SearchStrategy],
+        n_results: int = 5,
+        jobs: int = 1,
+        cache: QueryCache | None = None,
+    ) -> dict[str, list[VenueRecord]]:
         """Realiza buscas para cada entrada contida no arquivo lido,
         atualizando os dados salvos com o resultado da busca.
         
@@ -77,6 +223,10 @@ class FileHandler(ABC):
             Lista de estratégias de busca a ser usadas.
         n_results: int, opcional
             Quantidade de resultados.
+        jobs: int, opcional
+            Quantidade de processos que resolvem as buscas (veja `SearchPool`).
+        cache: QueryCache, opcional
+            Cache de resultados de busca.
         """
 
     @abstractmethod
@@ -90,7 +240,7 @@ class FileHandler(ABC):
         """
 
     @abstractmethod
-    def search_one(self, strategies: list[SearchStrategy], key: str, n_results: int = 5) -> list[Venue]:
+    def search_one(self, strategies: list[SearchStrategy], key: str, n_results: int = 5) -> list[VenueRecord]:
         """Realiza a busca para uma entrada específica no arquivo lido.
 
         Parâmetros
@@ -104,6 +254,6 @@ class FileHandler(ABC):
 
         Retorna
         -------
-        list[Venue]
+        list[VenueRecord]
             Resultados da busca.
         """
@@ -1,20 +1,95 @@
 """Gerencia acesso e atualização aos dados brutos do Qualis."""
 
+from __future__ import annotations
 from datetime import datetime, timedelta
 import os
+import re
 import sys
+from typing import TYPE_CHECKING
+import unicodedata
 
 from typer import Exit
-import pandas as pd
 
 from qual_qualis.data.model import DataSource
+from qual_qualis.index.model import Qualis
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class DataService:
-    """Gerencia acesso e atualização aos dados brutos do Qualis."""
+    """Gerencia acesso e atualização aos dados brutos do Qualis de uma
+    área de avaliação.
+
+    Os dados de cada área ficam em um subdiretório do diretório de dados,
+    nomeado pelo identificador da área, com um arquivo por fonte de dados
+    (`journals.csv` e, opcionalmente, `conferences.csv`). Os dados da
+    Ciência da Computação, área padrão, acompanham o pacote e são usados
+    para as fontes ausentes do seu subdiretório.
+
+    Parâmetros
+    ----------
+    area : str, opcional
+        Identificador da área de avaliação, como retornado por `slugify`.
+    directory : str, opcional
+        Diretório de dados das áreas. Se omitido, é usada a variável de
+        ambiente `QUAL_QUALIS_DATA_DIR` ou, na sua ausência, o subdiretório
+        `areas` do pacote.
+    """
+
+    default_area = "ciencia-da-computacao"
+    """Área de avaliação cujos dados acompanham o pacote."""
+
+    def __init__(self, area: str = default_area, directory: str | None = None):
+        self.area = area
+        self.directory = self.data_directory(directory)
+
+    @staticmethod
+    def data_directory(directory: str | None = None) -> str:
+        """Retorna o diretório de dados das áreas de avaliação."""
+        return (
+            directory
+            or os.environ.get("QUAL_QUALIS_DATA_DIR")
+            or os.path.join(os.path.dirname(__file__), "areas")
+        )
 
     @staticmethod
-    def _cache_path(source: DataSource) -> str:
+    def slugify(name: str) -> str:
+        """Converte o nome de uma área de avaliação em seu identificador,
+        em caixa baixa, sem acentos e com palavras separadas por hífens
+        (como "ciencia-da-computacao").
+
+        Parâmetros
+        ----------
+        name : str
+            Nome da área de avaliação.
+        """
+        folded = unicodedata.normalize("NFKD", name.lower()).encode("ascii", "ignore").decode()
+        return "-".join(re.findall(r"[a-z0-9]+", folded))
+
+    @classmethod
+    def areas(cls, directory: str | None = None) -> list[str]:
+        """Retorna os identificadores das áreas de avaliação disponíveis,
+        em ordem alfabética.
+
+        Parâmetros
+        ----------
+        directory : str, opcional
+            Diretório de dados das áreas. Veja `DataService`.
+        """
+        directory = cls.data_directory(directory)
+        found = {cls.default_area}
+        if os.path.isdir(directory):
+            found.update(
+                entry.name
+                for entry in os.scandir(directory)
+                if entry.is_dir()
+                and any(os.path.exists(os.path.join(entry.path, f"{src.value}.csv"))
+                        for src in DataSource)
+            )
+        return sorted(found)
+
+    def _cache_path(self, source: DataSource) -> str:
         """Retorna o caminho de arquivo de cache de acordo com a fonte de dados.
 
         Parâmetros
@@ -22,7 +97,10 @@ class DataService:
         source : DataSource
             Fonte de dados da qual o caminho é obtido.
         """
-        return os.path.join(os.path.dirname(__file__), f"{source.value}.csv")
+        fp = os.path.join(self.directory, self.area, f"{source.value}.csv")
+        if self.area == self.default_area and not os.path.exists(fp):
+            return os.path.join(os.path.dirname(__file__), f"{source.value}.csv")
+        return fp
 
     @staticmethod
     def _file_mod_timedelta(fp: str) -> timedelta:
@@ -35,6 +113,10 @@ class DataService:
         """
         return datetime.now() - datetime.fromtimestamp(os.path.getmtime(fp))
 
+    def sources(self) -> list[DataSource]:
+        """Retorna as fontes de dados disponíveis para a área de avaliação."""
+        return [src for src in DataSource if os.path.exists(self._cache_path(src))]
+
     def last_update(self) -> datetime | None:
         """Retorna a última data de atualização dos dados."""
         fps = (self._cache_path(src) for src in DataSource)
@@ -54,10 +136,62 @@ class DataService:
         source : DataSource
             Fonte de dados da qual o caminho é obtido.
         """
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         fp = self._cache_path(source)
         try:
-            df = pd.read_csv(fp, header=0).drop_duplicates()
+            df = pd.read_csv(fp, header=0, keep_default_na=False).drop_duplicates()
             return df
         except FileNotFoundError:
             sys.stderr.write(f"Fonte de dados não encontrada: {fp}\n")
             raise Exit(code=1)
+
+    @classmethod
+    def import_journals(cls, fp: str, directory: str | None = None) -> dict[str, int]:
+        """Importa a classificação de periódicos de todas as áreas de
+        avaliação, como a planilha exportada pela Plataforma Sucupira, com
+        as colunas "ISSN", "Título", "Área de Avaliação" e "Estrato". É
+        gravado um arquivo `journals.csv` para cada área, substituindo o
+        anterior. Periódicos com estratos fora da classificação (como "NP")
+        são descartados.
+
+        Parâmetros
+        ----------
+        fp : str
+            Arquivo CSV da planilha, separado por vírgulas ou ponto e vírgula.
+        directory : str, opcional
+            Diretório de dados das áreas. Veja `DataService`.
+
+        Retorna
+        -------
+        dict[str, int]
+            Quantidade de periódicos importados para cada área.
+        """
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        df = pd.read_csv(fp, sep=None, engine="python", dtype=str)
+        columns = {cls.slugify(c): c for c in df.columns}
+        expected = {
+            "issn": "issn",
+            "titulo": "name",
+            "area-de-avaliacao": "area",
+            "estrato": "qualis",
+        }
+        missing = [c for c in expected if c not in columns]
+        if missing:
+            raise ValueError(f"Colunas ausentes na planilha: {', '.join(missing)}")
+        df = df[[columns[c] for c in expected]].set_axis(list(expected.values()), axis=1)
+        df = df.dropna(subset=["name", "area", "qualis"])
+        df["qualis"] = df["qualis"].str.strip().str.upper()
+        df = df[df["qualis"].isin([q.value for q in Qualis])]
+        df = df.assign(issn=df["issn"].fillna("").str.strip())
+        directory = cls.data_directory(directory)
+        counts = {}
+        for area_name, rows in df.groupby("area", sort=True):
+            area = cls.slugify(area_name)
+            os.makedirs(os.path.join(directory, area), exist_ok=True)
+            rows = rows[["issn", "name", "qualis"]].drop_duplicates().sort_values(["name", "issn"])
+            fp = os.path.join(directory, area, f"{DataSource.JOURNALS.value}.csv")
+            rows.to_csv(fp, index=False)
+            counts[area] = len(rows)
+        return counts
@@ -0,0 +1,278 @@
+"""Interface assíncrona (`asyncio`) de buscas no índice, para uso em
+serviços assíncronos."""
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+import threading
+from typing import Any, Callable, TypeVar
+
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.model import VenueRecord, VenueType
+from qual_qualis.index.search import SearchBackend, SearchStrategy, SearchStrategyKey
+
+T = TypeVar("T")
+
+
+class _Job:
+    """Execução de uma chamada em uma thread do conjunto, que pode ser
+    interrompida por `cancel` enquanto consulta o banco de dados."""
+
+    __slots__ = ("cancelled", "db", "lock")
+
+    progress_steps = 1000
+    """Intervalo, em instruções da máquina virtual do SQLite, entre as
+    verificações de cancelamento durante as consultas."""
+
+    def __init__(self):
+        self.cancelled = False
+        self.db: sqlite3.Connection | None = None
+        self.lock = threading.Lock()
+
+    def run(self, index: Index, fn: Callable[[], T]) -> T:
+        with self.lock:
+            if self.cancelled:
+                raise asyncio.CancelledError()
+            self.db = index.db
+        self.db.set_progress_handler(self.__is_cancelled, self.progress_steps)
+        try:
+            return fn()
+        finally:
+            with self.lock:
+                self.db.set_progress_handler(None, 0)
+                self.db = None
+
+    def __is_cancelled(self) -> bool:
+        return self.cancelled
+
+    def cancel(self):
+        """Marca a chamada como cancelada e interrompe a consulta em
+        andamento, se houver. A conexão é desassociada da chamada sob a
+        mesma trava antes de ser reutilizada, de forma que a interrupção
+        nunca atinge a chamada seguinte da thread."""
+        with self.lock:
+            self.cancelled = True
+            if self.db is not None:
+                self.db.interrupt()
+
+
+class AsyncIndex:
+    """Buscas no índice a partir de um laço de eventos `asyncio`, sem
+    bloqueá-lo.
+
+    A construção do índice e das estratégias de busca, que pode levar
+    segundos quando o índice é reconstruído, e as buscas são executadas em
+    um conjunto limitado de threads. Cada thread possui sua própria conexão
+    somente leitura com o banco de dados (`Index.db`), de forma que buscas
+    concorrentes não disputam uma única conexão. A inicialização é iniciada
+    em segundo plano por `start` e aguardada pelas primeiras buscas.
+
+    Buscas canceladas que ainda não começaram são descartadas; as que estão
+    em andamento têm sua consulta SQL interrompida. Com o mecanismo em
+    memória, uma busca já iniciada é concluída e seu resultado, descartado.
+
+    Parâmetros
+    ----------
+    keys : list[SearchStrategyKey], opcional
+        Estratégias de busca disponíveis. Por padrão,
+        `SearchStrategyKey.defaults()`.
+    backend : SearchBackend, opcional
+        Mecanismo de busca.
+    max_distance : int, opcional
+        Distância de edição máxima da busca aproximada.
+    max_workers : int, opcional
+        Quantidade de threads e, portanto, de conexões com o banco de dados.
+    batch_size : int, opcional
+        Quantidade máxima de buscas de `asearch_many` resolvidas por thread
+        de uma vez.
+    service : DataService, opcional
+        Serviço de acesso às fontes de dados.
+    directory : str, opcional
+        Diretório do índice. Veja `Index`.
+
+    Exemplo
+    -------
+    >>> async with AsyncIndex() as index:
+    ...     venues = await index.asearch(name="Int. Conf. Softw. Eng.")
+    """
+
+    def __init__(
+        self,
+        keys: list[SearchStrategyKey] | None = None,
+        backend: SearchBackend = SearchBackend.SQL,
+        max_distance: int = 2,
+        max_workers: int = 4,
+        batch_size: int = 256,
+        service: DataService | None = None,
+        directory: str | None = None,
+    ):
+        self.keys = list(keys) if keys is not None else SearchStrategyKey.defaults()
+        self.backend = backend
+        self.max_distance = max_distance
+        self.max_workers = max(1, max_workers)
+        self.batch_size = max(1, batch_size)
+        self.service = service
+        self.directory = directory
+        self.index: Index | None = None
+        self.strategies: dict[SearchStrategyKey, SearchStrategy] = {}
+        self.__pool: ThreadPoolExecutor | None = None
+        self.__ready: asyncio.Future | None = None
+
+    async def __aenter__(self) -> AsyncIndex:
+        self.start()
+        await self.wait_ready()
+        return self
+
+    async def __aexit__(self, *_):
+        await self.aclose()
+
+    def start(self):
+        """Inicia em segundo plano a construção do índice e das estratégias
+        de busca e a abertura de uma conexão por thread. Deve ser chamado
+        com um laço de eventos em execução; chamadas repetidas não têm
+        efeito."""
+        if self.__ready is not None:
+            return
+        self.__pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="qual-qualis")
+        self.__ready = asyncio.ensure_future(self.__warm_up())
+
+    async def wait_ready(self):
+        """Aguarda a inicialização iniciada por `start`, propagando seus
+        erros. Cancelar a espera não cancela a inicialização."""
+        self.start()
+        await asyncio.shield(self.__ready)
+
+    @property
+    def ready(self) -> bool:
+        """Se a inicialização foi concluída com sucesso."""
+        ready = self.__ready
+        if ready is None or not ready.done() or ready.cancelled():
+            return False
+        return ready.exception() is None
+
+    async def __warm_up(self):
+        loop = asyncio.get_running_loop()
+        self.index, self.strategies = await loop.run_in_executor(self.__pool, self.__build)
+        # uma chamada por thread, todas retidas pela barreira até que cada
+        # thread tenha aberto sua conexão
+        barrier = threading.Barrier(self.max_workers)
+        await asyncio.gather(*(
+            loop.run_in_executor(self.__pool, self.__connect, barrier)
+            for _ in range(self.max_workers)
+        ))
+
+    def __build(self) -> tuple[Index, dict[SearchStrategyKey, SearchStrategy]]:
+        index = Index(self.service or DataService(), self.directory)
+        return index, {
+            key: SearchStrategy.create(key, index, self.backend, self.max_distance)
+            for key in self.keys
+        }
+
+    def __connect(self, barrier: threading.Barrier):
+        self.index.db.execute("PRAGMA user_version").fetchone()
+        try:
+            barrier.wait(timeout=5)
+        except threading.BrokenBarrierError:
+            pass
+
+    async def aclose(self):
+        """Encerra as threads, aguardando as buscas em andamento."""
+        if self.__pool is None:
+            return
+        pool, self.__pool = self.__pool, None
+        if self.__ready is not None and not self.__ready.done():
+            self.__ready.cancel()
+        await asyncio.get_running_loop().run_in_executor(None, pool.shutdown)
+
+    def _strategies(self, keys: list[SearchStrategyKey] | None) -> list[SearchStrategy]:
+        """Seleciona as estratégias de uma busca, na ordem informada."""
+        return [self.strategies[SearchStrategyKey(k)] for k in keys or self.keys]
+
+    async def _run(self, fn: Callable[[], T]) -> T:
+        """Executa uma chamada em uma thread do conjunto, interrompendo-a
+        se a espera for cancelada."""
+        if self.__pool is None:
+            raise RuntimeError("O índice assíncrono foi encerrado.")
+        job = _Job()
+        future = asyncio.get_running_loop().run_in_executor(self.__pool, job.run, self.index, fn)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            job.cancel()
+            raise
+
+    async def asearch(
+        self,
+        name: str | None = None,
+        issn: str | None = None,
+        venue_type: VenueType | None = None,
+        n_results: int = 5,
+        strategies: list[SearchStrategyKey] | None = None,
+    ) -> list[VenueRecord]:
+        """Realiza uma busca, aplicando as estratégias em sequência como
+        `SearchStrategy.apply_many`.
+
+        Parâmetros
+        ----------
+        name : str, opcional
+            Nome da via de publicação.
+        issn : str, opcional
+            ISSN da via de publicação.
+        venue_type : VenueType, opcional
+            Tipo da via de publicação.
+        n_results : int, opcional
+            Quantidade máxima de resultados de cada estratégia.
+        strategies : list[SearchStrategyKey], opcional
+            Estratégias a ser aplicadas, dentre as disponíveis. Por padrão,
+            todas as disponíveis.
+
+        Retorna
+        -------
+        list[VenueRecord]
+            Resultados da busca.
+        """
+        await self.wait_ready()
+        selected = self._strategies(strategies)
+        kwargs = dict(name=name, issn=issn, venue_type=venue_type, n_results=n_results)
+        return await self._run(lambda: SearchStrategy.apply_many(selected, **kwargs))
+
+    async def asearch_many(
+        self,
+        queries: list[dict[str, Any]],
+        strategies: list[SearchStrategyKey] | None = None,
+    ) -> list[list[VenueRecord]]:
+        """Realiza várias buscas em lote, como `SearchStrategy.apply_batch`.
+        As buscas são divididas em partes de até `batch_size` buscas,
+        resolvidas concorrentemente pelas threads do conjunto.
+
+        Parâmetros
+        ----------
+        queries : list[dict[str, Any]]
+            Argumentos de cada busca, como os de `asearch`.
+        strategies : list[SearchStrategyKey], opcional
+            Estratégias a ser aplicadas, dentre as disponíveis. Por padrão,
+            todas as disponíveis.
+
+        Retorna
+        -------
+        list[list[VenueRecord]]
+            Resultados de cada busca, na mesma ordem.
+        """
+        await self.wait_ready()
+        selected = self._strategies(strategies)
+        size = max(1, min(self.batch_size, -(-len(queries) // self.max_workers)))
+        parts = [queries[i : i + size] for i in range(0, len(queries), size)]
+        tasks = [
+            asyncio.ensure_future(
+                self._run(lambda part=part: SearchStrategy.apply_batch(selected, part))
+            )
+            for part in parts
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return [venues for part in results for venues in part]
@@ -0,0 +1,141 @@
+"""Cache de resultados de busca."""
+from collections import OrderedDict
+import os
+import pickle
+import threading
+from typing import Hashable
+
+from qual_qualis.index.index import Index
+from qual_qualis.index.model import VenueRecord, VenueType
+
+
+class QueryCache:
+    """Cache LRU de resultados de busca, com tamanho limitado.
+
+    As entradas são identificadas pelo hash dos tokens normalizados do nome,
+    pela sigla e pelo ISSN normalizados, pelo tipo de via de publicação, pela
+    quantidade de resultados e pelas estratégias usadas. Opcionalmente, o cache é persistido junto ao
+    banco de dados do índice e descartado quando o índice é reconstruído ou
+    atualizado (veja `Index.build_id`).
+
+    Parâmetros
+    ----------
+    index : Index
+        Índice ao qual os resultados se referem.
+    max_size : int, opcional
+        Quantidade máxima de entradas.
+    persist : bool, opcional
+        Se o cache deve ser carregado do disco e salvo por `save`.
+    """
+
+    file_name = "queries.pickle"
+
+    def __init__(self, index: Index, max_size: int = 4096, persist: bool = False):
+        self.index = index
+        self.max_size = max_size
+        self.persist = persist
+        self.hits = 0
+        self.misses = 0
+        self.__entries: OrderedDict[Hashable, list[VenueRecord]] = OrderedDict()
+        self.__lock = threading.Lock()
+        if persist:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def key(
+        self,
+        signature: tuple[str, ...],
+        name: str | None = None,
+        issn: str | None = None,
+        venue_type: VenueType | None = None,
+        n_results: int = 5,
+        acronym: str | None = None,
+        **_,
+    ) -> Hashable:
+        """Cria a chave de uma busca.
+
+        Parâmetros
+        ----------
+        signature : tuple[str, ...]
+            Identificação das estratégias de busca usadas.
+        name : str, opcional
+            Nome da via de publicação.
+        issn : str, opcional
+            ISSN do periódico.
+        venue_type : VenueType, opcional
+            Tipo da via de publicação.
+        n_results : int, opcional
+            Quantidade de resultados.
+        acronym : str, opcional
+            Sigla da via de publicação. Se omitida, a sigla é obtida do nome,
+            como em `AcronymSearch`.
+        """
+        name_hash = (
+            self.index.hash("-".join(self.index.tokenize(name)))
+            if isinstance(name, str)
+            else None
+        )
+        # nomes com os mesmos tokens podem ter siglas diferentes ("ICSE'23"
+        # e "ICSE23"), então a sigla normalizada também compõe a chave
+        text = acronym if acronym is not None else name
+        acronym = Index.normalize_acronym(text) if isinstance(text, str) else None
+        issn = Index.normalize_issn(issn) if isinstance(issn, str) else None
+        venue_type = venue_type.value if venue_type is not None else None
+        return (signature, name_hash, acronym, issn, venue_type, n_results)
+
+    def get(self, key: Hashable) -> list[VenueRecord] | None:
+        """Retorna os resultados associados a uma chave, se houver."""
+        with self.__lock:
+            venues = self.__entries.get(key)
+            if venues is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.__entries.move_to_end(key)
+            return venues
+
+    def put(self, key: Hashable, venues: list[VenueRecord]):
+        """Associa resultados a uma chave, descartando as entradas usadas
+        há mais tempo se o tamanho máximo for excedido."""
+        if self.max_size <= 0:
+            return
+        with self.__lock:
+            self.__entries[key] = venues
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def _load(self):
+        """Carrega as entradas salvas em disco, se forem referentes
+        à versão atual do índice."""
+        fp = self.index.artifact_path(self.file_name)
+        try:
+            with open(fp, "rb") as f:
+                build_id, entries = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return
+        if build_id is not None and build_id == self.index.build_id():
+            self.__entries.update(entries)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def save(self):
+        """Salva as entradas em disco, se o cache for persistente."""
+        if not self.persist:
+            return
+        fp = self.index.artifact_path(self.file_name)
+        with self.__lock:
+            data = (self.index.build_id(), dict(self.__entries))
+        tmp_path = f"{fp}.{os.getpid()}.tmp"
+        try:
+            with self.index.lock():
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, fp)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -1,28 +1,34 @@
 DROP TABLE IF EXISTS term_frequency;
 DROP TABLE IF EXISTS inv_doc_frequency;
 DROP TABLE IF EXISTS venue;
+DROP TABLE IF EXISTS build;
 
 CREATE TABLE venue (
+    `id` INTEGER PRIMARY KEY,
     `type` INT NOT NULL,
     `hash` BLOB NOT NULL,
     `name` TEXT NOT NULL,
     `qualis` TEXT NOT NULL,
     `extra` TEXT,
-    PRIMARY KEY (`type`, `hash`)
+    `issn` TEXT,
+    `acronym` TEXT
 );
 
 CREATE TABLE inv_doc_frequency (
+    `id` INTEGER PRIMARY KEY,
     `token` TEXT NOT NULL,
-    `idf` REAL NOT NULL,
-    PRIMARY KEY (`token`)
+    `idf` REAL NOT NULL
 );
 
 CREATE TABLE term_frequency (
-    `token` TEXT NOT NULL,
-    `venue_hash` INT NOT NULL,
-    `venue_type` INT NOT NULL,
+    `token_id` INTEGER NOT NULL,
+    `venue_id` INTEGER NOT NULL,
     `tf` REAL NOT NULL,
-    PRIMARY KEY (`token`, `venue_hash`, `venue_type`),
-    FOREIGN KEY (`token`) REFERENCES inv_doc_frequency (`token`),
-    FOREIGN KEY (`venue_hash`, `venue_type`) REFERENCES venue (`hash`, `type`)
+    PRIMARY KEY (`token_id`, `venue_id`),
+    FOREIGN KEY (`token_id`) REFERENCES inv_doc_frequency (`id`),
+    FOREIGN KEY (`venue_id`) REFERENCES venue (`id`)
+) WITHOUT ROWID;
+
+CREATE TABLE build (
+    `id` TEXT NOT NULL
 );
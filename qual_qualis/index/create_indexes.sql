@@ -0,0 +1,11 @@
+CREATE UNIQUE INDEX venue_key ON venue (`hash`, `type`);
+
+CREATE INDEX venue_issn
+    ON venue (`issn`, `type`, `hash`, `name`, `qualis`, `extra`)
+    WHERE `issn` IS NOT NULL;
+
+CREATE INDEX venue_acronym
+    ON venue (`acronym`, `type`, `hash`, `name`, `qualis`, `extra`)
+    WHERE `acronym` IS NOT NULL;
+
+CREATE UNIQUE INDEX inv_doc_frequency_key ON inv_doc_frequency (`token`);
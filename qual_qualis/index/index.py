@@ -1,67 +1,436 @@
 """Índice que provê buscas por periódicos e conferências."""
+from __future__ import annotations
+from collections import Counter
 from datetime import datetime
-from functools import reduce
+from functools import lru_cache, reduce
 import hashlib
+from itertools import chain
 import os
+from pathlib import Path
 import re
+import shutil
 import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Iterable
 import unicodedata
+import uuid
 
-from numpy import log2
-import pandas as pd
-
-from qual_qualis.data.service import DataService, DataSource
+from qual_qualis import profiling
+from qual_qualis.data.model import DataSource
+from qual_qualis.data.service import DataService
+from qual_qualis.index.lock import FileLock
 from qual_qualis.index.model import VenueType
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from qual_qualis.index.snapshot import IndexSnapshot
+
+
+class _FoldingTable(dict):
+    """Tabela de tradução para `str.translate` que leva cada caractere à
+    sua forma normalizada: em caixa baixa, decomposto por compatibilidade
+    (NFKD) e restrito a `a-z0-9`. As entradas são calculadas na primeira
+    ocorrência de cada caractere. O separador `\\x00` é preservado."""
+
+    __ascii_pattern = re.compile(r"[^a-z0-9]")
+
+    def __init__(self):
+        super().__init__({0: "\x00"})
+
+    def __missing__(self, code: int) -> str:
+        folded = unicodedata.normalize("NFKD", chr(code).lower())
+        folded = self[code] = self.__ascii_pattern.sub("", folded)
+        return folded
+
+
+_folding_table = _FoldingTable()
+_token_pattern = re.compile(r"[\w'\u2019]+", re.UNICODE | re.MULTILINE | re.DOTALL)
+
+
+@lru_cache(maxsize=65536)
+def _tokenize(text: str) -> tuple[str, ...]:
+    """Implementação de `Index.tokenize`, com cache dos textos mais recentes."""
+    tokens = _token_pattern.findall(text)
+    if not tokens:
+        return ()
+    return tuple("\x00".join(tokens).translate(_folding_table).split("\x00"))
+
 
 class Index:
-    """Índice que provê buscas por periódicos e conferências."""
+    """Índice que provê buscas por periódicos e conferências.
 
-    @staticmethod
-    def _db_path() -> str:
+    O banco de dados publicado nunca é modificado: construções e atualizações
+    são feitas em uma cópia temporária, que o substitui atomicamente, sob uma
+    trava entre processos. Assim, as consultas usam conexões somente leitura
+    e imutáveis, sem travas, e processos que já o consultam continuam lendo
+    a versão anterior até reabrirem o índice.
+
+    Parâmetros
+    ----------
+    service : DataService
+        Serviço de acesso às fontes de dados.
+    directory : str, opcional
+        Diretório onde o banco de dados e seus arquivos auxiliares são
+        armazenados. Se omitido, é usada a variável de ambiente
+        `QUAL_QUALIS_INDEX_DIR` ou, na sua ausência, o diretório do pacote.
+        O índice de cada área de avaliação além da padrão é um fragmento
+        independente, armazenado no subdiretório `areas/<área>`.
+    """
+
+    schema_version = 5
+    """Versão do esquema do banco de dados. Bancos de dados com outra
+    versão são reconstruídos."""
+
+    rebuild_threshold = 0.25
+    """Fração das vias de publicação alteradas a partir da qual o índice
+    é reconstruído por completo em vez de atualizado incrementalmente."""
+
+    def _db_path(self) -> str:
         """Retorna o caminho de arquivo do banco de dados."""
-        return os.path.join(os.path.dirname(__file__), "index.db")
+        return os.path.join(self.directory, "index.db")
 
-    @staticmethod
-    def last_update() -> datetime | None:
+    def artifact_path(self, name: str) -> str:
+        """Retorna o caminho de um arquivo auxiliar, armazenado junto
+        ao banco de dados e derivado dele.
+
+        Parâmetros
+        ----------
+        name : str
+            Nome do arquivo.
+        """
+        return os.path.join(self.directory, name)
+
+    def last_update(self) -> datetime | None:
         """Retorna a última data de atualização dos dados."""
-        fp = Index._db_path()
+        fp = self._db_path()
         return datetime.fromtimestamp(os.path.getmtime(fp)) if os.path.exists(fp) else None
 
-    def __init__(self, service: DataService):
+    def build_id(self) -> str | None:
+        """Retorna o identificador da construção do banco de dados, renovado
+        a cada reconstrução ou atualização, ou None se ele não existir ou
+        estiver corrompido. Os arquivos auxiliares derivados do banco de
+        dados armazenam esse identificador, e são considerados desatualizados
+        quando ele difere do banco de dados aberto."""
+        if not os.path.exists(self._db_path()):
+            return None
+        try:
+            row = self.db.execute("SELECT id FROM build").fetchone()
+        except sqlite3.DatabaseError:
+            return None
+        return row[0] if row else None
+
+    def lock(self) -> FileLock:
+        """Retorna a trava do índice, que protege a escrita do banco de
+        dados e de seus arquivos auxiliares."""
+        return FileLock(self.artifact_path("index.lock"))
+
+    def __init__(self, service: DataService, directory: str | None = None):
         self.service = service
-        should_update = self._should_update()
-        self.db = sqlite3.connect(self._db_path())
+        self.directory = self.__root = (
+            directory
+            or os.environ.get("QUAL_QUALIS_INDEX_DIR")
+            or os.path.dirname(__file__)
+        )
+        if service.area != service.default_area:
+            self.directory = os.path.join(self.directory, "areas", service.area)
+        self.__local = threading.local()
+        self.__snapshot: IndexSnapshot | None = None
+        with profiling.stage("index.check"):
+            should_update = self._should_update()
         if should_update:
-            self._store_index()
+            os.makedirs(self.directory, exist_ok=True)
+            with self.lock():
+                self.__local = threading.local()
+                if self._should_update():
+                    with profiling.stage("index.update"):
+                        self._update_index()
+                        self.__local = threading.local()
+                        self._store_snapshot()
+            self.__local = threading.local()
+
+    def __reduce__(self):
+        """Serializa o índice por seus parâmetros, de forma que uma cópia
+        enviada a outro processo abre suas próprias conexões."""
+        return (type(self), (self.service, self.__root))
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        """Conexão somente leitura e imutável com o banco de dados. Cada
+        thread possui sua própria conexão, permitindo consultas concorrentes
+        ao índice."""
+        db = getattr(self.__local, "db", None)
+        if db is None:
+            uri = f"{Path(self._db_path()).absolute().as_uri()}?mode=ro&immutable=1"
+            db = self.__local.db = sqlite3.connect(uri, uri=True)
+        return db
+
+    def snapshot(self) -> IndexSnapshot:
+        """Retorna o retrato do índice em memória, usado pelas estratégias
+        de busca com `SearchBackend.MEMORY`. O retrato é carregado uma
+        única vez por instância."""
+        if self.__snapshot is None:
+            # pylint: disable=import-outside-toplevel
+            from qual_qualis.index.snapshot import IndexSnapshot
+
+            with profiling.stage("index.snapshot"):
+                self.__snapshot = IndexSnapshot.open(self)
+        return self.__snapshot
+
+    def _store_snapshot(self):
+        """Grava o retrato do índice a partir do banco de dados publicado.
+        Deve ser chamado sob a trava do índice."""
+        # pylint: disable=import-outside-toplevel
+        from qual_qualis.index.snapshot import IndexSnapshot
+
+        try:
+            IndexSnapshot.from_index(self).save(self.artifact_path(IndexSnapshot.file_name))
+        except OSError:
+            pass
 
     def _should_update(self) -> bool:
         """Retorna se deve atualizar o banco de dados."""
         db_last_update = self.last_update()
         raw_last_update = self.service.last_update()
-        return raw_last_update and (
-            not db_last_update or db_last_update < raw_last_update
-        )
+        if not raw_last_update:
+            return False
+        if not db_last_update or db_last_update < raw_last_update:
+            return True
+        return self._stored_version() != self.schema_version
 
-    def _store_index(self):
-        """Constroi o banco de dados do índice."""
-        sql_fp = os.path.join(os.path.dirname(__file__), "create.sql")
-        with open(sql_fp, encoding="utf8") as f:
+    def _stored_version(self) -> int | None:
+        """Retorna a versão do esquema do banco de dados armazenado,
+        ou None se ele não existir ou estiver corrompido."""
+        if not os.path.exists(self._db_path()):
+            return None
+        try:
+            (version,) = self.db.execute("PRAGMA user_version").fetchone()
+        except sqlite3.DatabaseError:
+            return None
+        return version
+
+    @staticmethod
+    def _execute_sql(db: sqlite3.Connection, name: str):
+        """Executa um script SQL armazenado junto ao módulo, comando a
+        comando, sem encerrar a transação em andamento."""
+        with open(os.path.join(os.path.dirname(__file__), name), encoding="utf8") as f:
             sql = f.read()
-        with self.db:
-            self.db.executescript(sql)
-            venues_dfs, tf_dfs = zip(*(self._read_data_source(src) for src in DataSource))
-            venues_df: pd.DataFrame = pd.concat(venues_dfs, axis=0)
-            tf_df: pd.DataFrame = pd.concat(tf_dfs, axis=0)
-            idf_df = self._calculate_idf(len(venues_df), tf_df)
-            self.db.executemany("INSERT INTO venue (type, hash, name, qualis, extra) "
-                                "VALUES (?, ?, ?, ?, ?)", venues_df.itertuples(index=False))
-            self.db.executemany("INSERT INTO inv_doc_frequency (token, idf) "
-                                "VALUES (?, ?)", idf_df.itertuples(index=False))
-            self.db.executemany("INSERT INTO term_frequency (token, venue_hash, venue_type, tf) "
-                                "VALUES (?, ?, ?, ?)", tf_df.itertuples(index=False))
-
-    def _read_data_source(self, src: DataSource) -> tuple[pd.DataFrame, pd.DataFrame]:
+        for statement in sql.split(";"):
+            if statement.strip():
+                db.execute(statement)
+
+    def _store_index(
+        self, venues: list[tuple] | None = None, tokens: list[list[str]] | None = None
+    ):
+        """Constroi o banco de dados do índice.
+
+        Os dados são carregados em um arquivo temporário, em uma única
+        transação, sem journal e sem sincronização com o disco, e os índices
+        das tabelas são criados apenas após a carga. Vias de publicação e
+        termos são identificados por inteiros, que compõem a chave da tabela
+        de TFs, armazenada em ordem de termo (`WITHOUT ROWID`); o hash do nome
+        é mantido apenas como chave única da via de publicação. O arquivo substitui o
+        banco de dados publicado apenas se a construção for concluída.
+        Deve ser chamado sob a trava do índice.
+
+        Parâmetros
+        ----------
+        venues : list[tuple], opcional
+            Vias de publicação já lidas por `_read_data_sources`.
+        tokens : list[list[str]], opcional
+            Tokens do nome de cada via de publicação.
+        """
+        if venues is None or tokens is None:
+            venues, tokens = self._read_data_sources()
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        vocab, doc_ids, token_ids, tf, idf = self._calculate_frequencies(tokens)
+        # as TFs são inseridas na ordem da chave primária (termo, via)
+        order = np.lexsort((doc_ids, token_ids))
+        postings = zip(token_ids[order].tolist(), doc_ids[order].tolist(), tf[order].tolist())
+        tmp_path = self.artifact_path("index.db.tmp")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        db = self._connect_rw(tmp_path)
+        try:
+            self._execute_sql(db, "create.sql")
+            db.executemany("INSERT INTO venue (id, type, hash, name, qualis, extra, issn, acronym) "
+                           "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                           ((i, *v) for i, v in enumerate(venues)))
+            db.executemany("INSERT INTO inv_doc_frequency (id, token, idf) "
+                           "VALUES (?, ?, ?)", zip(range(len(vocab)), vocab, idf.tolist()))
+            db.executemany("INSERT INTO term_frequency (token_id, venue_id, tf) "
+                           "VALUES (?, ?, ?)", postings)
+            self._execute_sql(db, "create_indexes.sql")
+            self._stamp_build(db)
+            db.execute(f"PRAGMA user_version = {self.schema_version}")
+            db.execute("COMMIT")
+        except BaseException:
+            db.close()
+            os.remove(tmp_path)
+            raise
+        db.close()
+        self._publish(tmp_path)
+
+    @staticmethod
+    def _connect_rw(fp: str) -> sqlite3.Connection:
+        """Abre uma conexão de escrita com um banco de dados temporário,
+        sem journal e sem sincronização com o disco, e inicia uma transação."""
+        db = sqlite3.connect(fp, isolation_level=None)
+        db.execute("PRAGMA journal_mode = OFF")
+        db.execute("PRAGMA synchronous = OFF")
+        db.execute("BEGIN")
+        return db
+
+    @staticmethod
+    def _stamp_build(db: sqlite3.Connection):
+        """Grava um novo identificador de construção no banco de dados
+        (veja `build_id`)."""
+        db.execute("DELETE FROM build")
+        db.execute("INSERT INTO build (id) VALUES (?)", (uuid.uuid4().hex,))
+
+    def _publish(self, tmp_path: str):
+        """Grava em disco um banco de dados temporário e o renomeia
+        atomicamente para o caminho do banco de dados publicado."""
+        with open(tmp_path, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._db_path())
+
+    def _update_index(self):
+        """Atualiza o banco de dados do índice a partir das fontes de dados.
+
+        As vias de publicação são comparadas às armazenadas pelo seu tipo e
+        hash, e apenas as inseridas, removidas ou alteradas são escritas,
+        junto de suas TFs. Se a quantidade de vias de publicação não mudar,
+        a IDF é recalculada apenas para os termos das vias inseridas ou
+        removidas; caso contrário, todas as IDFs mudam e são recalculadas a
+        partir das frequências armazenadas. O índice é reconstruído por
+        completo se não existir, tiver outra versão de esquema ou se a fração
+        de vias alteradas exceder `rebuild_threshold`. As alterações são
+        feitas em uma cópia do banco de dados, que então o substitui. Deve
+        ser chamado sob a trava do índice.
+        """
+        if self._stored_version() != self.schema_version:
+            with profiling.stage("index.rebuild"):
+                self._store_index()
+            return
+        venues, tokens = self._read_data_sources()
+        new = {(v[0], v[1]): (v, t) for v, t in zip(venues, tokens)}
+        tmp_path = self.artifact_path("index.db.tmp")
+        shutil.copyfile(self._db_path(), tmp_path)
+        db = self._connect_rw(tmp_path)
+        try:
+            ids = {}
+            stored = {}
+            for venue_id, *row in db.execute(
+                "SELECT id, type, hash, name, qualis, extra, issn, acronym FROM venue"
+            ):
+                ids[(row[0], row[1])] = venue_id
+                stored[(row[0], row[1])] = tuple(row)
+            deleted = [stored[k] for k in stored.keys() - new.keys()]
+            inserted = [new[k] for k in new.keys() - stored.keys()]
+            updated = [
+                new[k][0] for k in new.keys() & stored.keys() if new[k][0] != stored[k]
+            ]
+            changes = len(deleted) + len(inserted) + len(updated)
+            if changes > self.rebuild_threshold * len(stored):
+                db.execute("ROLLBACK")
+                db.close()
+                os.remove(tmp_path)
+                with profiling.stage("index.rebuild"):
+                    self._store_index(venues, tokens)
+                return
+            if changes == 0:
+                db.execute("ROLLBACK")
+                db.close()
+                os.remove(tmp_path)
+                os.utime(self._db_path())
+                return
+            token_ids = dict(db.execute("SELECT token, id FROM inv_doc_frequency"))
+            touched = set()
+            for venue_type, venue_hash, name, *_ in deleted:
+                venue_id = ids[(venue_type, venue_hash)]
+                venue_tokens = {token_ids[t] for t in self.tokenize(name)}
+                touched.update(venue_tokens)
+                db.execute("DELETE FROM venue WHERE id = ?", (venue_id,))
+                db.executemany("DELETE FROM term_frequency WHERE token_id = ? AND venue_id = ?",
+                               ((t, venue_id) for t in venue_tokens))
+            next_token_id = max(token_ids.values(), default=-1) + 1
+            for venue, venue_tokens in inserted:
+                for t in venue_tokens:
+                    if t not in token_ids:
+                        token_ids[t] = next_token_id
+                        next_token_id += 1
+                        db.execute("INSERT INTO inv_doc_frequency (id, token, idf) "
+                                   "VALUES (?, ?, 0)", (token_ids[t], t))
+                touched.update(token_ids[t] for t in venue_tokens)
+                venue_id = db.execute("INSERT INTO venue (type, hash, name, qualis, extra, issn, "
+                                      "acronym) VALUES (?, ?, ?, ?, ?, ?, ?)", venue).lastrowid
+                db.executemany("INSERT INTO term_frequency (token_id, venue_id, tf) "
+                               "VALUES (?, ?, ?)",
+                               ((token_ids[t], venue_id, c / len(venue_tokens))
+                                for t, c in Counter(venue_tokens).items()))
+            db.executemany("UPDATE venue SET name = ?, qualis = ?, extra = ?, issn = ?, "
+                           "acronym = ? WHERE id = ?",
+                           ((*v[2:], ids[(v[0], v[1])]) for v in updated))
+            if len(new) != len(stored):
+                touched.update(token_ids.values())
+            self._store_inv_doc_frequency(db, touched, len(new))
+            self._stamp_build(db)
+            db.execute("COMMIT")
+        except BaseException:
+            db.close()
+            os.remove(tmp_path)
+            raise
+        db.close()
+        self._publish(tmp_path)
+
+    @staticmethod
+    def _store_inv_doc_frequency(db: sqlite3.Connection, token_ids: set[int], n_docs: int):
+        """Recalcula e armazena a IDF de um conjunto de termos a partir
+        das TFs armazenadas, removendo os termos que não ocorrem mais.
+
+        Parâmetros
+        ----------
+        db : sqlite3.Connection
+            Conexão com o banco de dados, em uma transação.
+        token_ids : set[int]
+            Identificadores dos termos cuja IDF deve ser recalculada.
+        n_docs : int
+            Quantidade total de vias de publicação.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        token_ids = sorted(token_ids)
+        counts = np.fromiter(
+            (
+                db.execute("SELECT COUNT(*) FROM term_frequency WHERE token_id = ?", (t,))
+                .fetchone()[0]
+                for t in token_ids
+            ),
+            dtype=np.int64,
+            count=len(token_ids),
+        )
+        with np.errstate(divide="ignore"):
+            idf = np.log2(n_docs / counts)
+        db.executemany("DELETE FROM inv_doc_frequency WHERE id = ?",
+                       ((t,) for t, c in zip(token_ids, counts.tolist()) if c == 0))
+        db.executemany("UPDATE inv_doc_frequency SET idf = ? WHERE id = ?",
+                       ((i, t) for t, c, i in zip(token_ids, counts.tolist(), idf.tolist())
+                        if c > 0))
+
+    def _read_data_sources(self) -> tuple[list[tuple], list[list[str]]]:
+        """Lê todas as fontes de dados disponíveis para a área de avaliação.
+        Veja `_read_data_source`."""
+        venues, tokens = [], []
+        for src in self.service.sources():
+            src_venues, src_tokens = self._read_data_source(src)
+            venues += src_venues
+            tokens += src_tokens
+        return venues, tokens
+
+    def _read_data_source(self, src: DataSource) -> tuple[list[tuple], list[list[str]]]:
         """Lê uma fonte de dados com suas vias de publicação e
         os termos de busca que compõem cada uma.
         
@@ -72,36 +441,45 @@ class Index:
         
         Retorna
         -------
-        tuple[pandas.DataFrame,pandas.DataFrame]
-            Um DataFrame contendo as vias de publicação e
-            outro contendo a TF (term frequency) dos termos.
+        tuple[list[tuple], list[list[str]]]
+            As vias de publicação, como tuplas
+            `(type, hash, name, qualis, extra, issn, acronym)`,
+            e os tokens do nome de cada uma delas.
         """
         df = self.service.get(src)
         extra_cols = [c for c in df.columns if c not in {"name", "qualis"}]
-        venue_type = VenueType[src.name]
+        venue_type = VenueType[src.name].value
         extra = reduce(lambda a, b: a + b, [df[c] for c in extra_cols])
-        tokens_df = (
-            df.assign(extra=extra)[["name", "qualis", "extra"]]
-            .assign(tokens=lambda _df: _df["name"].apply(self.tokenize))
-            .assign(hash=lambda _df: _df["tokens"].apply(lambda tk: self.hash("-".join(tk))))
-            .assign(type=venue_type.value)
-            .drop_duplicates(subset=["hash"])
+        issns = (
+            [self.normalize_issn(str(i), validate=False) for i in df["issn"]]
+            if "issn" in df.columns
+            else [None] * len(df)
         )
-        freq_df = (
-            tokens_df.explode("tokens")
-            .groupby(["name", "qualis", "extra", "hash", "type"])["tokens"]
-            .value_counts(normalize=True).reset_index()
-            .rename({"proportion": "tf", "tokens": "token"}, axis=1)
+        acronyms = (
+            [self.normalize_acronym(a) if isinstance(a, str) else None for a in df["acronym"]]
+            if "acronym" in df.columns
+            else [None] * len(df)
         )
-        venues_df = tokens_df[["type", "hash", "name", "qualis", "extra"]]
-        termf_df = freq_df[["token", "hash", "type", "tf"]]
-        return venues_df, termf_df
-
-    __tokenizer_pattern = re.compile(r"[\w'\u2019]+", re.UNICODE | re.MULTILINE | re.DOTALL)
+        venues, tokens, hashes = [], [], set()
+        names = df["name"].tolist()
+        for name, name_tokens, qualis, ex, issn, acronym in zip(
+            names, self.tokenize_many(names), df["qualis"], extra, issns, acronyms
+        ):
+            name_hash = self.hash("-".join(name_tokens))
+            if name_hash in hashes:
+                continue
+            hashes.add(name_hash)
+            venues.append((venue_type, name_hash, name, qualis, ex, issn, acronym))
+            tokens.append(name_tokens)
+        return venues, tokens
 
     def tokenize(self, text: str) -> list[str]:
         """Separa uma string em seus tokens constituintes, normalizados
         para conter apenas caracteres alfanuméricos em caixa baixa.
+
+        Cada caractere é normalizado individualmente por uma tabela de
+        tradução preenchida sob demanda, e os resultados dos textos mais
+        recentes são mantidos em cache.
         
         Parâmetros
         ----------
@@ -113,36 +491,127 @@ class Index:
         list[str]
             Lista de tokens resultantes.
         """
-        tokens = self.__tokenizer_pattern.findall(text)
-        tokens = (unicodedata.normalize("NFKD", token.lower()) for token in tokens)
-        tokens = (re.sub(r"[^a-z0-9]", "", token) for token in tokens)
-        return list(tokens)
+        profiler = profiling.active
+        if profiler is None:
+            return list(_tokenize(text))
+        start = time.perf_counter()
+        tokens = list(_tokenize(text))
+        profiler.record("tokenize", time.perf_counter() - start)
+        return tokens
+
+    def tokenize_many(self, texts: Iterable[str]) -> list[list[str]]:
+        """Separa cada string de uma sequência em seus tokens constituintes.
+        Veja `tokenize`.
+
+        Parâmetros
+        ----------
+        texts : Iterable[str]
+            Textos a ser tokenizados, como uma lista ou `pandas.Series`.
+
+        Retorna
+        -------
+        list[list[str]]
+            Lista de tokens de cada texto, na mesma ordem.
+        """
+        profiler = profiling.active
+        if profiler is None:
+            return [list(_tokenize(text)) for text in texts]
+        start = time.perf_counter()
+        tokens = [list(_tokenize(text)) for text in texts]
+        profiler.record("tokenize", time.perf_counter() - start, len(tokens))
+        return tokens
     
+    __issn_pattern = re.compile(r"^(\d{4})-?(\d{3}[\dX])$")
+
+    @staticmethod
+    def normalize_issn(text: str, validate: bool = True) -> str | None:
+        """Normaliza um ISSN para o formato `NNNN-NNNC`.
+
+        Parâmetros
+        ----------
+        text : str
+            ISSN, com ou sem hífen e espaços.
+        validate : bool, opcional
+            Se o dígito verificador deve ser validado.
+
+        Retorna
+        -------
+        str | None
+            ISSN normalizado, ou None se for inválido.
+        """
+        m = Index.__issn_pattern.match("".join(text.split()).upper())
+        if m is None:
+            return None
+        digits = m.group(1) + m.group(2)
+        if validate:
+            total = sum(int(d) * (8 - i) for i, d in enumerate(digits[:7]))
+            check = (11 - total % 11) % 11
+            if digits[7] != ("X" if check == 10 else str(check)):
+                return None
+        return f"{digits[:4]}-{digits[4:]}"
+
+    __acronym_word_pattern = re.compile(r"\w+")
+    __acronym_ignored_pattern = re.compile(r"^\d+(st|nd|rd|th|a|o)?$")
+    __acronym_year_pattern = re.compile(r"(?<=[a-z])(19|20)\d{2}$")
+
+    @staticmethod
+    def normalize_acronym(text: str) -> str | None:
+        """Normaliza a sigla de uma via de publicação, removendo anos,
+        ordinais e números de edição (como em "SBES 2023", "ICSE'23" ou
+        "15th SBES") e concatenando as palavras restantes em caixa baixa.
+
+        Parâmetros
+        ----------
+        text : str
+            Sigla, possivelmente acompanhada de ano ou edição.
+
+        Retorna
+        -------
+        str | None
+            Sigla normalizada, ou None se não restar nenhum caractere.
+        """
+        words = (
+            w.translate(_folding_table) for w in Index.__acronym_word_pattern.findall(text)
+        )
+        words = [w for w in words if w and not Index.__acronym_ignored_pattern.match(w)]
+        if words:
+            words[-1] = Index.__acronym_year_pattern.sub("", words[-1])
+        return "".join(words) or None
+
     def hash(self, text: str) -> bytes:
         """Atalho para criar o hash MD5 de uma string."""
         return hashlib.md5(text.encode()).digest()
 
-    def _calculate_idf(self, n: int, df: pd.DataFrame) -> pd.DataFrame:
-        """Calcula a IDF (inverse document frequency) de cada termo
-        presente nos nomes das vias de publicação.
-        
+    @staticmethod
+    def _calculate_frequencies(
+        tokens: list[list[str]],
+    ) -> tuple[list[str], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Calcula a TF (term frequency) dos termos em cada via de publicação
+        e a IDF (inverse document frequency) de cada termo.
+
         Parâmetros
         ----------
-        n : int
-            Quantidade total de vias de publicação.
-        df : pandas.DataFrame
-            DataFrame contendo os termos e os identificadores das vias.
-        
+        tokens : list[list[str]]
+            Tokens do nome de cada via de publicação.
+
         Retorna
         -------
-        pandas.DataFrame
-            DataFrame contendo a IDF.
+        tuple[list[str], numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            O vocabulário de termos, os pares (via de publicação, termo),
+            como dois arrays de índices, a TF de cada par e a IDF de cada termo.
         """
-        return (
-            df[["token", "hash", "type"]]
-            .groupby("token")["token"]
-            .count().rename("count").reset_index()
-            .sort_values(by="count")
-            .assign(idf=lambda _df: log2(n / _df["count"]))
-            [["token", "idf"]]
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        token_ids: dict[str, int] = {}
+        flat = np.fromiter(
+            (token_ids.setdefault(t, len(token_ids)) for t in chain.from_iterable(tokens)),
+            dtype=np.int64,
         )
+        vocab = list(token_ids)
+        lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+        docs = np.repeat(np.arange(len(tokens), dtype=np.int64), lengths)
+        pairs, counts = np.unique(docs * len(vocab) + flat, return_counts=True)
+        pair_docs, pair_tokens = np.divmod(pairs, len(vocab))
+        tf = counts / lengths[pair_docs]
+        idf = np.log2(len(tokens) / np.bincount(pair_tokens, minlength=len(vocab)))
+        return vocab, pair_docs, pair_tokens, tf, idf
@@ -0,0 +1,45 @@
+"""Trava exclusiva entre processos baseada em arquivo."""
+import os
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """Trava exclusiva entre processos baseada em arquivo, usada como
+    gerenciador de contexto. A trava é liberada pelo sistema operacional
+    se o processo que a detém terminar.
+
+    Parâmetros
+    ----------
+    fp : str
+        Caminho do arquivo de trava, criado se não existir.
+    """
+
+    def __init__(self, fp: str):
+        self.fp = fp
+        self.__fd: int | None = None
+
+    def __enter__(self) -> "FileLock":
+        self.__fd = os.open(self.fp, os.O_RDWR | os.O_CREAT, 0o644)
+        if os.name == "nt":
+            while True:
+                try:
+                    msvcrt.locking(self.__fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            fcntl.flock(self.__fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *_):
+        if os.name == "nt":
+            os.lseek(self.__fd, 0, os.SEEK_SET)
+            msvcrt.locking(self.__fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self.__fd, fcntl.LOCK_UN)
+        os.close(self.__fd)
+        self.__fd = None
@@ -1,9 +1,15 @@
-"""Classes de modelo para o módulo de índice."""
-from enum import Enum
+"""Classes de modelo para o módulo de índice.
 
-from pydantic import BaseModel, Field
+Os modelos com validação (`Venue`, `InvDocFrequency` e `TermFrequency`)
+são definidos em `qual_qualis.index.schema` e importados sob demanda,
+de forma que o pydantic só é carregado quando necessário.
+"""
+from __future__ import annotations
+from enum import Enum
+from typing import TYPE_CHECKING, NamedTuple
 
-term_token_field = Field(pattern=r"^[a-z0-9]+$")
+if TYPE_CHECKING:
+    from qual_qualis.index.schema import InvDocFrequency, TermFrequency, Venue
 
 
 class VenueType(int, Enum):
@@ -27,27 +33,47 @@ class Qualis(str, Enum):
     C = "C"
 
 
-class Venue(BaseModel):
-    """Modelo de via de publicação."""
+_venue_types = {t.value: t for t in VenueType}
+_qualis = {q.value: q for q in Qualis}
+
+
+class VenueRecord(NamedTuple):
+    """Via de publicação resultante de uma busca.
+
+    Representação leve, sem validação, usada internamente pelas estratégias
+    de busca para dados lidos do próprio índice. Use `to_model` para obter
+    o modelo `Venue` validado. O campo `score` contém a pontuação atribuída
+    pela busca aproximada, e é None para correspondências exatas. O campo
+    `area` identifica a área de avaliação da classificação nas buscas em
+    várias áreas (`AreaSearch`), e é None nas demais.
+    """
 
     type: VenueType
     hash: bytes
     name: str
     qualis: Qualis
     extra: str
+    score: float | None = None
+    area: str | None = None
 
+    @classmethod
+    def from_row(cls, row: tuple, score: float | None = None) -> VenueRecord:
+        """Cria uma via de publicação a partir de uma linha do índice,
+        na ordem `(type, hash, name, qualis, extra)`."""
+        t, h, name, qualis, extra = row
+        return tuple.__new__(cls, (_venue_types[t], h, name, _qualis[qualis], extra, score, None))
 
-class InvDocFrequency(BaseModel):
-    """Modelo IDF."""
+    def to_model(self) -> Venue:
+        """Converte para o modelo `Venue`, com validação."""
+        # pylint: disable=import-outside-toplevel
+        from qual_qualis.index.schema import Venue
 
-    token: str = term_token_field
-    idf: float = 0.0
+        return Venue(**self._asdict())
 
 
-class TermFrequency(BaseModel):
-    """Modelo TF."""
+def __getattr__(name: str):
+    if name in {"Venue", "InvDocFrequency", "TermFrequency"}:
+        from qual_qualis.index import schema  # pylint: disable=import-outside-toplevel
 
-    term_token: str = term_token_field
-    venue_type: VenueType
-    venue_hash: int
-    tf: float = 0.0
+        return getattr(schema, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
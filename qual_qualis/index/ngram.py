@@ -0,0 +1,210 @@
+"""Matriz TF-IDF de n-gramas de caracteres para buscas por nomes
+abreviados."""
+from __future__ import annotations
+from collections import Counter
+from itertools import chain
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from qual_qualis.index.model import VenueRecord, VenueType
+
+if TYPE_CHECKING:
+    from qual_qualis.index.index import Index
+
+
+def char_ngrams(tokens: list[str], n: int = 3) -> list[str]:
+    """Retorna os n-gramas de caracteres de cada token, delimitado por
+    espaços, de forma que prefixos e sufixos sejam n-gramas próprios
+    (como " so" e "sof" em "softw" e "software").
+
+    Parâmetros
+    ----------
+    tokens : list[str]
+        Tokens normalizados, como os de `Index.tokenize`.
+    n : int, opcional
+        Quantidade de caracteres de cada n-grama.
+
+    Retorna
+    -------
+    list[str]
+        N-gramas, com repetições, na ordem em que ocorrem.
+    """
+    grams = []
+    for t in tokens:
+        padded = f" {t} "
+        grams += [padded[i : i + n] for i in range(len(padded) - n + 1)]
+    return grams
+
+
+class NgramMatrix:
+    """Matriz esparsa de pesos TF-IDF de n-gramas de caracteres no formato
+    CSR, em que cada linha corresponde a um n-grama e cada coluna a uma via
+    de publicação, na ordem do retrato do índice.
+
+    Os vetores de cada via de publicação são normalizados, e a pontuação de
+    uma busca é a similaridade de cosseno entre o seu vetor e o de cada via.
+    As buscas de um lote formam uma segunda matriz esparsa, e o produto das
+    duas é calculado de uma vez, expandindo as linhas dos n-gramas de todas
+    as buscas e somando as contribuições por busca e via de publicação.
+
+    Parâmetros
+    ----------
+    index : Index
+        Índice de cujo retrato (`Index.snapshot`) os pesos são carregados.
+    """
+
+    n = 3
+    """Quantidade de caracteres de cada n-grama."""
+
+    batch_cells = 1 << 21
+    """Quantidade máxima de pontuações (buscas × vias de publicação)
+    calculadas de uma vez por `top_k_many`."""
+
+    def __init__(self, index: Index):
+        snapshot = index.snapshot()
+        self.venues = snapshot.venues
+        self.types = np.asarray(snapshot.types)
+        self.weights: dict[str, tuple[int, float]] = {
+            g: (i, idf) for i, (g, idf) in enumerate(zip(snapshot.ngrams, snapshot.ngram_idf.tolist()))
+        }
+        self.indptr = np.asarray(snapshot.ngram_indptr)
+        self.indices = np.asarray(snapshot.ngram_indices)
+        self.data = np.asarray(snapshot.ngram_data)
+        self.unknown_idf = float(np.log2(len(self.venues) + 1))
+
+    @classmethod
+    def build(cls, tokens: list[list[str]]) -> dict[str, np.ndarray | list[str]]:
+        """Calcula a matriz a partir dos tokens do nome de cada via de
+        publicação, na ordem das colunas.
+
+        Parâmetros
+        ----------
+        tokens : list[list[str]]
+            Tokens do nome de cada via de publicação.
+
+        Retorna
+        -------
+        dict[str, numpy.ndarray | list[str]]
+            Os n-gramas em ordem alfabética (`ngrams`), a IDF de cada um
+            (`idf`) e a matriz no formato CSR (`indptr`, `indices` e `data`).
+        """
+        counts = [Counter(char_ngrams(t, cls.n)) for t in tokens]
+        ngrams = sorted(set(chain.from_iterable(counts)))
+        ngram_ids = {g: i for i, g in enumerate(ngrams)}
+        lengths = np.fromiter(map(len, counts), dtype=np.int64, count=len(counts))
+        docs = np.repeat(np.arange(len(counts), dtype=np.int32), lengths)
+        rows = np.fromiter(
+            (ngram_ids[g] for c in counts for g in c), dtype=np.int64, count=len(docs)
+        )
+        tf = np.fromiter(
+            (f for c in counts for f in c.values()), dtype=np.float64, count=len(docs)
+        )
+        idf = (
+            np.log2(len(counts) / np.bincount(rows, minlength=len(ngrams)))
+            if len(ngrams)
+            else np.zeros(0)
+        )
+        data = tf * idf[rows]
+        norms = np.sqrt(np.bincount(docs, weights=data**2, minlength=len(counts)))
+        data /= np.where(norms[docs] > 0, norms[docs], 1.0)
+        order = np.lexsort((docs, rows))
+        indptr = np.zeros(len(ngrams) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(ngrams)), out=indptr[1:])
+        return {
+            "ngrams": ngrams,
+            "idf": idf,
+            "indptr": indptr,
+            "indices": docs[order],
+            "data": data[order],
+        }
+
+    def vectorize(self, tokens: list[str]) -> tuple[list[int], list[float]]:
+        """Calcula o vetor normalizado de uma busca. N-gramas ausentes do
+        índice contam para a norma com a IDF de um n-grama de uma única via,
+        de forma que buscas com muitos n-gramas desconhecidos pontuam menos.
+
+        Retorna
+        -------
+        tuple[list[int], list[float]]
+            Os n-gramas conhecidos da busca e seus pesos.
+        """
+        ids, weights, norm = [], [], 0.0
+        for g, count in Counter(char_ngrams(tokens, self.n)).items():
+            i, idf = self.weights.get(g, (None, self.unknown_idf))
+            w = count * idf
+            norm += w * w
+            if i is not None:
+                ids.append(i)
+                weights.append(w)
+        if norm > 0:
+            norm = norm**-0.5
+            weights = [w * norm for w in weights]
+        return ids, weights
+
+    def top_k_many(
+        self, queries: list[tuple[list[str], int, VenueType | None]]
+    ) -> list[list[VenueRecord]]:
+        """Retorna as vias de publicação de maior similaridade com cada busca,
+        em ordem decrescente de pontuação, com empates desfeitos pela ordem
+        das vias. Vias sem nenhum n-grama em comum com a busca são ignoradas.
+
+        Parâmetros
+        ----------
+        queries : list[tuple[list[str], int, VenueType | None]]
+            Tokens, quantidade de resultados e tipo de via de publicação
+            de cada busca.
+
+        Retorna
+        -------
+        list[list[VenueRecord]]
+            Resultados de cada busca, na mesma ordem.
+        """
+        results: list[list[VenueRecord]] = [[] for _ in queries]
+        vectors = [self.vectorize(tokens) for tokens, _, _ in queries]
+        pending = [j for j, (ids, _) in enumerate(vectors) if ids and queries[j][1] > 0]
+        n = len(self.venues)
+        size = max(1, self.batch_cells // max(1, n))
+        for part in (pending[i : i + size] for i in range(0, len(pending), size)):
+            ids = np.fromiter((i for j in part for i in vectors[j][0]), dtype=np.int64)
+            weights = np.fromiter((w for j in part for w in vectors[j][1]), dtype=np.float64)
+            rows = np.repeat(np.arange(len(part)), [len(vectors[j][0]) for j in part])
+            # expande a linha de cada n-grama de cada busca: posições das
+            # entradas em `indices` e `data` e a busca a que pertencem
+            starts, lengths = self.indptr[ids], self.indptr[ids + 1] - self.indptr[ids]
+            offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+            positions = offsets + np.arange(lengths.sum())
+            cells = np.repeat(rows * n, lengths) + self.indices[positions]
+            contributions = np.repeat(weights, lengths) * self.data[positions]
+            scores = np.bincount(cells, weights=contributions, minlength=len(part) * n)
+            scores = scores.reshape(len(part), n)
+            for venue_type in {queries[j][2] for j in part} - {None}:
+                selected = [r for r, j in enumerate(part) if queries[j][2] == venue_type]
+                scores[selected] *= self.types == venue_type.value
+            for k in {queries[j][1] for j in part}:
+                selected = [r for r, j in enumerate(part) if queries[j][1] == k]
+                for r, venues in zip(selected, self.__top_k(scores[selected], k)):
+                    results[part[r]] = venues
+        return results
+
+    def __top_k(self, scores: np.ndarray, k: int) -> list[list[VenueRecord]]:
+        """Seleciona as `k` vias de publicação de maior pontuação positiva
+        de cada linha, desfazendo empates pela ordem das vias."""
+        n = scores.shape[1]
+        if k < n:
+            kth = np.partition(scores, n - k, axis=1)[:, n - k]
+            keep = (scores >= kth[:, None]) & (scores > 0)
+        else:
+            keep = scores > 0
+        rows, cols = np.nonzero(keep)
+        values = scores[rows, cols]
+        order = np.lexsort((cols, -values, rows))
+        rows, cols, values = rows[order], cols[order], values[order]
+        # posição de cada candidata entre as da sua linha
+        first = np.searchsorted(rows, rows)
+        rank = np.arange(len(rows)) - first
+        top = rank < k
+        results: list[list[VenueRecord]] = [[] for _ in range(len(scores))]
+        for r, c, v in zip(rows[top].tolist(), cols[top].tolist(), values[top].tolist()):
+            results[r].append(self.venues[c]._replace(score=v))
+        return results
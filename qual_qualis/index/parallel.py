@@ -0,0 +1,90 @@
+"""Buscas em lote distribuídas entre processos."""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing as mp
+from typing import Any
+
+from qual_qualis.index.model import VenueRecord
+from qual_qualis.index.search import SearchStrategy
+
+_strategies: list[SearchStrategy] = []
+"""Estratégias de busca do processo, recriadas na sua inicialização."""
+
+
+def _init_worker(strategies: list[SearchStrategy]):
+    global _strategies  # pylint: disable=global-statement
+    _strategies = strategies
+
+
+def _apply_batch(queries: list[dict[str, Any]]) -> list[list[VenueRecord]]:
+    return SearchStrategy.apply_batch(_strategies, queries)
+
+
+class SearchPool:
+    """Conjunto de processos que resolvem buscas em lote, como
+    `SearchStrategy.apply_batch`, contornando o GIL nas buscas, que
+    consistem principalmente em código Python.
+
+    Cada processo recebe uma cópia das estratégias de busca, que abre o
+    índice em modo somente leitura e recria suas estruturas na
+    inicialização (veja `SearchStrategy`), de forma que o conjunto só
+    compensa em arquivos grandes. Os processos são iniciados na primeira
+    busca e encerrados por `close`. As etapas executadas nos processos não
+    são registradas pelo perfilador (`qual_qualis.profiling`).
+
+    Parâmetros
+    ----------
+    strategies : list[SearchStrategy]
+        Estratégias de busca, na ordem em que são aplicadas.
+    processes : int
+        Quantidade de processos.
+    chunk_size : int, opcional
+        Quantidade máxima de buscas enviadas a um processo de uma vez.
+    """
+
+    def __init__(self, strategies: list[SearchStrategy], processes: int, chunk_size: int = 128):
+        self.strategies = list(strategies)
+        self.processes = max(1, processes)
+        self.chunk_size = max(1, chunk_size)
+        self.__executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> SearchPool:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def apply_batch(self, queries: list[dict[str, Any]]) -> list[list[VenueRecord]]:
+        """Resolve várias buscas, divididas em partes de até `chunk_size`
+        buscas distribuídas entre os processos.
+
+        Parâmetros
+        ----------
+        queries : list[dict[str, Any]]
+            Argumentos de cada busca.
+
+        Retorna
+        -------
+        list[list[VenueRecord]]
+            Resultados de cada busca, na mesma ordem.
+        """
+        if not queries:
+            return []
+        if self.__executor is None:
+            # processos novos em vez de cópias deste, que compartilhariam
+            # as conexões com o banco de dados
+            self.__executor = ProcessPoolExecutor(
+                self.processes,
+                mp_context=mp.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.strategies,),
+            )
+        size = max(1, min(self.chunk_size, -(-len(queries) // self.processes)))
+        parts = [queries[i : i + size] for i in range(0, len(queries), size)]
+        return [venues for part in self.__executor.map(_apply_batch, parts) for venues in part]
+
+    def close(self):
+        """Encerra os processos."""
+        if self.__executor is not None:
+            executor, self.__executor = self.__executor, None
+            executor.shutdown()
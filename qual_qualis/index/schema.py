@@ -0,0 +1,34 @@
+"""Modelos com validação (pydantic) para o módulo de índice."""
+from pydantic import BaseModel, Field
+
+from qual_qualis.index.model import Qualis, VenueType
+
+term_token_field = Field(pattern=r"^[a-z0-9]+$")
+
+
+class Venue(BaseModel):
+    """Modelo de via de publicação."""
+
+    type: VenueType
+    hash: bytes
+    name: str
+    qualis: Qualis
+    extra: str
+    score: float | None = None
+    area: str | None = None
+
+
+class InvDocFrequency(BaseModel):
+    """Modelo IDF."""
+
+    id: int
+    token: str = term_token_field
+    idf: float = 0.0
+
+
+class TermFrequency(BaseModel):
+    """Modelo TF."""
+
+    token_id: int
+    venue_id: int
+    tf: float = 0.0
@@ -2,124 +2,842 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from enum import Enum
-from functools import reduce
-
-from Levenshtein import distance
-from pybktree import BKTree
+import os
+import pickle
+import time
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterator, Sequence, TypeVar
 
+from qual_qualis import profiling
+from qual_qualis.index.cache import QueryCache
 from qual_qualis.index.index import Index
-from qual_qualis.index.model import Venue, VenueType
+from qual_qualis.index.model import VenueRecord, VenueType
+
+if TYPE_CHECKING:
+    from pybktree import BKTree
+    from qual_qualis.index.parallel import SearchPool
+
+T = TypeVar("T")
 
 
 class SearchStrategyKey(str, Enum):
     ISSN = "issn"
     EXACT = "exact"
+    ACRONYM = "acronym"
     FUZZY = "fuzzy"
+    NGRAM = "ngram"
+
+    @classmethod
+    def defaults(cls) -> list[SearchStrategyKey]:
+        """Estratégias usadas quando nenhuma é especificada. A busca por
+        n-gramas, que sempre retorna resultados, deve ser escolhida
+        explicitamente."""
+        return [cls.ISSN, cls.EXACT, cls.ACRONYM, cls.FUZZY]
+
+
+class SearchBackend(str, Enum):
+    """Mecanismos de busca: consultas SQL ao índice a cada busca ou
+    estruturas carregadas em memória na inicialização da estratégia, a
+    partir do retrato do índice (`Index.snapshot`), sem consultas SQL."""
+
+    SQL = "sql"
+    MEMORY = "memory"
 
 
 class SearchStrategy(ABC):
-    """Estratégia de busca no índice."""
+    """Estratégia de busca no índice.
+
+    Estratégias são serializadas (`pickle`) pelos parâmetros com que foram
+    criadas, de forma que uma cópia enviada a outro processo reabre o índice
+    e recria suas estruturas (veja `SearchPool`)."""
+
+    key: SearchStrategyKey | None = None
+    """Chave da estratégia, usada para identificar suas buscas no
+    perfilador (`qual_qualis.profiling`)."""
+
+    short_circuit = False
+    """Se resultados desta estratégia dispensam as estratégias seguintes
+    em `apply_many`."""
+
+    max_parameters = 999
+    """Quantidade máxima de parâmetros de cada consulta SQL de `search_many`."""
 
     def __init__(self, index: Index):
         self.index = index
 
     @abstractmethod
-    def search(self, **kwargs) -> list[Venue]:
+    def search(self, **kwargs) -> list[VenueRecord]:
         """Busca pelas vias de publicação que melhor correspondem
         aos critérios de busca."""
 
+    def search_many(self, queries: list[dict[str, Any]]) -> list[list[VenueRecord]]:
+        """Realiza várias buscas, cada uma descrita pelos argumentos de
+        `search`. A implementação padrão realiza as buscas uma a uma;
+        subclasses as resolvem em lote.
+
+        Parâmetros
+        ----------
+        queries : list[dict[str, Any]]
+            Argumentos de cada busca.
+
+        Retorna
+        -------
+        list[list[VenueRecord]]
+            Resultados de cada busca, na mesma ordem.
+        """
+        return [self.search(**q) for q in queries]
+
+    def signature(self) -> str:
+        """Identifica a estratégia e os parâmetros que afetam seus resultados."""
+        return type(self).__name__
+
+    def _stage(self) -> str:
+        """Nome da etapa das buscas desta estratégia no perfilador."""
+        return f"strategy.{self.key.value if self.key is not None else type(self).__name__}"
+
+    def _profiled_search(self, profiler: profiling.Profiler, kwargs: dict[str, Any]) -> list[VenueRecord]:
+        """Realiza uma busca por `search`, registrando sua duração e
+        a quantidade de resultados no perfilador."""
+        start = time.perf_counter()
+        results = self.search(**kwargs)
+        profiler.record(self._stage(), time.perf_counter() - start, rows=len(results))
+        return results
+
+    def _profiled_search_many(
+        self, profiler: profiling.Profiler, queries: list[dict[str, Any]]
+    ) -> list[list[VenueRecord]]:
+        """Realiza várias buscas por `search_many`, registrando sua duração
+        e as quantidades de buscas e de resultados no perfilador."""
+        start = time.perf_counter()
+        results = self.search_many(queries)
+        profiler.record(
+            self._stage(), time.perf_counter() - start, len(queries), sum(map(len, results))
+        )
+        return results
+
+    def _query(
+        self,
+        query: str,
+        params: Sequence[Any] = (),
+        convert: Callable[[tuple], T] = VenueRecord.from_row,
+    ) -> list[T]:
+        """Executa uma consulta SQL no índice e converte cada linha obtida.
+        Com o perfilador ativo, registra a duração da consulta (`sql`), com
+        a quantidade de linhas lidas, e a da conversão (`venues`).
+
+        Parâmetros
+        ----------
+        query : str
+            Consulta SQL.
+        params : Sequence[Any], opcional
+            Parâmetros da consulta.
+        convert : Callable[[tuple], T], opcional
+            Função que converte cada linha, por padrão em `VenueRecord`.
+
+        Retorna
+        -------
+        list[T]
+            Linhas convertidas.
+        """
+        profiler = profiling.active
+        if profiler is None:
+            with self.index.db:
+                return [convert(row) for row in self.index.db.execute(query, params)]
+        start = time.perf_counter()
+        with self.index.db:
+            rows = self.index.db.execute(query, params).fetchall()
+        fetched = time.perf_counter()
+        converted = [convert(row) for row in rows]
+        profiler.record("sql", fetched - start, rows=len(rows))
+        profiler.record("venues", time.perf_counter() - fetched, len(rows))
+        return converted
+
     @classmethod
-    def apply_many(cls, strategies: list[SearchStrategy], **kwargs) -> list[Venue]:
+    def _chunks(cls, items: list, size: int) -> Iterator[list]:
+        """Divide uma lista em partes de até `size` itens."""
+        size = max(1, size)
+        for i in range(0, len(items), size):
+            yield items[i : i + size]
+
+    @classmethod
+    def apply_many(
+        cls,
+        strategies: list[SearchStrategy],
+        cache: QueryCache | None = None,
+        **kwargs,
+    ) -> list[VenueRecord]:
         """Aplica cada uma das estratégias de busca, retornando
-        todos os resultados obtidos na mesma sequência."""
-        return sum((st.search(**kwargs) for st in strategies), [])
+        todos os resultados obtidos na mesma sequência. Se uma estratégia
+        com `short_circuit` obtiver resultados, as seguintes não são
+        aplicadas. Se um cache for informado, resultados de buscas
+        repetidas são reaproveitados."""
+        if cache is None:
+            return cls.__apply_many(strategies, **kwargs)
+        key = cache.key(tuple(st.signature() for st in strategies), **kwargs)
+        venues = cache.get(key)
+        if venues is None:
+            venues = cls.__apply_many(strategies, **kwargs)
+            cache.put(key, venues)
+        return venues
+
+    @staticmethod
+    def __apply_many(strategies: list[SearchStrategy], **kwargs) -> list[VenueRecord]:
+        venues = []
+        profiler = profiling.active
+        for st in strategies:
+            results = (
+                st.search(**kwargs) if profiler is None else st._profiled_search(profiler, kwargs)
+            )
+            venues += results
+            if results and st.short_circuit:
+                break
+        return venues
+
+    @classmethod
+    def apply_batch(
+        cls,
+        strategies: list[SearchStrategy],
+        queries: list[dict[str, Any]],
+        cache: QueryCache | None = None,
+        pool: SearchPool | None = None,
+    ) -> list[list[VenueRecord]]:
+        """Aplica as estratégias de busca a várias buscas, com os mesmos
+        resultados de `apply_many` para cada uma. Cada estratégia resolve
+        em lote, por `search_many`, as buscas ainda não encerradas por uma
+        estratégia com `short_circuit`. Buscas repetidas são resolvidas
+        uma única vez.
+
+        Parâmetros
+        ----------
+        strategies : list[SearchStrategy]
+            Estratégias de busca, na ordem em que são aplicadas.
+        queries : list[dict[str, Any]]
+            Argumentos de cada busca.
+        cache : QueryCache, opcional
+            Cache de resultados de busca.
+        pool : SearchPool, opcional
+            Conjunto de processos com cópias das mesmas estratégias. Se
+            informado, as buscas ausentes do cache são resolvidas por ele.
+
+        Retorna
+        -------
+        list[list[VenueRecord]]
+            Resultados de cada busca, na mesma ordem.
+        """
+        keys: list[Hashable] = [tuple(sorted(q.items())) for q in queries]
+        unique = list(dict.fromkeys(keys))
+        results: dict[Hashable, list[VenueRecord]] = {}
+        cache_keys: dict[Hashable, Hashable] = {}
+        if cache is not None:
+            signature = tuple(st.signature() for st in strategies)
+            for k in unique:
+                cache_keys[k] = cache.key(signature, **dict(k))
+                venues = cache.get(cache_keys[k])
+                if venues is not None:
+                    results[k] = venues
+        pending = [k for k in unique if k not in results]
+        pending_queries = [dict(k) for k in pending]
+        solved = (
+            pool.apply_batch(pending_queries)
+            if pool is not None
+            else cls.__apply_batch(strategies, pending_queries)
+        )
+        for k, venues in zip(pending, solved):
+            results[k] = venues
+            if cache is not None:
+                cache.put(cache_keys[k], venues)
+        return [results[k] for k in keys]
+
+    @staticmethod
+    def __apply_batch(
+        strategies: list[SearchStrategy], queries: list[dict[str, Any]]
+    ) -> list[list[VenueRecord]]:
+        venues: list[list[VenueRecord]] = [[] for _ in queries]
+        active = list(range(len(queries)))
+        profiler = profiling.active
+        for st in strategies:
+            if not active:
+                break
+            batch = [queries[i] for i in active]
+            results = (
+                st.search_many(batch) if profiler is None else st._profiled_search_many(profiler, batch)
+            )
+            for i, r in zip(active, results):
+                venues[i] += r
+            if st.short_circuit:
+                active = [i for i, r in zip(active, results) if not r]
+        return venues
 
     @classmethod
-    def create(cls, key: SearchStrategyKey, index: Index) -> SearchStrategy:
+    def create(
+        cls,
+        key: SearchStrategyKey,
+        index: Index,
+        backend: SearchBackend = SearchBackend.SQL,
+        max_distance: int = 2,
+    ) -> SearchStrategy:
         """Cria uma instância de estratégia com base em seu nome.
         
         Parâmetros
         ----------
         key : str
-            Nome da estratégia: "exact", "fuzzy" ou "issn".
+            Nome da estratégia: "exact", "fuzzy", "issn", "acronym" ou "ngram".
         index : Index
             Uma instância do índice de busca.
+        backend : SearchBackend, opcional
+            Mecanismo de busca.
+        max_distance : int, opcional
+            Distância de edição máxima da busca aproximada.
         """
         match key:
             case SearchStrategyKey.EXACT:
-                return ExactSearch(index)
+                return ExactSearch(index, backend)
             case SearchStrategyKey.FUZZY:
-                return FuzzySearch(index)
+                return FuzzySearch(index, backend, max_distance)
             case SearchStrategyKey.ISSN:
-                return ISSNSearch(index)
+                return ISSNSearch(index, backend)
+            case SearchStrategyKey.ACRONYM:
+                return AcronymSearch(index, backend)
+            case SearchStrategyKey.NGRAM:
+                return NgramSearch(index)
+
+
+class CascadeSearch(SearchStrategy):
+    """Aplica estratégias de busca em sequência, parando na primeira que
+    obtiver uma correspondência confiável. Resultados repetidos entre
+    estratégias, identificados por `(type, hash)`, são descartados.
+
+    Resultados sem pontuação, como os das buscas exata, por ISSN e por
+    sigla, são sempre confiáveis. Resultados pontuados, como os da busca
+    aproximada, são confiáveis se houver um único resultado ou se a
+    pontuação do primeiro superar a do segundo pela margem relativa
+    informada.
+
+    Parâmetros
+    ----------
+    strategies : list[SearchStrategy]
+        Estratégias de busca, na ordem em que são aplicadas.
+    margin : float, opcional
+        Diferença relativa mínima entre as duas maiores pontuações para
+        que um resultado pontuado seja considerado confiável.
+    """
+
+    def __init__(self, strategies: list[SearchStrategy], margin: float = 0.2):
+        super().__init__(next((st.index for st in strategies if st.index is not None), None))
+        self.strategies = strategies
+        self.margin = margin
+
+    def signature(self) -> str:
+        inner = ",".join(st.signature() for st in self.strategies)
+        return f"{super().signature()}({inner}):{self.margin}"
+
+    def confident(self, venues: list[VenueRecord]) -> bool:
+        """Verifica se os resultados de uma estratégia contêm uma
+        correspondência confiável."""
+        if not venues:
+            return False
+        if venues[0].score is None or len(venues) == 1:
+            return True
+        first, second = venues[0].score, venues[1].score
+        return first > 0 and (first - second) / first >= self.margin
+
+    def search(self, **kwargs) -> list[VenueRecord]:
+        venues, seen = [], set()
+        profiler = profiling.active
+        for st in self.strategies:
+            results = (
+                st.search(**kwargs) if profiler is None else st._profiled_search(profiler, kwargs)
+            )
+            for v in results:
+                if (v.type, v.hash) not in seen:
+                    seen.add((v.type, v.hash))
+                    venues.append(v)
+            if self.confident(results):
+                break
+        return venues
+
+    def search_many(self, queries: list[dict[str, Any]]) -> list[list[VenueRecord]]:
+        venues: list[list[VenueRecord]] = [[] for _ in queries]
+        seen: list[set[tuple[VenueType, bytes]]] = [set() for _ in queries]
+        active = list(range(len(queries)))
+        profiler = profiling.active
+        for st in self.strategies:
+            if not active:
+                break
+            batch = [queries[i] for i in active]
+            results = (
+                st.search_many(batch) if profiler is None else st._profiled_search_many(profiler, batch)
+            )
+            for i, r in zip(active, results):
+                for v in r:
+                    if (v.type, v.hash) not in seen[i]:
+                        seen[i].add((v.type, v.hash))
+                        venues[i].append(v)
+            active = [i for i, r in zip(active, results) if not self.confident(r)]
+        return venues
 
 
 class ExactSearch(SearchStrategy):
     """Busca exata pelo nome da via de publicação, usando
-    normalização dos termos."""
+    normalização dos termos.
+
+    Parâmetros
+    ----------
+    index : Index
+        Uma instância do índice de busca.
+    backend : SearchBackend, opcional
+        Mecanismo de busca: consulta SQL a cada busca ou
+        tabela hash carregada em memória.
+    """
+
+    key = SearchStrategyKey.EXACT
+
+    def __init__(self, index: Index, backend: SearchBackend = SearchBackend.SQL):
+        super().__init__(index)
+        self.table: dict[bytes, list[VenueRecord]] | None = None
+        if backend == SearchBackend.MEMORY:
+            self.table = {}
+            for v in index.snapshot().venues:
+                self.table.setdefault(v.hash, []).append(v)
+
+    def __reduce__(self):
+        backend = SearchBackend.MEMORY if self.table is not None else SearchBackend.SQL
+        return (type(self), (self.index, backend))
 
     # pylint: disable=arguments-differ
-    def search(self, name: str, venue_type: VenueType | None = None, **_) -> list[Venue]:
+    def search(self, name: str, venue_type: VenueType | None = None, **_) -> list[VenueRecord]:
         if not name:
             return []
         tokens = self.index.tokenize(name)
         name_hash = self.index.hash("-".join(tokens))
+        if self.table is not None:
+            venues = self.table.get(name_hash, [])
+            return [v for v in venues if venue_type is None or v.type == venue_type]
         fields = ["type", "hash", "name", "qualis", "extra"]
         query = (f"SELECT {', '.join(fields)}\n"
                   "  FROM venue\n"
                   "  WHERE hash = ?")
-        if venue_type:
+        if venue_type is not None:
             query += f" AND type = {venue_type.value}"
-        with self.index.db:
-            cursor = self.index.db.execute(query, (name_hash,))
-            return [Venue(**dict(zip(fields, res))) for res in cursor]
+        return self._query(query, (name_hash,))
+
+    def search_many(self, queries: list[dict[str, Any]]) -> list[list[VenueRecord]]:
+        """Resolve os hashes de todas as buscas com uma consulta `IN`
+        para cada `max_parameters` nomes distintos."""
+        names = [q.get("name") or "" for q in queries]
+        hashes = [
+            self.index.hash("-".join(tokens)) if name else None
+            for name, tokens in zip(names, self.index.tokenize_many(names))
+        ]
+        if self.table is not None:
+            found = self.table
+        else:
+            found = {}
+            fields = ["type", "hash", "name", "qualis", "extra"]
+            distinct = list(dict.fromkeys(h for h in hashes if h is not None))
+            for chunk in self._chunks(distinct, self.max_parameters):
+                query = (f"SELECT {', '.join(fields)}\n"
+                          "  FROM venue\n"
+                         f"  WHERE hash IN ({', '.join(['?'] * len(chunk))})")
+                for v in self._query(query, chunk):
+                    found.setdefault(v.hash, []).append(v)
+        return [
+            [
+                v for v in found.get(h, [])
+                if q.get("venue_type") is None or v.type == q["venue_type"]
+            ]
+            for q, h in zip(queries, hashes)
+        ]
 
 
 class FuzzySearch(SearchStrategy):
-    """Busca aproximada pelo nome da via de publicação."""
+    """Busca aproximada pelo nome da via de publicação.
 
-    def __init__(self, index: Index):
+    Cada token da busca ausente do índice é associado aos tokens do índice
+    que estejam a uma distância de edição limitada, com peso
+    `1 - distância / tamanho do token`.
+
+    Parâmetros
+    ----------
+    index : Index
+        Uma instância do índice de busca.
+    backend : SearchBackend, opcional
+        Mecanismo de pontuação: consulta SQL a cada busca ou
+        matriz TF-IDF carregada em memória.
+    max_distance : int, opcional
+        Distância de edição máxima entre um token da busca e do índice.
+    chars_per_edit : int, opcional
+        Quantidade de caracteres de um token da busca necessária para
+        permitir cada edição, de forma que tokens curtos toleram menos erros.
+    """
+
+    key = SearchStrategyKey.FUZZY
+    fields = ["type", "hash", "name", "qualis", "extra"]
+
+    def __init__(
+        self,
+        index: Index,
+        backend: SearchBackend = SearchBackend.SQL,
+        max_distance: int = 2,
+        chars_per_edit: int = 4,
+    ):
         super().__init__(index)
-        with index.db:
-            tokens = [token for token, in index.db.execute("SELECT token FROM inv_doc_frequency")]
-        self.token_index = BKTree(distance, tokens)
+        self.max_distance = max_distance
+        self.chars_per_edit = chars_per_edit
+        with profiling.stage("fuzzy.token_index"):
+            self.token_index = self._load_token_index(index, backend)
+            self.vocabulary = frozenset(self.token_index)
+        self.matrix = None
+        if backend == SearchBackend.MEMORY:
+            # pylint: disable=import-outside-toplevel
+            from qual_qualis.index.tfidf import TfIdfMatrix
+
+            with profiling.stage("fuzzy.matrix"):
+                self.matrix = TfIdfMatrix(index)
+
+    def __reduce__(self):
+        backend = SearchBackend.MEMORY if self.matrix is not None else SearchBackend.SQL
+        return (type(self), (self.index, backend, self.max_distance, self.chars_per_edit))
+
+    @staticmethod
+    def _load_token_index(index: Index, backend: SearchBackend = SearchBackend.SQL) -> BKTree:
+        """Carrega a BK-tree de tokens do índice, armazenada junto ao banco
+        de dados com o identificador de construção do banco (veja
+        `Index.build_id`). A árvore é reconstruída quando o arquivo não pode
+        ser lido ou se refere a outra construção, a partir do retrato do
+        índice com `SearchBackend.MEMORY`, e gravada sob a trava do índice em
+        um arquivo temporário renomeado atomicamente, de forma que outros
+        processos nunca leem uma árvore incompleta."""
+        # pylint: disable=import-outside-toplevel
+        from Levenshtein import distance
+        from pybktree import BKTree
+
+        fp = index.artifact_path("tokens.pickle")
+        build_id = index.build_id()
+        if build_id is not None and os.path.exists(fp):
+            try:
+                with open(fp, "rb") as f:
+                    stored_id, tree = pickle.load(f)
+                if stored_id == build_id and isinstance(tree, BKTree):
+                    return tree
+            except (
+                OSError,
+                EOFError,
+                pickle.UnpicklingError,
+                AttributeError,
+                ImportError,
+                IndexError,
+                TypeError,
+                ValueError,
+            ):
+                pass
+        if backend == SearchBackend.MEMORY:
+            tokens = index.snapshot().tokens
+        else:
+            with index.db:
+                tokens = [token for token, in index.db.execute("SELECT token FROM inv_doc_frequency")]
+        tree = BKTree(distance, tokens)
+        tmp_path = f"{fp}.{os.getpid()}.tmp"
+        try:
+            with index.lock():
+                with open(tmp_path, "wb") as f:
+                    pickle.dump((build_id, tree), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, fp)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return tree
+
+    def signature(self) -> str:
+        return f"{super().signature()}:{self.max_distance}:{self.chars_per_edit}"
+
+    def max_token_distance(self, token: str) -> int:
+        """Retorna a distância de edição máxima permitida para um token."""
+        return min(self.max_distance, len(token) // self.chars_per_edit)
+
+    def expand(
+        self, tokens: list[str], memo: dict[str, list[tuple[int, str]]] | None = None
+    ) -> dict[str, float]:
+        """Associa tokens da busca a tokens do índice, com peso
+        decrescente conforme a distância de edição. Tokens presentes
+        no índice são associados apenas a si mesmos.
+
+        Parâmetros
+        ----------
+        tokens : list[str]
+            Tokens da busca.
+        memo : dict[str, list[tuple[int, str]]], opcional
+            Tokens do índice já encontrados para cada token da busca,
+            compartilhados entre várias buscas e atualizados no lugar.
+
+        Retorna
+        -------
+        dict[str, float]
+            Peso de cada token do índice encontrado.
+        """
+        matches: dict[str, float] = {}
+        for t in tokens:
+            found = memo.get(t) if memo is not None else None
+            if found is None:
+                # tokens do índice dispensam a busca na BK-tree
+                if t in self.vocabulary:
+                    found = [(0, t)]
+                else:
+                    found = self.token_index.find(t, self.max_token_distance(t))
+                if memo is not None:
+                    memo[t] = found
+            for d, m in found:
+                matches[m] = max(matches.get(m, 0.0), 1 - d / len(t))
+        return matches
 
     # pylint: disable=arguments-differ
-    def search(self, name: str, venue_type: VenueType | None = None, n_results: int = 5, **_) -> list[Venue]:
+    def search(self, name: str, venue_type: VenueType | None = None, n_results: int = 5, **_) -> list[VenueRecord]:
         if not name:
             return []
-        tokens = self.index.tokenize(name)
-        matches = ({m for _, m in self.token_index.find(t, 0)} for t in tokens)
-        matches = reduce(lambda a, b: a | b, matches, set())
-        fields = ["type", "hash", "name", "qualis", "extra"]
-        fields_str = ", ".join(("v." + f for f in fields))
-        conditions = [f"tf.token IN ({', '.join('?' * len(matches))})"]
-        if venue_type is not None:
-            conditions.append(f"v.type = {venue_type.value}")
-        query = (f"SELECT {fields_str}, SUM(tf.tf * idf.idf) AS score\n"
-                  "  FROM venue AS v JOIN term_frequency AS tf\n"
-                  "       ON v.type = tf.venue_type AND v.hash = tf.venue_hash\n"
-                  "    JOIN inv_doc_frequency AS idf ON tf.token = idf.token\n"
-                 f"  WHERE {' AND '.join(conditions)}\n"
-                 f"  GROUP BY {fields_str}\n"
-                  "  ORDER BY score DESC\n"
+        matches = self.expand(self.index.tokenize(name))
+        if not matches:
+            return []
+        if self.matrix is not None:
+            return self.matrix.top_k(matches, n_results, venue_type)
+        return self.__score(matches, venue_type, n_results)
+
+    def __score(
+        self, matches: dict[str, float], venue_type: VenueType | None, n_results: int
+    ) -> list[VenueRecord]:
+        """Pontua uma busca com uma consulta SQL."""
+        fields_str = ", ".join(("v." + f for f in self.fields))
+        condition = f"  WHERE v.type = {venue_type.value}\n" if venue_type is not None else ""
+        query = (f"WITH q (token, weight) AS (VALUES {', '.join(['(?, ?)'] * len(matches))})\n"
+                 f"SELECT {fields_str}, SUM(tf.tf * idf.idf * q.weight) AS score\n"
+                  "  FROM q JOIN inv_doc_frequency AS idf ON q.token = idf.token\n"
+                  "    JOIN term_frequency AS tf ON tf.token_id = idf.id\n"
+                  "    JOIN venue AS v ON v.id = tf.venue_id\n"
+                 f"{condition}"
+                  "  GROUP BY v.id\n"
+                  "  ORDER BY score DESC, v.type, v.hash\n"
                  f"  LIMIT {n_results}")
-        with self.index.db:
-            cursor = self.index.db.execute(query, list(matches))
-            return [Venue(**dict(zip(fields, res[:-1]))) for res in cursor]
+        return self._query(
+            query,
+            [x for m in matches.items() for x in m],
+            lambda res: VenueRecord.from_row(res[:-1], res[-1]),
+        )
+
+    def search_many(self, queries: list[dict[str, Any]]) -> list[list[VenueRecord]]:
+        """Expande cada token distinto das buscas uma única vez e pontua
+        as buscas em lote na matriz TF-IDF em memória, ou uma a uma com
+        consultas SQL. Com SQL, uma única consulta para várias buscas, que
+        ordena todas as vias de publicação candidatas de cada busca por uma
+        função de janela, é mais lenta que uma consulta com `LIMIT` por busca."""
+        names = [q.get("name") or "" for q in queries]
+        memo: dict[str, list[tuple[int, str]]] = {}
+        matches = [
+            self.expand(tokens, memo) if name else {}
+            for name, tokens in zip(names, self.index.tokenize_many(names))
+        ]
+        if self.matrix is not None:
+            return self.matrix.top_k_many(
+                [(m, q.get("n_results", 5), q.get("venue_type")) for m, q in zip(matches, queries)]
+            )
+        return [
+            self.__score(m, q.get("venue_type"), q.get("n_results", 5)) if m else []
+            for m, q in zip(matches, queries)
+        ]
 
 
 class ISSNSearch(SearchStrategy):
-    """Busca periódicos pelo ISSN."""
+    """Busca periódicos pelo ISSN, normalizado e com dígito verificador
+    validado.
+
+    Parâmetros
+    ----------
+    index : Index
+        Uma instância do índice de busca.
+    backend : SearchBackend, opcional
+        Mecanismo de busca: consulta SQL a cada busca ou
+        tabela hash carregada em memória.
+    """
+
+    key = SearchStrategyKey.ISSN
+    fields = ["type", "hash", "name", "qualis", "extra"]
+
+    def __init__(self, index: Index, backend: SearchBackend = SearchBackend.SQL):
+        super().__init__(index)
+        self.table: dict[str, list[VenueRecord]] | None = None
+        if backend == SearchBackend.MEMORY:
+            self.table = {}
+            snapshot = index.snapshot()
+            for issn, v in zip(snapshot.issns, snapshot.venues):
+                if issn is not None and v.type == VenueType.JOURNALS:
+                    self.table.setdefault(issn, []).append(v)
+
+    def __reduce__(self):
+        backend = SearchBackend.MEMORY if self.table is not None else SearchBackend.SQL
+        return (type(self), (self.index, backend))
 
     # pylint: disable=arguments-differ
-    def search(self, issn: str | None = None, **_) -> list[Venue]:
+    def search(self, issn: str | None = None, **_) -> list[VenueRecord]:
+        issn = Index.normalize_issn(issn) if isinstance(issn, str) else None
         if not issn:
             return []
-        fields = ["type", "hash", "name", "qualis", "extra"]
-        query = (f"SELECT {', '.join(fields)}\n"
+        if self.table is not None:
+            return list(self.table.get(issn, []))
+        query = (f"SELECT {', '.join(self.fields)}\n"
                   "  FROM venue\n"
-                  "  WHERE extra = ? AND type = ?")
-        with self.index.db:
-            cursor = self.index.db.execute(query, (issn, VenueType.JOURNALS.value))
-            return [Venue(**dict(zip(fields, res))) for res in cursor]
+                  "  WHERE issn = ? AND type = ?")
+        return self._query(query, (issn, VenueType.JOURNALS.value))
+
+    def search_many(self, queries: list[dict[str, Any]]) -> list[list[VenueRecord]]:
+        """Resolve todos os ISSNs com uma consulta `IN` para cada
+        `max_parameters` ISSNs distintos."""
+        issns = [
+            Index.normalize_issn(q["issn"]) if isinstance(q.get("issn"), str) else None
+            for q in queries
+        ]
+        if self.table is not None:
+            return [list(self.table.get(issn, [])) if issn else [] for issn in issns]
+        found: dict[str, list[VenueRecord]] = {}
+        distinct = list(dict.fromkeys(issn for issn in issns if issn))
+        for chunk in self._chunks(distinct, self.max_parameters - 1):
+            query = (f"SELECT issn, {', '.join(self.fields)}\n"
+                      "  FROM venue\n"
+                     f"  WHERE issn IN ({', '.join(['?'] * len(chunk))}) AND type = ?")
+            rows = self._query(
+                query,
+                (*chunk, VenueType.JOURNALS.value),
+                lambda row: (row[0], VenueRecord.from_row(row[1:])),
+            )
+            for issn, venue in rows:
+                found.setdefault(issn, []).append(venue)
+        return [list(found.get(issn, [])) if issn else [] for issn in issns]
+
+
+class AcronymSearch(SearchStrategy):
+    """Busca conferências pela sigla, normalizada sem anos, ordinais e
+    números de edição. Se encontrar resultados, dispensa as estratégias
+    seguintes em `apply_many`, como a busca aproximada.
+
+    Parâmetros
+    ----------
+    index : Index
+        Uma instância do índice de busca.
+    backend : SearchBackend, opcional
+        Mecanismo de busca: consulta SQL a cada busca ou
+        tabela hash carregada em memória.
+    """
+
+    key = SearchStrategyKey.ACRONYM
+    fields = ["type", "hash", "name", "qualis", "extra"]
+    short_circuit = True
+
+    def __init__(self, index: Index, backend: SearchBackend = SearchBackend.SQL):
+        super().__init__(index)
+        self.table: dict[str, list[VenueRecord]] | None = None
+        if backend == SearchBackend.MEMORY:
+            self.table = {}
+            snapshot = index.snapshot()
+            for acronym, v in zip(snapshot.acronyms, snapshot.venues):
+                if acronym is not None:
+                    self.table.setdefault(acronym, []).append(v)
+
+    def __reduce__(self):
+        backend = SearchBackend.MEMORY if self.table is not None else SearchBackend.SQL
+        return (type(self), (self.index, backend))
+
+    # pylint: disable=arguments-differ
+    def search(
+        self,
+        name: str | None = None,
+        acronym: str | None = None,
+        venue_type: VenueType | None = None,
+        **_,
+    ) -> list[VenueRecord]:
+        text = acronym if acronym is not None else name
+        acronym = Index.normalize_acronym(text) if isinstance(text, str) else None
+        if not acronym:
+            return []
+        if self.table is not None:
+            venues = self.table.get(acronym, [])
+            return [v for v in venues if venue_type is None or v.type == venue_type]
+        condition = " AND type = ?" if venue_type is not None else ""
+        query = (f"SELECT {', '.join(self.fields)}\n"
+                  "  FROM venue\n"
+                 f"  WHERE acronym = ?{condition}")
+        params = (acronym, venue_type.value) if venue_type is not None else (acronym,)
+        return self._query(query, params)
+
+    def search_many(self, queries: list[dict[str, Any]]) -> list[list[VenueRecord]]:
+        """Resolve todas as siglas com uma consulta `IN` para cada
+        `max_parameters` siglas distintas."""
+        acronyms = []
+        for q in queries:
+            text = q.get("acronym") if q.get("acronym") is not None else q.get("name")
+            acronyms.append(Index.normalize_acronym(text) if isinstance(text, str) else None)
+        if self.table is not None:
+            found = self.table
+        else:
+            found = {}
+            distinct = list(dict.fromkeys(a for a in acronyms if a))
+            for chunk in self._chunks(distinct, self.max_parameters):
+                query = (f"SELECT acronym, {', '.join(self.fields)}\n"
+                          "  FROM venue\n"
+                         f"  WHERE acronym IN ({', '.join(['?'] * len(chunk))})")
+                rows = self._query(
+                    query, chunk, lambda row: (row[0], VenueRecord.from_row(row[1:]))
+                )
+                for acronym, venue in rows:
+                    found.setdefault(acronym, []).append(venue)
+        return [
+            [
+                v for v in found.get(acronym, [])
+                if q.get("venue_type") is None or v.type == q["venue_type"]
+            ]
+            if acronym else []
+            for q, acronym in zip(queries, acronyms)
+        ]
+
+
+class NgramSearch(SearchStrategy):
+    """Busca aproximada pela similaridade de cosseno entre os vetores TF-IDF
+    de n-gramas de caracteres da busca e do nome de cada via de publicação,
+    tolerante a nomes abreviados (como "Int. Conf. Softw. Eng.").
+
+    Os vetores das vias de publicação são calculados na construção do índice
+    e carregados do seu retrato (`Index.snapshot`), de forma que a busca é
+    sempre feita em memória, independentemente do mecanismo escolhido. As
+    buscas de `search_many` são pontuadas em lote, por um produto de
+    matrizes esparsas (veja `NgramMatrix`).
+
+    Parâmetros
+    ----------
+    index : Index
+        Uma instância do índice de busca.
+    """
+
+    key = SearchStrategyKey.NGRAM
+
+    def __init__(self, index: Index):
+        super().__init__(index)
+        # pylint: disable=import-outside-toplevel
+        from qual_qualis.index.ngram import NgramMatrix
+
+        with profiling.stage("ngram.matrix"):
+            self.matrix = NgramMatrix(index)
+
+    def __reduce__(self):
+        return (type(self), (self.index,))
+
+    # pylint: disable=arguments-differ
+    def search(
+        self, name: str | None = None, venue_type: VenueType | None = None, n_results: int = 5, **_
+    ) -> list[VenueRecord]:
+        return self.search_many([dict(name=name, venue_type=venue_type, n_results=n_results)])[0]
+
+    def search_many(self, queries: list[dict[str, Any]]) -> list[list[VenueRecord]]:
+        names = [q.get("name") or "" for q in queries]
+        return self.matrix.top_k_many(
+            [
+                (tokens, q.get("n_results", 5), q.get("venue_type"))
+                for tokens, q in zip(self.index.tokenize_many(names), queries)
+            ]
+        )
@@ -0,0 +1,163 @@
+"""Índices fragmentados por área de avaliação, abertos sob demanda."""
+from __future__ import annotations
+import threading
+from typing import Any
+
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.model import VenueRecord
+from qual_qualis.index.search import (
+    CascadeSearch,
+    SearchBackend,
+    SearchStrategy,
+    SearchStrategyKey,
+)
+
+
+class IndexShards:
+    """Índices e estratégias de busca de cada área de avaliação.
+
+    Cada área possui seu próprio índice (veja `Index`), construído,
+    aberto e carregado em memória apenas na primeira busca que o usa, de
+    forma que a memória e o tempo de inicialização são proporcionais às
+    áreas consultadas, e não à classificação completa.
+
+    Parâmetros
+    ----------
+    directory : str, opcional
+        Diretório base dos índices. Veja `Index`.
+    data_directory : str, opcional
+        Diretório de dados das áreas. Veja `DataService`.
+    backend : SearchBackend, opcional
+        Mecanismo de busca.
+    max_distance : int, opcional
+        Distância de edição máxima da busca aproximada.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        data_directory: str | None = None,
+        backend: SearchBackend = SearchBackend.SQL,
+        max_distance: int = 2,
+    ):
+        self.directory = directory
+        self.data_directory = data_directory
+        self.backend = backend
+        self.max_distance = max_distance
+        self.__indexes: dict[str, Index] = {}
+        self.__strategies: dict[tuple[str, SearchStrategyKey], SearchStrategy] = {}
+        self.__lock = threading.Lock()
+
+    def __reduce__(self):
+        """Serializa os índices por seus parâmetros; uma cópia enviada a
+        outro processo abre os índices das áreas no primeiro uso."""
+        return (
+            type(self), (self.directory, self.data_directory, self.backend, self.max_distance)
+        )
+
+    def areas(self) -> list[str]:
+        """Retorna as áreas de avaliação disponíveis. Veja `DataService.areas`."""
+        return DataService.areas(self.data_directory)
+
+    def loaded(self) -> list[str]:
+        """Retorna as áreas de avaliação cujos índices já foram abertos."""
+        return sorted(self.__indexes)
+
+    def index(self, area: str) -> Index:
+        """Retorna o índice de uma área de avaliação, abrindo-o (e, se
+        necessário, construindo-o) no primeiro uso.
+
+        Parâmetros
+        ----------
+        area : str
+            Identificador da área de avaliação.
+        """
+        with self.__lock:
+            index = self.__indexes.get(area)
+            if index is None:
+                if area not in self.areas():
+                    raise ValueError(f"Área de avaliação não encontrada: {area}")
+                service = DataService(area, self.data_directory)
+                index = self.__indexes[area] = Index(service, self.directory)
+            return index
+
+    def strategies(self, area: str, keys: list[SearchStrategyKey]) -> list[SearchStrategy]:
+        """Retorna as estratégias de busca de uma área de avaliação,
+        criando-as no primeiro uso.
+
+        Parâmetros
+        ----------
+        area : str
+            Identificador da área de avaliação.
+        keys : list[SearchStrategyKey]
+            Estratégias de busca, na ordem em que são aplicadas.
+        """
+        index = self.index(area)
+        with self.__lock:
+            for key in keys:
+                if (area, key) not in self.__strategies:
+                    self.__strategies[(area, key)] = SearchStrategy.create(
+                        key, index, self.backend, self.max_distance
+                    )
+            return [self.__strategies[(area, key)] for key in keys]
+
+
+class AreaSearch(SearchStrategy):
+    """Aplica as estratégias de busca ao índice de cada área de avaliação
+    informada, na ordem das áreas, identificando a área de cada resultado
+    em `VenueRecord.area`. Os índices das áreas são abertos na primeira
+    busca.
+
+    Parâmetros
+    ----------
+    shards : IndexShards
+        Índices das áreas de avaliação.
+    areas : list[str]
+        Áreas de avaliação consultadas.
+    keys : list[SearchStrategyKey]
+        Estratégias de busca, na ordem em que são aplicadas.
+    margin : float, opcional
+        Se informada, as estratégias de cada área são aplicadas em cascata
+        (`CascadeSearch`), com essa margem.
+    """
+
+    # pylint: disable=super-init-not-called
+    def __init__(
+        self,
+        shards: IndexShards,
+        areas: list[str],
+        keys: list[SearchStrategyKey],
+        margin: float | None = None,
+    ):
+        self.index = None
+        self.shards = shards
+        self.areas = list(areas)
+        self.keys = list(keys)
+        self.margin = margin
+
+    def signature(self) -> str:
+        keys = ",".join(k.value for k in self.keys)
+        return f"{super().signature()}({','.join(self.areas)}:{keys}):{self.margin}"
+
+    def _strategies(self, area: str) -> list[SearchStrategy]:
+        """Retorna as estratégias aplicadas ao índice de uma área."""
+        strategies = self.shards.strategies(area, self.keys)
+        if self.margin is not None:
+            return [CascadeSearch(strategies, self.margin)]
+        return strategies
+
+    def search(self, **kwargs) -> list[VenueRecord]:
+        venues = []
+        for area in self.areas:
+            results = SearchStrategy.apply_many(self._strategies(area), **kwargs)
+            venues += [v._replace(area=area) for v in results]
+        return venues
+
+    def search_many(self, queries: list[dict[str, Any]]) -> list[list[VenueRecord]]:
+        venues: list[list[VenueRecord]] = [[] for _ in queries]
+        for area in self.areas:
+            results = SearchStrategy.apply_batch(self._strategies(area), queries)
+            for i, r in enumerate(results):
+                venues[i] += [v._replace(area=area) for v in r]
+        return venues
@@ -0,0 +1,231 @@
+"""Retrato do índice em arquivo binário, carregado em memória sem SQL."""
+from __future__ import annotations
+import os
+from typing import TYPE_CHECKING, BinaryIO
+
+import numpy as np
+
+from qual_qualis.index.model import VenueRecord
+from qual_qualis.index.ngram import NgramMatrix
+
+if TYPE_CHECKING:
+    from qual_qualis.index.index import Index
+
+
+class IndexSnapshot:
+    """Retrato do índice em arrays compactos: vias de publicação, tokens,
+    a matriz de pesos TF-IDF no formato CSR (veja `TfIdfMatrix`) e a matriz
+    de n-gramas de caracteres dos nomes (veja `NgramMatrix`).
+
+    O retrato é gravado junto ao banco de dados como uma sequência de arrays
+    no formato `.npy`, mapeados em memória na leitura. Os textos são
+    armazenados como bytes UTF-8 separados por `\\x00`, e ISSNs e siglas
+    ausentes como textos vazios. As vias de publicação são ordenadas por
+    `(type, hash)`. O retrato registra o identificador de construção do
+    banco de dados do qual foi criado (veja `Index.build_id`).
+
+    Parâmetros
+    ----------
+    arrays : dict[str, numpy.ndarray]
+        Arrays do retrato, indexados pelos nomes em `arrays`.
+    """
+
+    file_name = "index.snapshot"
+
+    version = 3
+    """Versão do formato do arquivo. Arquivos com outra versão são
+    reconstruídos."""
+
+    arrays = [
+        "version", "build", "types", "hashes", "names", "qualis", "extra", "issns",
+        "acronyms", "tokens", "indptr", "indices", "data", "maxes",
+        "ngrams", "ngram_idf", "ngram_indptr", "ngram_indices", "ngram_data",
+    ]
+
+    def __init__(self, arrays: dict[str, np.ndarray]):
+        self.__arrays = arrays
+        self.schema_version = int(arrays["version"][1])
+        self.build_id = self.__split(arrays["build"], 1)[0] or None
+        self.types: np.ndarray = arrays["types"]
+        self.indptr: np.ndarray = arrays["indptr"]
+        self.indices: np.ndarray = arrays["indices"]
+        self.data: np.ndarray = arrays["data"]
+        self.maxes: np.ndarray = arrays["maxes"]
+        self.ngram_idf: np.ndarray = arrays["ngram_idf"]
+        self.ngram_indptr: np.ndarray = arrays["ngram_indptr"]
+        self.ngram_indices: np.ndarray = arrays["ngram_indices"]
+        self.ngram_data: np.ndarray = arrays["ngram_data"]
+        self.ngrams = self.__split(arrays["ngrams"], len(self.ngram_idf))
+        n = len(self.types)
+        self.tokens = self.__split(arrays["tokens"], len(self.indptr) - 1)
+        self.issns = [issn or None for issn in self.__split(arrays["issns"], n)]
+        self.acronyms = [acronym or None for acronym in self.__split(arrays["acronyms"], n)]
+        hashes = arrays["hashes"].tobytes()
+        self.venues = [
+            VenueRecord.from_row((t, hashes[16 * i : 16 * i + 16], name, qualis, extra))
+            for i, (t, name, qualis, extra) in enumerate(
+                zip(
+                    self.types.tolist(),
+                    self.__split(arrays["names"], n),
+                    self.__split(arrays["qualis"], n),
+                    self.__split(arrays["extra"], n),
+                )
+            )
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Tamanho total dos arrays do retrato, em bytes."""
+        return sum(a.nbytes for a in self.__arrays.values())
+
+    @staticmethod
+    def __join(texts: list[str]) -> np.ndarray:
+        return np.frombuffer("\x00".join(texts).encode(), dtype=np.uint8)
+
+    @staticmethod
+    def __split(array: np.ndarray, count: int) -> list[str]:
+        return array.tobytes().decode().split("\x00") if count else []
+
+    @classmethod
+    def from_index(cls, index: Index) -> IndexSnapshot:
+        """Cria o retrato a partir do banco de dados do índice.
+
+        Parâmetros
+        ----------
+        index : Index
+            Índice do qual os dados são lidos.
+        """
+        build_id = index.build_id()
+        with index.db:
+            rows = index.db.execute(
+                "SELECT id, type, hash, name, qualis, extra, issn, acronym FROM venue "
+                "ORDER BY type, hash"
+            ).fetchall()
+            idf = {
+                token_id: (token, value)
+                for token_id, token, value in index.db.execute(
+                    "SELECT id, token, idf FROM inv_doc_frequency"
+                )
+            }
+            postings = index.db.execute(
+                "SELECT token_id, venue_id, tf FROM term_frequency"
+            ).fetchall()
+        venue_ids = {row[0]: i for i, row in enumerate(rows)}
+        venues = [row[1:] for row in rows]
+        tokens = sorted(token for token, _ in idf.values())
+        token_ids = {t: i for i, t in enumerate(tokens)}
+        rows = np.fromiter(
+            (token_ids[idf[t][0]] for t, _, _ in postings), dtype=np.int32, count=len(postings)
+        )
+        indices = np.fromiter(
+            (venue_ids[v] for _, v, _ in postings), dtype=np.int32, count=len(postings)
+        )
+        data = np.fromiter(
+            (tf * idf[t][1] for t, _, tf in postings), dtype=np.float64, count=len(postings)
+        )
+        order = np.lexsort((indices, rows))
+        indptr = np.zeros(len(tokens) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(tokens)), out=indptr[1:])
+        columns = list(zip(*venues)) if venues else [()] * 7
+        ngram = NgramMatrix.build(index.tokenize_many(columns[2]))
+        return cls(
+            {
+                "version": np.array([cls.version, index.schema_version], dtype=np.int64),
+                "build": cls.__join([build_id or ""]),
+                "types": np.array(columns[0], dtype=np.int8),
+                "hashes": np.frombuffer(b"".join(columns[1]), dtype=np.uint8),
+                "names": cls.__join(columns[2]),
+                "qualis": cls.__join(columns[3]),
+                "extra": cls.__join(columns[4]),
+                "issns": cls.__join([issn or "" for issn in columns[5]]),
+                "acronyms": cls.__join([acronym or "" for acronym in columns[6]]),
+                "tokens": cls.__join(tokens),
+                "indptr": indptr,
+                "indices": indices[order],
+                "data": data[order],
+                "maxes": (
+                    np.maximum.reduceat(data[order], indptr[:-1])
+                    if len(data)
+                    else np.zeros(len(tokens))
+                ),
+                "ngrams": cls.__join(ngram["ngrams"]),
+                "ngram_idf": ngram["idf"],
+                "ngram_indptr": ngram["indptr"],
+                "ngram_indices": ngram["indices"],
+                "ngram_data": ngram["data"],
+            }
+        )
+
+    def save(self, fp: str):
+        """Grava o retrato em um arquivo temporário e o renomeia
+        atomicamente para o caminho informado."""
+        tmp_path = f"{fp}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            for name in self.arrays:
+                np.lib.format.write_array(f, np.ascontiguousarray(self.__arrays[name]))
+        os.replace(tmp_path, fp)
+
+    @classmethod
+    def load(cls, fp: str) -> IndexSnapshot:
+        """Lê um retrato gravado por `save`, mapeando os arrays em memória.
+
+        Parâmetros
+        ----------
+        fp : str
+            Caminho do arquivo.
+        """
+        arrays = {}
+        with open(fp, "rb") as f:
+            for name in cls.arrays:
+                arrays[name] = cls.__map_array(f, fp)
+                if name == "version" and arrays[name][0] != cls.version:
+                    raise ValueError(f"Versão de retrato incompatível: {arrays[name][0]}")
+        return cls(arrays)
+
+    @staticmethod
+    def __map_array(f: BinaryIO, fp: str) -> np.ndarray:
+        version = np.lib.format.read_magic(f)
+        read_header = (
+            np.lib.format.read_array_header_1_0
+            if version == (1, 0)
+            else np.lib.format.read_array_header_2_0
+        )
+        shape, _, dtype = read_header(f)
+        offset = f.tell()
+        if not np.prod(shape):
+            return np.empty(shape, dtype=dtype)
+        array = np.memmap(fp, dtype=dtype, mode="r", offset=offset, shape=shape)
+        f.seek(offset + array.nbytes)
+        return array
+
+    @classmethod
+    def open(cls, index: Index) -> IndexSnapshot:
+        """Carrega o retrato armazenado junto ao banco de dados do índice.
+        O retrato é recriado quando não existe, tem outra versão ou foi
+        criado a partir de outra construção do banco de dados, e então
+        gravado sob a trava do índice.
+
+        Parâmetros
+        ----------
+        index : Index
+            Índice ao qual o retrato se refere.
+        """
+        fp = index.artifact_path(cls.file_name)
+        build_id = index.build_id()
+        if build_id is not None and os.path.exists(fp):
+            try:
+                snapshot = cls.load(fp)
+                if (
+                    snapshot.schema_version == index.schema_version
+                    and snapshot.build_id == build_id
+                ):
+                    return snapshot
+            except (OSError, ValueError):
+                pass
+        snapshot = cls.from_index(index)
+        try:
+            with index.lock():
+                snapshot.save(fp)
+        except OSError:
+            pass
+        return snapshot
@@ -0,0 +1,233 @@
+"""Matriz TF-IDF em memória para pontuação das buscas aproximadas."""
+import numpy as np
+
+from qual_qualis.index.index import Index
+from qual_qualis.index.model import VenueRecord, VenueType
+
+
+class TfIdfMatrix:
+    """Matriz esparsa de pesos TF-IDF no formato CSR, em que cada linha
+    corresponde a um token e cada coluna a uma via de publicação.
+
+    As vias de publicação são numeradas na ordem `(type, hash)`, a mesma
+    usada pelo agrupamento da consulta SQL, de forma que empates de
+    pontuação são desfeitos do mesmo modo. Cada linha é ordenada pelo
+    número da via de publicação e o maior peso de cada token é mantido
+    como limite superior da sua contribuição, permitindo a poda das
+    vias que não podem estar entre as melhores (MaxScore).
+
+    Parâmetros
+    ----------
+    index : Index
+        Índice de cujo retrato (`Index.snapshot`) os pesos são carregados.
+    """
+
+    prune_min_postings = 100000
+    """Quantidade de entradas das linhas dos tokens de uma busca a partir da
+    qual a poda compensa o custo de pontuar as vias em mais de uma etapa."""
+
+    batch_cells = 1 << 21
+    """Quantidade máxima de pontuações (buscas × vias de publicação)
+    calculadas de uma vez por `top_k_many`."""
+
+    def __init__(self, index: Index):
+        snapshot = index.snapshot()
+        self.venues = snapshot.venues
+        self.token_ids: dict[str, int] = {t: i for i, t in enumerate(snapshot.tokens)}
+        self.indptr = snapshot.indptr
+        self.indices = snapshot.indices
+        self.data = snapshot.data
+        self.maxes = snapshot.maxes
+        self.types = snapshot.types
+
+    def top_k(
+        self,
+        tokens: dict[str, float],
+        k: int,
+        venue_type: VenueType | None = None,
+        prune: bool | None = None,
+    ) -> list[VenueRecord]:
+        """Retorna as `k` vias de publicação de maior pontuação para
+        um conjunto de tokens.
+
+        Parâmetros
+        ----------
+        tokens : dict[str, float]
+            Tokens da busca e seus pesos.
+        k : int
+            Quantidade de resultados.
+        venue_type : VenueType, opcional
+            Tipo de via de publicação ao qual a busca se restringe.
+        prune : bool, opcional
+            Se as vias de publicação que não podem estar entre as `k`
+            melhores devem ser descartadas sem ser pontuadas. O resultado
+            é idêntico ao da pontuação exaustiva. Se omitido, a poda é feita
+            quando as linhas dos tokens somam ao menos `prune_min_postings`
+            entradas.
+
+        Retorna
+        -------
+        list[VenueRecord]
+            Vias de publicação, com suas pontuações, em ordem decrescente.
+        """
+        ids = self.__ids(tokens)
+        if not ids or k <= 0:
+            return []
+        if self.__prune(ids, prune):
+            candidates, scores = self.__max_score(ids, k, venue_type)
+        else:
+            candidates, scores = self.__exhaustive(ids, venue_type)
+        return self.__select(candidates, scores, k)
+
+    def top_k_many(
+        self,
+        queries: list[tuple[dict[str, float], int, VenueType | None]],
+        prune: bool | None = None,
+    ) -> list[list[VenueRecord]]:
+        """Retorna as vias de publicação de maior pontuação para várias
+        buscas, com os mesmos resultados de `top_k` para cada uma.
+
+        As buscas que não são podadas são pontuadas juntas, em grupos de
+        até `batch_cells` pontuações, por uma única contagem ponderada sobre
+        as linhas de todos os seus tokens.
+
+        Parâmetros
+        ----------
+        queries : list[tuple[dict[str, float], int, VenueType | None]]
+            Tokens e seus pesos, quantidade de resultados e tipo de via de
+            publicação de cada busca.
+        prune : bool, opcional
+            Se as buscas devem ser podadas. Veja `top_k`.
+
+        Retorna
+        -------
+        list[list[VenueRecord]]
+            Resultados de cada busca, na mesma ordem.
+        """
+        results: list[list[VenueRecord]] = [[] for _ in queries]
+        batch = []
+        for j, (tokens, k, venue_type) in enumerate(queries):
+            ids = self.__ids(tokens)
+            if not ids or k <= 0:
+                continue
+            if self.__prune(ids, prune):
+                candidates, scores = self.__max_score(ids, k, venue_type)
+                results[j] = self.__select(candidates, scores, k)
+            else:
+                batch.append((j, ids, k, venue_type))
+        n = len(self.venues)
+        size = max(1, self.batch_cells // n)
+        for part in (batch[i : i + size] for i in range(0, len(batch), size)):
+            # cada busca ocupa um intervalo de `n` posições, e as contribuições
+            # são somadas na mesma ordem de `__exhaustive`
+            slices = [
+                (q * n, self.__row(i), w) for q, (_, ids, _, _) in enumerate(part) for i, w in ids
+            ]
+            cols = np.concatenate([self.indices[s] + offset for offset, s, _ in slices])
+            weights = np.concatenate([self.data[s] * w for _, s, w in slices])
+            scores = np.bincount(cols, weights=weights, minlength=len(part) * n).reshape(-1, n)
+            hits = (np.bincount(cols, minlength=len(part) * n) > 0).reshape(-1, n)
+            for q, (j, _, k, venue_type) in enumerate(part):
+                row_hits = hits[q]
+                if venue_type is not None:
+                    row_hits = row_hits & (self.types == venue_type.value)
+                candidates = np.flatnonzero(row_hits)
+                results[j] = self.__select(candidates, scores[q, candidates], k)
+        return results
+
+    def __ids(self, tokens: dict[str, float]) -> list[tuple[int, float]]:
+        return [(self.token_ids[t], w) for t, w in tokens.items() if t in self.token_ids]
+
+    def __prune(self, ids: list[tuple[int, float]], prune: bool | None) -> bool:
+        if prune is None:
+            postings = sum(self.indptr[i + 1] - self.indptr[i] for i, _ in ids)
+            prune = postings >= self.prune_min_postings
+        return prune and len(ids) > 1
+
+    def __select(
+        self, candidates: np.ndarray, scores: np.ndarray, k: int
+    ) -> list[VenueRecord]:
+        """Seleciona as `k` vias de publicação de maior pontuação, desfazendo
+        empates pela ordem das vias."""
+        if len(candidates) > k:
+            kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+            keep = scores >= kth
+            candidates, scores = candidates[keep], scores[keep]
+        order = np.argsort(-scores, kind="stable")[:k]
+        return [
+            self.venues[i]._replace(score=s)
+            for i, s in zip(candidates[order].tolist(), scores[order].tolist())
+        ]
+
+    def __row(self, token_id: int) -> slice:
+        return slice(self.indptr[token_id], self.indptr[token_id + 1])
+
+    def __exhaustive(
+        self, ids: list[tuple[int, float]], venue_type: VenueType | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Pontua todas as vias de publicação que contêm algum dos tokens.
+        Retorna as vias, em ordem crescente, e suas pontuações."""
+        slices = [(self.__row(i), w) for i, w in ids]
+        cols = np.concatenate([self.indices[s] for s, _ in slices])
+        weights = np.concatenate([self.data[s] * w for s, w in slices])
+        n = len(self.venues)
+        scores = np.bincount(cols, weights=weights, minlength=n)
+        hits = np.bincount(cols, minlength=n) > 0
+        if venue_type is not None:
+            hits &= self.types == venue_type.value
+        candidates = np.flatnonzero(hits)
+        return candidates, scores[candidates]
+
+    def __max_score(
+        self, ids: list[tuple[int, float]], k: int, venue_type: VenueType | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Pontua apenas as vias de publicação que podem estar entre as `k`
+        melhores, pelo algoritmo MaxScore.
+
+        A `k`-ésima maior contribuição do token de maior limite superior é
+        um limiar que as `k` melhores vias alcançam, já que as contribuições
+        dos demais tokens não são negativas. Os tokens cujos limites superiores
+        somados não alcançam o limiar são não essenciais: vias que contêm
+        apenas esses tokens são descartadas, e as demais são pontuadas.
+        Retorna as vias, em ordem crescente, e suas pontuações.
+        """
+        bounds = np.array([self.maxes[i] * w for i, w in ids])
+        seed_id, seed_weight = ids[int(np.argmax(bounds))]
+        seed = self.__row(seed_id)
+        seed_scores = self.data[seed] * seed_weight
+        if venue_type is not None:
+            seed_scores = seed_scores[self.types[self.indices[seed]] == venue_type.value]
+        if len(seed_scores) < k:
+            return self.__exhaustive(ids, venue_type)
+        threshold = np.partition(seed_scores, len(seed_scores) - k)[len(seed_scores) - k]
+        order = np.argsort(bounds, kind="stable")
+        # margem relativa para erros de arredondamento na soma dos limites
+        non_essential = order[np.cumsum(bounds[order]) * (1 + 1e-9) < threshold]
+        if len(non_essential) == 0:
+            return self.__exhaustive(ids, venue_type)
+        skip = set(non_essential.tolist())
+        n = len(self.venues)
+        hits = np.zeros(n, dtype=bool)
+        for j, (i, _) in enumerate(ids):
+            if j not in skip:
+                hits[self.indices[self.__row(i)]] = True
+        if venue_type is not None:
+            hits &= self.types == venue_type.value
+        docs = np.flatnonzero(hits)
+        # as contribuições são somadas na ordem dos tokens, como em
+        # `__exhaustive`, de forma que as pontuações são idênticas
+        scores = np.zeros(n)
+        for j, (i, w) in enumerate(ids):
+            row = self.__row(i)
+            cols, data = self.indices[row], self.data[row]
+            if j not in skip:
+                scores[cols] += data * w
+            elif len(docs) * np.log2(len(cols) + 1) < len(cols):
+                pos = np.searchsorted(cols, docs)
+                pos[pos == len(cols)] = 0
+                found = cols[pos] == docs
+                scores[docs[found]] += data[pos[found]] * w
+            else:
+                found = hits[cols]
+                scores[cols[found]] += data[found] * w
+        return docs, scores[docs]
@@ -0,0 +1,210 @@
+"""Medição do tempo de cada etapa de uma execução.
+
+As etapas instrumentadas consultam `active` e só medem quando há um
+perfilador ativo, de forma que o custo com a medição desativada se
+resume a essa verificação. Etapas executadas uma vez por busca testam
+`active` diretamente; etapas mais longas usam `stage`.
+
+Etapas registradas:
+
+- `index.check`, `index.update`, `index.rebuild` e `index.snapshot`:
+  verificação de atualização, atualização incremental, reconstrução e
+  carga do retrato do índice;
+- `fuzzy.token_index` e `fuzzy.matrix`: carga ou construção da BK-tree de
+  tokens e da matriz TF-IDF da busca aproximada;
+- `tokenize`: tokenização de nomes, contando os textos tokenizados;
+- `sql` e `venues`: consultas SQL das estratégias de busca, contando as
+  linhas lidas, e construção dos resultados a partir dessas linhas;
+- `strategy.<estratégia>`: buscas de cada estratégia, contando as buscas
+  e, em `rows`, os resultados obtidos;
+- `bib.parse`, `bib.write`, `csv.read` e `csv.write`: leitura e escrita
+  dos arquivos de entrada e saída.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+import sys
+import threading
+import time
+from typing import Any, Iterator
+
+active: Profiler | None = None
+"""Perfilador ativo, ou None se a medição estiver desativada."""
+
+
+class StageStats:
+    """Contagens e histograma de latência de uma etapa.
+
+    O histograma tem escala logarítmica: o intervalo `i` contém as
+    medições de duração entre `2 ** (i - 1)` e `2 ** i` microssegundos,
+    e o intervalo 0, as medições abaixo de 1 µs.
+    """
+
+    __slots__ = ("calls", "count", "rows", "total", "min", "max", "buckets")
+
+    n_buckets = 40
+
+    def __init__(self):
+        self.calls = 0
+        self.count = 0
+        self.rows = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.buckets = [0] * self.n_buckets
+
+    def add(self, elapsed: float, count: int, rows: int):
+        self.calls += 1
+        self.count += count
+        self.rows += rows
+        self.total += elapsed
+        self.min = min(self.min, elapsed)
+        self.max = max(self.max, elapsed)
+        bucket = min(int(elapsed * 1e6).bit_length(), self.n_buckets - 1)
+        self.buckets[bucket] += 1
+
+    def percentile(self, q: float) -> float:
+        """Estima um percentil da duração das chamadas, em segundos, pelo
+        limite superior do intervalo do histograma que o contém."""
+        target = q * self.calls
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= target:
+                return min(2**i * 1e-6, self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "count": self.count,
+            "rows": self.rows,
+            "total_s": self.total,
+            "mean_us": self.total / self.calls * 1e6 if self.calls else 0.0,
+            "min_us": self.min * 1e6 if self.calls else 0.0,
+            "max_us": self.max * 1e6,
+            "p50_us": self.percentile(0.5) * 1e6,
+            "p99_us": self.percentile(0.99) * 1e6,
+            "histogram_us": {str(2**i): n for i, n in enumerate(self.buckets) if n},
+        }
+
+
+class Profiler:
+    """Acumula as medições das etapas de uma execução.
+
+    Para encaminhar as medições a outro destino, como um sistema de
+    métricas, basta uma subclasse que sobrescreva `record`, ativada
+    por `enable`.
+    """
+
+    def __init__(self):
+        self.stages: dict[str, StageStats] = {}
+        self.started = time.perf_counter()
+        self.__lock = threading.Lock()
+
+    def record(self, stage: str, elapsed: float, count: int = 1, rows: int = 0):
+        """Registra uma chamada de uma etapa.
+
+        Parâmetros
+        ----------
+        stage : str
+            Nome da etapa.
+        elapsed : float
+            Duração da chamada, em segundos.
+        count : int, opcional
+            Quantidade de itens processados na chamada, como buscas ou textos.
+        rows : int, opcional
+            Quantidade de linhas lidas ou resultados obtidos na chamada.
+        """
+        with self.__lock:
+            stats = self.stages.get(stage)
+            if stats is None:
+                stats = self.stages[stage] = StageStats()
+            stats.add(elapsed, count, rows)
+
+    @staticmethod
+    def peak_memory() -> int | None:
+        """Retorna o pico de memória residente do processo, em bytes,
+        ou None se não estiver disponível na plataforma."""
+        try:
+            # pylint: disable=import-outside-toplevel
+            import resource
+        except ImportError:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+    def to_dict(self) -> dict[str, Any]:
+        """Retorna as medições em um dicionário serializável em JSON."""
+        return {
+            "elapsed_s": time.perf_counter() - self.started,
+            "peak_memory_bytes": self.peak_memory(),
+            "stages": {name: stats.to_dict() for name, stats in sorted(self.stages.items())},
+        }
+
+    def summary(self) -> str:
+        """Retorna um resumo das medições em formato de tabela."""
+        lines = [
+            f"{'etapa':24s} {'chamadas':>9s} {'itens':>9s} {'linhas':>9s} "
+            f"{'total ms':>10s} {'média µs':>10s} {'p50 µs':>9s} {'p99 µs':>9s} {'máx µs':>10s}"
+        ]
+        for name, stats in sorted(self.stages.items(), key=lambda s: -s[1].total):
+            lines.append(
+                f"{name:24s} {stats.calls:9d} {stats.count:9d} {stats.rows:9d} "
+                f"{stats.total * 1e3:10.1f} {stats.total / stats.calls * 1e6:10.1f} "
+                f"{stats.percentile(0.5) * 1e6:9.0f} {stats.percentile(0.99) * 1e6:9.0f} "
+                f"{stats.max * 1e6:10.0f}"
+            )
+        lines.append(f"tempo total: {time.perf_counter() - self.started:.2f} s")
+        peak = self.peak_memory()
+        if peak is not None:
+            lines.append(f"pico de memória: {peak / 2**20:.1f} MiB")
+        return "\n".join(lines)
+
+
+def enable(profiler: Profiler | None = None) -> Profiler:
+    """Ativa a medição das etapas, retornando o perfilador ativo.
+
+    Parâmetros
+    ----------
+    profiler : Profiler, opcional
+        Perfilador que recebe as medições. Se omitido, um novo é criado.
+    """
+    global active  # pylint: disable=global-statement
+    active = profiler if profiler is not None else Profiler()
+    return active
+
+
+def disable() -> Profiler | None:
+    """Desativa a medição das etapas, retornando o perfilador que
+    estava ativo."""
+    global active  # pylint: disable=global-statement
+    profiler, active = active, None
+    return profiler
+
+
+@contextmanager
+def profile(profiler: Profiler | None = None) -> Iterator[Profiler]:
+    """Ativa a medição das etapas durante um bloco `with`, restaurando
+    o perfilador anterior ao final."""
+    global active  # pylint: disable=global-statement
+    previous = active
+    profiler = enable(profiler)
+    try:
+        yield profiler
+    finally:
+        active = previous
+
+
+@contextmanager
+def stage(name: str, count: int = 1) -> Iterator[None]:
+    """Mede a duração de um bloco `with` como uma chamada da etapa
+    informada, se houver um perfilador ativo."""
+    profiler = active
+    if profiler is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.record(name, time.perf_counter() - start, count)
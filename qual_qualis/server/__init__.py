@@ -0,0 +1,3 @@
+"""Servidor de consultas persistente e cliente correspondente."""
+from .client import Client, RemoteSearch
+from .server import QueryServer
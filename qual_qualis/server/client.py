@@ -0,0 +1,204 @@
+"""Cliente do servidor de consultas."""
+from __future__ import annotations
+import json
+from typing import Any
+from urllib.error import URLError
+from urllib.request import Request, urlopen
+
+from qual_qualis.index.model import VenueRecord, VenueType
+from qual_qualis.index.search import SearchStrategy, SearchStrategyKey
+from qual_qualis.server.protocol import (
+    DEFAULT_URL,
+    query_to_json,
+    venue_from_json,
+)
+
+
+class Client:
+    """Cliente do servidor de consultas.
+
+    Parâmetros
+    ----------
+    url : str, opcional
+        Endereço base do servidor.
+    timeout : float, opcional
+        Tempo máximo de espera por uma resposta, em segundos.
+    """
+
+    batch_size = 500
+    """Quantidade máxima de buscas enviadas em cada requisição de
+    `search_many`."""
+
+    def __init__(self, url: str = DEFAULT_URL, timeout: float = 10.0):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def is_available(self) -> bool:
+        """Retorna se o servidor está acessível."""
+        try:
+            with urlopen(f"{self.url}/health", timeout=min(self.timeout, 0.5)):
+                return True
+        except (URLError, OSError, ValueError):
+            return False
+
+    def search(
+        self,
+        name: str | None = None,
+        issn: str | None = None,
+        venue_type: VenueType | None = None,
+        n_results: int = 5,
+        strategies: list[SearchStrategyKey] | None = None,
+        areas: list[str] | None = None,
+        margin: float | None = None,
+        acronym: str | None = None,
+    ) -> list[VenueRecord]:
+        """Realiza uma busca no servidor.
+
+        Parâmetros
+        ----------
+        name : str, opcional
+            Nome da via de publicação.
+        issn : str, opcional
+            ISSN do periódico.
+        venue_type : VenueType, opcional
+            Tipo da via de publicação.
+        n_results : int, opcional
+            Quantidade de resultados.
+        strategies : list[SearchStrategyKey], opcional
+            Estratégias de busca a ser usadas, na ordem em que são aplicadas.
+            Se omitido, as estratégias padrão são usadas.
+        areas : list[str], opcional
+            Áreas de avaliação consultadas. Se omitido, apenas a área padrão.
+        margin : float, opcional
+            Se informada, as estratégias são aplicadas em cascata
+            (`CascadeSearch`), com essa margem.
+        acronym : str, opcional
+            Sigla da via de publicação. Veja `AcronymSearch`.
+
+        Retorna
+        -------
+        list[VenueRecord]
+            Resultados da busca.
+        """
+        query = dict(
+            name=name, issn=issn, acronym=acronym, venue_type=venue_type, n_results=n_results
+        )
+        body = {**query_to_json(query), **self._options(strategies, areas, margin)}
+        response = self._post("/search", body)
+        return [venue_from_json(obj) for obj in response["results"]]
+
+    def search_many(
+        self,
+        queries: list[dict[str, Any]],
+        strategies: list[SearchStrategyKey] | None = None,
+        areas: list[str] | None = None,
+        margin: float | None = None,
+    ) -> list[list[VenueRecord]]:
+        """Realiza várias buscas no servidor, com uma requisição para cada
+        `batch_size` buscas.
+
+        Parâmetros
+        ----------
+        queries : list[dict[str, Any]]
+            Argumentos de cada busca, como os de `search`.
+        strategies : list[SearchStrategyKey], opcional
+            Estratégias de busca. Veja `search`.
+        areas : list[str], opcional
+            Áreas de avaliação consultadas. Veja `search`.
+        margin : float, opcional
+            Margem da aplicação em cascata. Veja `search`.
+
+        Retorna
+        -------
+        list[list[VenueRecord]]
+            Resultados de cada busca, na mesma ordem.
+        """
+        options = self._options(strategies, areas, margin)
+        venues = []
+        for i in range(0, len(queries), self.batch_size):
+            body = {
+                "queries": [query_to_json(q) for q in queries[i : i + self.batch_size]],
+                **options,
+            }
+            response = self._post("/search_many", body)
+            venues += [[venue_from_json(obj) for obj in r] for r in response["results"]]
+        return venues
+
+    @staticmethod
+    def _options(
+        strategies: list[SearchStrategyKey] | None,
+        areas: list[str] | None,
+        margin: float | None,
+    ) -> dict[str, Any]:
+        """Campos de uma requisição comuns a todas as suas buscas."""
+        return {
+            "strategies": [k.value for k in strategies or []],
+            "areas": list(areas or []),
+            "margin": margin,
+        }
+
+    def _post(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
+        """Envia uma requisição POST com corpo JSON."""
+        request = Request(
+            f"{self.url}{path}",
+            data=json.dumps(body).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read())
+
+
+class RemoteSearch(SearchStrategy):
+    """Estratégia de busca que delega as buscas a um servidor. Todas as
+    estratégias são aplicadas pelo servidor em uma única requisição por
+    busca, ou por lote de buscas em `search_many`.
+
+    Parâmetros
+    ----------
+    client : Client
+        Cliente do servidor de consultas.
+    keys : list[SearchStrategyKey]
+        Estratégias a ser aplicadas pelo servidor, na ordem em que são
+        aplicadas.
+    areas : list[str], opcional
+        Áreas de avaliação consultadas. Se omitido, apenas a área padrão.
+    margin : float, opcional
+        Se informada, as estratégias são aplicadas em cascata
+        (`CascadeSearch`), com essa margem.
+    """
+
+    # pylint: disable=super-init-not-called
+    def __init__(
+        self,
+        client: Client,
+        keys: list[SearchStrategyKey],
+        areas: list[str] | None = None,
+        margin: float | None = None,
+    ):
+        self.index = None
+        self.client = client
+        self.keys = list(keys)
+        self.areas = list(areas or [])
+        self.margin = margin
+
+    def signature(self) -> str:
+        keys = ",".join(k.value for k in self.keys)
+        return f"{super().signature()}({','.join(self.areas)}:{keys}):{self.margin}"
+
+    # pylint: disable=arguments-differ
+    def search(
+        self,
+        name: str | None = None,
+        issn: str | None = None,
+        venue_type: VenueType | None = None,
+        n_results: int = 5,
+        acronym: str | None = None,
+        **_,
+    ) -> list[VenueRecord]:
+        return self.client.search(
+            name, issn, venue_type, n_results, self.keys, self.areas, self.margin, acronym
+        )
+
+    def search_many(self, queries: list[dict[str, Any]]) -> list[list[VenueRecord]]:
+        return self.client.search_many(queries, self.keys, self.areas, self.margin)
@@ -0,0 +1,69 @@
+"""Conversão das mensagens JSON trocadas entre cliente e servidor."""
+from typing import Any
+
+from qual_qualis.data.model import DataSource
+from qual_qualis.index.model import Qualis, VenueRecord, VenueType
+
+DEFAULT_URL = "http://127.0.0.1:8314"
+
+
+def venue_to_json(venue: VenueRecord) -> dict[str, Any]:
+    """Converte uma via de publicação para um objeto serializável em JSON."""
+    return {
+        "type": DataSource[venue.type.name].value,
+        "hash": venue.hash.hex(),
+        "name": venue.name,
+        "qualis": venue.qualis.value,
+        "extra": venue.extra,
+        "score": venue.score,
+        "area": venue.area,
+    }
+
+
+def venue_from_json(obj: dict[str, Any]) -> VenueRecord:
+    """Converte um objeto JSON em uma via de publicação."""
+    return VenueRecord(
+        type=venue_type_from_json(obj["type"]),
+        hash=bytes.fromhex(obj["hash"]),
+        name=obj["name"],
+        qualis=Qualis(obj["qualis"]),
+        extra=obj["extra"],
+        score=obj.get("score"),
+        area=obj.get("area"),
+    )
+
+
+def venue_type_to_json(venue_type: VenueType | None) -> str | None:
+    """Converte um tipo de via de publicação para seu nome na API."""
+    return DataSource[venue_type.name].value if venue_type is not None else None
+
+
+def venue_type_from_json(value: str | None) -> VenueType | None:
+    """Converte o nome de um tipo de via de publicação na API para
+    o seu código numérico."""
+    return VenueType[DataSource(value).name] if value is not None else None
+
+
+def query_to_json(query: dict[str, Any]) -> dict[str, Any]:
+    """Converte os argumentos de uma busca (veja `SearchStrategy.search`)
+    para um objeto serializável em JSON."""
+    fields = {
+        k: query.get(k) if isinstance(query.get(k), str) else None
+        for k in ("name", "issn", "acronym")
+    }
+    return {
+        **fields,
+        "venue_type": venue_type_to_json(query.get("venue_type")),
+        "n_results": int(query.get("n_results", 5)),
+    }
+
+
+def query_from_json(obj: dict[str, Any]) -> dict[str, Any]:
+    """Converte um objeto JSON nos argumentos de uma busca."""
+    return {
+        "name": obj.get("name"),
+        "issn": obj.get("issn"),
+        "acronym": obj.get("acronym"),
+        "venue_type": venue_type_from_json(obj.get("venue_type")),
+        "n_results": int(obj.get("n_results", 5)),
+    }
@@ -0,0 +1,149 @@
+"""Servidor HTTP que mantém o índice e as estratégias de busca em memória,
+evitando o custo de inicialização a cada consulta."""
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from typing import Any
+
+from qual_qualis import __version__
+from qual_qualis.data.service import DataService
+from qual_qualis.index.model import VenueRecord
+from qual_qualis.index.search import CascadeSearch, SearchStrategy, SearchStrategyKey
+from qual_qualis.index.shards import AreaSearch, IndexShards
+from qual_qualis.server.protocol import query_from_json, venue_to_json
+
+
+class QueryServer(ThreadingHTTPServer):
+    """Servidor de consultas ao índice.
+
+    Atende requisições `POST /search` com um objeto JSON contendo os campos
+    `name`, `issn`, `acronym`, `venue_type`, `n_results`, `strategies`,
+    `areas` e `margin`, todos opcionais, `POST /search_many` com as buscas
+    em `queries`, cada uma com os campos de uma busca individual, e os
+    campos `strategies`, `areas` e `margin` comuns a todas elas, e
+    `GET /health` para verificar a disponibilidade do servidor. As
+    estratégias são aplicadas em sequência como em
+    `SearchStrategy.apply_many` ou, se `margin` for informada, em cascata
+    (`CascadeSearch`). O índice de cada área de avaliação é aberto na
+    primeira requisição que a consulta.
+
+    Parâmetros
+    ----------
+    address : tuple[str, int]
+        Endereço e porta de escuta.
+    shards : IndexShards
+        Índices das áreas de avaliação.
+    keys : list[SearchStrategyKey]
+        Estratégias de busca disponíveis.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        shards: IndexShards,
+        keys: list[SearchStrategyKey],
+    ):
+        super().__init__(address, QueryRequestHandler)
+        self.shards = shards
+        self.keys = keys
+
+    def strategies(self, request: dict[str, Any]) -> list[SearchStrategy]:
+        """Seleciona as estratégias de busca de uma requisição, a partir
+        dos campos `strategies`, `areas` e `margin`.
+
+        Parâmetros
+        ----------
+        request : dict[str, Any]
+            Parâmetros da requisição.
+
+        Retorna
+        -------
+        list[SearchStrategy]
+            Estratégias de busca, na ordem em que são aplicadas.
+        """
+        keys = [SearchStrategyKey(k) for k in request.get("strategies") or []]
+        keys = keys or [k for k in SearchStrategyKey.defaults() if k in self.keys]
+        unavailable = [k.value for k in keys if k not in self.keys]
+        if unavailable:
+            raise ValueError(f"Estratégias indisponíveis: {', '.join(unavailable)}")
+        areas = list(dict.fromkeys(request.get("areas") or [DataService.default_area]))
+        margin = request.get("margin")
+        margin = float(margin) if margin is not None else None
+        if len(areas) > 1:
+            return [AreaSearch(self.shards, areas, keys, margin)]
+        strategies = self.shards.strategies(areas[0], keys)
+        return [CascadeSearch(strategies, margin)] if margin is not None else strategies
+
+    def search(self, request: dict[str, Any]) -> list[VenueRecord]:
+        """Realiza uma busca a partir dos parâmetros de uma requisição.
+
+        Parâmetros
+        ----------
+        request : dict[str, Any]
+            Parâmetros da busca.
+
+        Retorna
+        -------
+        list[VenueRecord]
+            Resultados da busca.
+        """
+        return SearchStrategy.apply_many(self.strategies(request), **query_from_json(request))
+
+    def search_many(self, request: dict[str, Any]) -> list[list[VenueRecord]]:
+        """Realiza as buscas de uma requisição em lote, por
+        `SearchStrategy.apply_batch`.
+
+        Parâmetros
+        ----------
+        request : dict[str, Any]
+            Parâmetros das buscas, com a lista `queries`.
+
+        Retorna
+        -------
+        list[list[VenueRecord]]
+            Resultados de cada busca, na mesma ordem.
+        """
+        queries = [query_from_json(q) for q in request.get("queries") or []]
+        return SearchStrategy.apply_batch(self.strategies(request), queries)
+
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+    """Trata as requisições recebidas pelo servidor de consultas."""
+
+    server: QueryServer
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        if self.path != "/health":
+            return self._reply(HTTPStatus.NOT_FOUND, {"error": "Rota inexistente."})
+        self._reply(HTTPStatus.OK, {"version": __version__})
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        if self.path not in ("/search", "/search_many"):
+            return self._reply(HTTPStatus.NOT_FOUND, {"error": "Rota inexistente."})
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if self.path == "/search":
+                results = [venue_to_json(v) for v in self.server.search(request)]
+            else:
+                results = [
+                    [venue_to_json(v) for v in venues]
+                    for venues in self.server.search_many(request)
+                ]
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            return self._reply(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+        self._reply(HTTPStatus.OK, {"results": results})
+
+    def _reply(self, status: HTTPStatus, body: dict[str, Any]):
+        """Envia uma resposta em JSON."""
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
@@ -0,0 +1,92 @@
+"""Equivalência da poda MaxScore de `TfIdfMatrix` com a pontuação exaustiva."""
+import random
+
+import pytest
+
+from qual_qualis.data.model import DataSource
+from qual_qualis.data.service import DataService
+from qual_qualis.index.index import Index
+from qual_qualis.index.model import VenueType
+from qual_qualis.index.search import FuzzySearch, SearchBackend
+from qual_qualis.index.tfidf import TfIdfMatrix
+
+
+def add_typos(text: str, rng: random.Random) -> str:
+    """Troca uma letra do texto por outra aleatória."""
+    i = rng.randrange(len(text))
+    return text[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + text[i + 1 :]
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory: pytest.TempPathFactory) -> Index:
+    return Index(DataService(), str(tmp_path_factory.mktemp("index")))
+
+
+@pytest.fixture(scope="module")
+def matrix(index: Index) -> TfIdfMatrix:
+    return TfIdfMatrix(index)
+
+
+@pytest.fixture(scope="module")
+def queries(index: Index) -> list[dict[str, float]]:
+    """Tokens ponderados de nomes embutidos, com e sem erros de digitação,
+    e de combinações de termos frequentes, em que a poda descarta vias."""
+    rng = random.Random(0)
+    service = DataService()
+    names = [n for src in DataSource for n in service.get(src)["name"].tolist()]
+    fuzzy = FuzzySearch(index, SearchBackend.MEMORY)
+    sample = rng.sample(names, 300)
+    texts = sample + [add_typos(n, rng) for n in sample[:100]] + [
+        "International Conference on Software Engineering",
+        "Journal of Computer Science and Technology",
+        "Simpósio Brasileiro de Banco de Dados",
+        "IEEE Transactions on Pattern Analysis and Machine Intelligence",
+        "ACM Symposium on Theory of Computing",
+        "Revista Brasileira de Informática na Educação",
+    ]
+    return [fuzzy.expand(index.tokenize(t)) for t in texts]
+
+
+@pytest.mark.parametrize("k", [1, 5, 20])
+@pytest.mark.parametrize("venue_type", [None, VenueType.CONFERENCES, VenueType.JOURNALS])
+def test_top_k_pruned_matches_exhaustive(
+    monkeypatch: pytest.MonkeyPatch,
+    matrix: TfIdfMatrix,
+    queries: list[dict[str, float]],
+    k: int,
+    venue_type: VenueType | None,
+):
+    monkeypatch.setattr(TfIdfMatrix, "prune_min_postings", 0)
+    for tokens in queries:
+        assert matrix.top_k(tokens, k, venue_type) == matrix.top_k(
+            tokens, k, venue_type, prune=False
+        )
+
+
+def test_top_k_many_pruned_matches_exhaustive(
+    monkeypatch: pytest.MonkeyPatch, matrix: TfIdfMatrix, queries: list[dict[str, float]]
+):
+    monkeypatch.setattr(TfIdfMatrix, "prune_min_postings", 0)
+    batch = [
+        (tokens, k, venue_type)
+        for tokens, (k, venue_type) in zip(
+            queries, [(1, None), (5, VenueType.JOURNALS), (10, VenueType.CONFERENCES)] * len(queries)
+        )
+    ]
+    assert matrix.top_k_many(batch) == matrix.top_k_many(batch, prune=False)
+
+
+def test_pruning_skips_venues(matrix: TfIdfMatrix, queries: list[dict[str, float]]):
+    """A poda descarta vias em parte das buscas, de forma que os testes
+    acima exercitam o caminho podado e não apenas seus retornos à
+    pontuação exaustiva."""
+    # pylint: disable=protected-access
+    pruned = 0
+    for tokens in queries:
+        ids = matrix._TfIdfMatrix__ids(tokens)
+        if len(ids) < 2:
+            continue
+        docs, _ = matrix._TfIdfMatrix__max_score(ids, 5, None)
+        candidates, _ = matrix._TfIdfMatrix__exhaustive(ids, None)
+        pruned += len(docs) < len(candidates)
+    assert pruned >= 10
@@ -0,0 +1,95 @@
+"""Equivalência do tokenizador por tabela de tradução com a implementação
+original, baseada em `unicodedata.normalize` e `re.sub` por token."""
+import random
+import re
+import unicodedata
+
+import pytest
+
+from qual_qualis.data.model import DataSource
+from qual_qualis.data.service import DataService
+from qual_qualis.index import index as index_module
+from qual_qualis.index.index import Index
+
+
+def reference_tokenize(text: str) -> list[str]:
+    """Implementação original de `Index.tokenize`."""
+    tokens = re.findall(r"[\w'’]+", text, re.UNICODE | re.MULTILINE | re.DOTALL)
+    tokens = (unicodedata.normalize("NFKD", token.lower()) for token in tokens)
+    tokens = (re.sub(r"[^a-z0-9]", "", token) for token in tokens)
+    return list(tokens)
+
+
+EDGE_CASES = [
+    "",
+    " ",
+    "\n\t",
+    "...",
+    "-- / -- ;",
+    "'",
+    "’’",
+    "!?@#$%&*()[]{}",
+    "Simpósio Brasileiro de Engenharia de Software",
+    "Conférence Internationale sur l'Ingénierie",
+    "Revista Eletrônica de Computação Gráfica",
+    "Çağ Üniversitesi Ãœ",
+    "São Paulo, ÀÉÎÕÜ àéîõü ñÑ çÇ",
+    "ﬁnite ﬂow ﬀ ﬃ ﬄ ﬅ ﬆ",
+    "Æsthetics Œuvre ß Ø ø Ł ł Đ đ Þ",
+    "ICSE'23 ICSE’23 O'Reilly",
+    "x² H₂O ½ ① Ⅻ ™ №",
+    "ＡＣＭ　ＳＩＧＭＯＤ １２３",
+    "Ἀθῆναι Москва 北京",
+    "٣ ४ ๕ digits",
+    "snake_case __init__ _",
+    "áè combining",
+    " non-breaking space​",
+]
+
+
+def random_texts(k: int, seed: int) -> list[str]:
+    """Gera textos com letras acentuadas, ligaduras, dígitos de outros
+    sistemas, símbolos e pontuação."""
+    rng = random.Random(seed)
+    ranges = [(0x20, 0x7E), (0xA0, 0x24F), (0x370, 0x3FF), (0x400, 0x4FF),
+              (0x1E00, 0x1EFF), (0x2000, 0x218F), (0x2460, 0x24FF), (0xFB00, 0xFB06),
+              (0xFF01, 0xFF5E), (0x4E00, 0x4E40)]
+    return [
+        "".join(chr(rng.randint(*rng.choice(ranges))) for _ in range(rng.randint(0, 40)))
+        for _ in range(k)
+    ]
+
+
+@pytest.fixture
+def index() -> Index:
+    """Índice sem banco de dados, suficiente para a tokenização."""
+    index_module._tokenize.cache_clear()  # pylint: disable=protected-access
+    return Index.__new__(Index)
+
+
+@pytest.fixture(scope="module")
+def names() -> list[str]:
+    service = DataService()
+    return [n for src in DataSource for n in service.get(src)["name"].tolist()]
+
+
+@pytest.mark.parametrize("text", EDGE_CASES)
+def test_edge_cases(index: Index, text: str):
+    assert index.tokenize(text) == reference_tokenize(text)
+
+
+def test_bundled_names(index: Index, names: list[str]):
+    assert names
+    mismatches = [n for n in names if index.tokenize(n) != reference_tokenize(n)]
+    assert not mismatches
+
+
+def test_random_texts(index: Index):
+    texts = random_texts(5000, seed=0)
+    assert [index.tokenize(t) for t in texts] == [reference_tokenize(t) for t in texts]
+
+
+def test_tokenize_many_and_cache(index: Index, names: list[str]):
+    expected = [reference_tokenize(n) for n in names]
+    assert index.tokenize_many(names) == expected
+    assert index.tokenize_many(names) == expected